@@ -2,11 +2,15 @@
 """Main entry point for AI Voice text-to-speech application."""
 
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
+# Imported first: it records the process start for --profile
+from src import profiling
 from src.config import settings
 from src.factory import ProviderFactory
+from src.ssml import parse_rate
 
 
 def read_input_file(file_path: Optional[Path] = None) -> str:
@@ -38,6 +42,38 @@ def read_input_file(file_path: Optional[Path] = None) -> str:
     return text
 
 
+def parse_list(value: str) -> list[str]:
+    """Parse a comma-separated CLI value into a list.
+    
+    Args:
+        value: Comma-separated string
+        
+    Returns:
+        List of non-empty, stripped items
+    """
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def resolve_seek_index(seek_index: Optional[bool], audio_format: str) -> bool:
+    """Decide whether to write a seek index, warning once if the format has none.
+    
+    Args:
+        seek_index: Value of ``--seek-index`` (None: from .env)
+        audio_format: Audio format of the file being written
+        
+    Returns:
+        True if a ``.seek`` sidecar should be written
+    """
+    from src.seek_index import supports_seek_index
+    
+    if seek_index is None:
+        seek_index = settings.seek_index
+    if seek_index and not supports_seek_index(audio_format):
+        print(f"Warning: Seek index not supported for {audio_format} audio; skipping the sidecar")
+        return False
+    return bool(seek_index)
+
+
 def synthesize_from_file(
     input_file: Optional[str] = None,
     provider: Optional[str] = None,
@@ -45,6 +81,12 @@ def synthesize_from_file(
     voice: Optional[str] = None,
     output: Optional[str] = None,
     speed: float = 1.0,
+    progressive: bool = False,
+    hls_dir: Optional[str] = None,
+    segment_duration: float = 6.0,
+    seek_index: Optional[bool] = None,
+    word_timings: bool = False,
+    auto_language: bool = False,
     **kwargs
 ) -> Path:
     """Synthesize text to speech from input file.
@@ -56,19 +98,31 @@ def synthesize_from_file(
         voice: Voice to use (default: from provider config)
         output: Output file path (default: auto-generated)
         speed: Speech speed (0.25 to 4.0 for azure-openai, rate for azure-speech)
+        progressive: Stream short-first, geometrically growing segments and
+            report time-to-first-audio
+        hls_dir: Write HLS segments and a live playlist to this directory
+            instead of a single file
+        segment_duration: Maximum HLS segment duration in seconds
+        seek_index: Write a ``.seek`` sidecar next to the audio (default: from .env)
+        word_timings: Write word timing sidecars (``.words.json`` and ``.vtt``,
+            azure-speech only)
+        auto_language: Detect the language of every sentence and speak it with
+            the voice configured for that language (azure-speech only)
         **kwargs: Additional provider-specific parameters
         
     Returns:
-        Path to generated audio file
+        Path to generated audio file (the playlist for HLS output)
     """
     # Read text from file
     file_path = Path(input_file) if input_file else None
-    text = read_input_file(file_path)
+    with profiling.span("read input"):
+        text = read_input_file(file_path)
     
     print(f"Read {len(text)} characters from input file")
     
     # Create TTS provider
-    tts_provider = ProviderFactory.create(provider, deployment)
+    with profiling.span("create provider"):
+        tts_provider = ProviderFactory.create(provider, deployment)
     
     print(f"Using provider: {tts_provider.provider_name}")
     
@@ -84,18 +138,553 @@ def synthesize_from_file(
     # Add provider-specific kwargs
     synth_kwargs.update(kwargs)
     
-    result_path = tts_provider.synthesize(
-        text=text,
-        output_path=output_path,
-        voice=voice,
-        **synth_kwargs
-    )
+    audio_format = synth_kwargs.get("response_format", getattr(tts_provider, "output_format", "mp3"))
+    seek_index = resolve_seek_index(seek_index, audio_format)
+    
+    timeline = None
+    if word_timings and not hls_dir:
+        from src.timings import WordTimeline
+        timeline = synth_kwargs["timeline"] = WordTimeline()
+    
+    if auto_language and (hls_dir or progressive):
+        raise ValueError("--auto-language cannot be combined with --progressive or --hls")
+    
+    with profiling.span("synthesize"):
+        if auto_language:
+            result_path = synthesize_auto_language(
+                tts_provider, text, output_path, voice, seek_index=seek_index, **synth_kwargs
+            )
+        elif hls_dir:
+            result_path = synthesize_hls(
+                tts_provider, text, Path(hls_dir), voice, segment_duration, **synth_kwargs
+            )
+        elif progressive:
+            result_path = synthesize_progressive(
+                tts_provider, text, output_path, voice, seek_index=seek_index, **synth_kwargs
+            )
+        else:
+            result_path = tts_provider.synthesize(
+                text=text,
+                output_path=output_path,
+                voice=voice,
+                seek_index=seek_index,
+                **synth_kwargs
+            )
     
     print(f"✓ Audio saved to: {result_path}")
     
+    if timeline is not None:
+        if len(timeline):
+            with profiling.span("write word timings"):
+                sidecars = timeline.write(result_path)
+            for sidecar in sidecars:
+                print(f"✓ Word timings saved to: {sidecar}")
+        else:
+            print(f"Warning: {tts_provider.provider_name} reported no word timings")
+    
     return result_path
 
 
+def synthesize_progressive(
+    tts_provider,
+    text: str,
+    output_path: Optional[Path] = None,
+    voice: Optional[str] = None,
+    seek_index: bool = False,
+    **kwargs
+) -> Path:
+    """Synthesize with the progressive scheduler, writing segments as they arrive.
+    
+    Args:
+        tts_provider: Provider instance to synthesize with
+        text: Text or SSML to synthesize
+        output_path: Output file path (default: auto-generated)
+        voice: Voice to use (default: from provider config)
+        seek_index: Write a ``.seek`` sidecar with segment boundaries
+        **kwargs: Additional provider-specific parameters
+        
+    Returns:
+        Path to generated audio file
+    """
+    from datetime import datetime
+    from src.audio import concat_audio
+    from src.progressive import ProgressiveSynthesizer
+    from src.seek_index import SeekIndexBuilder, supports_seek_index
+    
+    synthesizer = ProgressiveSynthesizer(tts_provider)
+    output_format = synthesizer.output_format
+    output_dir = Path(settings.output_dir)
+    index_builder = SeekIndexBuilder(output_format) if seek_index and supports_seek_index(output_format) else None
+    
+    if output_path is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = output_dir / f"progressive_{timestamp}.{output_format}"
+    elif not output_path.is_absolute():
+        output_path = output_dir / output_path
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # WAV segments each carry a RIFF header and are merged at the end;
+    # frame-based formats are appended as soon as each segment lands
+    wav_parts = []
+    with open(output_path, "wb") as audio_file:
+        for segment in synthesizer.stream(text, voice=voice, **kwargs):
+            if segment.index == 0:
+                print(f"  First audio after {synthesizer.stats.time_to_first_audio:.2f}s")
+            if index_builder:
+                index_builder.add_part(segment.audio)
+            if output_format == "wav":
+                wav_parts.append(segment.audio)
+            else:
+                with profiling.span("write audio"):
+                    audio_file.write(segment.audio)
+                    audio_file.flush()
+        
+        if wav_parts:
+            with profiling.span("write audio"):
+                audio_file.write(concat_audio(wav_parts, "wav"))
+    
+    if index_builder:
+        index_builder.write(output_path)
+    
+    stats = synthesizer.stats
+    print(f"  Time to first audio: {stats.time_to_first_audio:.2f}s "
+          f"({stats.segments} segments, total {stats.total_time:.2f}s)")
+    
+    return output_path
+
+
+def synthesize_auto_language(
+    tts_provider,
+    text: str,
+    output_path: Optional[Path] = None,
+    voice: Optional[str] = None,
+    seek_index: bool = False,
+    **kwargs
+) -> Path:
+    """Speak every sentence with the voice of its detected language.
+    
+    Args:
+        tts_provider: Provider instance to synthesize with (azure-speech)
+        text: Plain text to synthesize
+        output_path: Output file path (default: auto-generated)
+        voice: Voice for the language of its locale (default language if it has none)
+        seek_index: Write a ``.seek`` sidecar with segment boundaries
+        **kwargs: Additional provider-specific parameters
+        
+    Returns:
+        Path to generated audio file
+    """
+    from src.language import LanguageRouter
+    
+    if not hasattr(tts_provider, "language"):
+        raise ValueError(
+            f"--auto-language needs per-language voices; "
+            f"{tts_provider.provider_name} is not supported (use --provider azure-speech)"
+        )
+    
+    router = LanguageRouter(tts_provider, settings.get_language_voices())
+    
+    with profiling.span("detect languages"):
+        segments = router.plan(text, voice)
+    for segment in segments:
+        print(f"  [{segment.locale}] {segment.voice}: "
+              f"{segment.text[:40]}{'...' if len(segment.text) > 40 else ''}")
+    
+    return router.synthesize(text, output_path, voice, seek_index=seek_index, segments=segments, **kwargs)
+
+
+def synthesize_hls(
+    tts_provider,
+    text: str,
+    hls_dir: Path,
+    voice: Optional[str] = None,
+    segment_duration: float = 6.0,
+    **kwargs
+) -> Path:
+    """Synthesize into HLS segments, publishing each one while synthesis continues.
+    
+    Args:
+        tts_provider: Provider instance to synthesize with
+        text: Text or SSML to synthesize
+        hls_dir: Directory for the segments and playlist (relative to output dir)
+        voice: Voice to use (default: from provider config)
+        segment_duration: Maximum segment duration in seconds
+        **kwargs: Additional provider-specific parameters
+        
+    Returns:
+        Path to the finalized playlist
+    """
+    from src.hls import HLSSegmentWriter
+    from src.progressive import ProgressiveSynthesizer
+    
+    if not hls_dir.is_absolute():
+        hls_dir = Path(settings.output_dir) / hls_dir
+    
+    synthesizer = ProgressiveSynthesizer(tts_provider)
+    
+    with HLSSegmentWriter(hls_dir, synthesizer.output_format, segment_duration) as writer:
+        print(f"  Live playlist: {writer.playlist_path}")
+        for segment in synthesizer.stream(text, voice=voice, **kwargs):
+            with profiling.span("write HLS segments"):
+                writer.write_part(segment.audio)
+            if segment.index == 0:
+                print(f"  First audio after {synthesizer.stats.time_to_first_audio:.2f}s")
+    
+    print(f"  {len(writer.segments)} segments, {writer.duration:.1f}s of audio "
+          f"(total {synthesizer.stats.total_time:.2f}s)")
+    
+    return writer.playlist_path
+
+
+def read_stdin_fragments():
+    """Yield text from stdin as soon as it arrives, without waiting for EOF.
+    
+    Returns:
+        Iterator of text fragments
+    """
+    import codecs
+    import os
+    
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    fd = sys.stdin.fileno()
+    while True:
+        data = os.read(fd, 4096)
+        if not data:
+            break
+        fragment = decoder.decode(data)
+        if fragment:
+            yield fragment
+    
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def synthesize_stream(
+    provider: Optional[str] = None,
+    deployment: Optional[str] = None,
+    voice: Optional[str] = None,
+    output: Optional[str] = None,
+    seek_index: Optional[bool] = None,
+    **kwargs
+) -> Path:
+    """Speak text piped on stdin while it is still being written.
+    
+    Args:
+        provider: TTS provider name (default: from .env)
+        deployment: Azure OpenAI deployment name (optional)
+        voice: Voice to use (default: from provider config)
+        output: Output file path (default: auto-generated)
+        seek_index: Write a ``.seek`` sidecar next to the audio (default: from .env)
+        **kwargs: Additional provider-specific parameters
+    
+    Returns:
+        Path to generated audio file
+    """
+    from datetime import datetime
+    from src.audio import concat_audio
+    from src.incremental import IncrementalSynthesizer
+    from src.seek_index import SeekIndexBuilder
+    
+    tts_provider = ProviderFactory.create(provider, deployment)
+    if "azure-openai" not in tts_provider.provider_name.lower():
+        kwargs.pop("speed", None)
+    synthesizer = IncrementalSynthesizer(tts_provider)
+    output_format = synthesizer.output_format
+    output_dir = Path(settings.output_dir)
+    
+    index_builder = SeekIndexBuilder(output_format) if resolve_seek_index(seek_index, output_format) else None
+    
+    if output is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = output_dir / f"stream_{timestamp}.{output_format}"
+    else:
+        output_path = Path(output)
+        if not output_path.is_absolute():
+            output_path = output_dir / output_path
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    print(f"Speaking stdin with {tts_provider.provider_name}...", file=sys.stderr)
+    
+    # Pipelined WAV units each carry a RIFF header and are merged at the end
+    wav_parts = []
+    first = True
+    with open(output_path, "wb") as audio_file:
+        for chunk in synthesizer.stream(read_stdin_fragments(), voice=voice, **kwargs):
+            if first:
+                print(f"  First audio after {synthesizer.stats.time_to_first_audio:.2f}s", file=sys.stderr)
+                first = False
+            if index_builder:
+                # Pipelined chunks are complete files; text stream chunks are one stream
+                if synthesizer.stats.text_stream:
+                    index_builder.feed(chunk)
+                else:
+                    index_builder.add_part(chunk)
+            if output_format == "wav" and not synthesizer.stats.text_stream:
+                wav_parts.append(chunk)
+            else:
+                audio_file.write(chunk)
+                audio_file.flush()
+        
+        if wav_parts:
+            audio_file.write(concat_audio(wav_parts, "wav"))
+    
+    if index_builder:
+        index_builder.write(output_path)
+    
+    stats = synthesizer.stats
+    mode = f"text stream, {stats.units} units" if stats.text_stream else f"{stats.units} units"
+    print(f"✓ Audio saved to: {output_path} ({mode}, total {stats.total_time:.2f}s)", file=sys.stderr)
+    
+    return output_path
+
+
+def synthesize_matrix(
+    input_file: Optional[str] = None,
+    providers: Optional[list[str]] = None,
+    deployments: Optional[list[str]] = None,
+    voices: Optional[list[str]] = None,
+    styles: Optional[list[str]] = None,
+    output_dir: Optional[str] = None,
+    concurrency: int = 4,
+    speed: float = 1.0,
+    **kwargs
+) -> Path:
+    """Render the same input across a matrix of providers, deployments, voices and styles.
+    
+    Args:
+        input_file: Path to input text file (default: input/text.txt)
+        providers: Providers to include (default: from .env)
+        deployments: Azure OpenAI deployments to include (default: from .env)
+        voices: Voices to include ("all" expands to every Azure OpenAI voice)
+        styles: Speaking styles to include (azure-speech only)
+        output_dir: Matrix output directory (default: auto-generated)
+        concurrency: Maximum number of cells synthesized at once
+        speed: Speech speed for azure-openai cells
+        **kwargs: Additional azure-speech parameters (rate, pitch)
+        
+    Returns:
+        Path to the comparison report
+    """
+    from src.matrix import MatrixRunner, MatrixSpec
+    
+    # Read and preprocess the input once for all cells
+    file_path = Path(input_file) if input_file else None
+    text = read_input_file(file_path)
+    
+    print(f"Read {len(text)} characters from input file")
+    
+    spec = MatrixSpec(
+        providers=providers or [settings.default_provider],
+        deployments=deployments or [],
+        voices=voices or [],
+        styles=styles or [],
+    )
+    cells = spec.cells()
+    
+    runner = MatrixRunner(
+        text,
+        output_dir=Path(output_dir) if output_dir else None,
+        concurrency=concurrency,
+        speed=speed,
+        **kwargs
+    )
+    
+    print(f"Synthesizing {len(cells)} cells with concurrency {concurrency}...")
+    results = runner.run(cells)
+    
+    # Comparison table
+    print(f"\n{'Cell':<50} {'Latency':>9} {'Size':>10} {'Duration':>9}")
+    print("-" * 81)
+    for result in results:
+        if result.error:
+            print(f"{result.cell.label:<50} {'error':>9}  {result.error}")
+            continue
+        duration = f"{result.duration:.2f}s" if result.duration is not None else "n/a"
+        print(f"{result.cell.label:<50} {result.latency:>8.2f}s {result.size_bytes:>10} {duration:>9}")
+    
+    report_path = runner.output_dir / "report.json"
+    print(f"\n✓ Matrix written to: {runner.output_dir}")
+    print(f"✓ Report saved to: {report_path}")
+    
+    return report_path
+
+
+def synthesize_batch(
+    input_files: Optional[list[str]] = None,
+    provider: Optional[str] = None,
+    deployment: Optional[str] = None,
+    voice: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    priority: str = "bulk",
+    tenant: str = "default",
+    concurrency: int = 4,
+    **kwargs
+) -> list[Path]:
+    """Synthesize several input files through the priority scheduler.
+    
+    Plain text files are cut into chunks at the provider's request size limit
+    and submitted as chunked jobs, so a failed chunk cancels the rest of its
+    file. SSML files are submitted whole.
+    
+    Args:
+        input_files: Input files to synthesize (default: input/text.txt)
+        provider: Provider name (default: from .env)
+        deployment: Azure OpenAI deployment (only for azure-openai provider)
+        voice: Voice to use (default: from provider config)
+        output_dir: Output directory (default: auto-generated)
+        priority: Priority class of the jobs (interactive, standard, bulk)
+        tenant: Tenant the jobs are accounted to
+        concurrency: Number of concurrent synthesis calls
+        **kwargs: Additional provider-specific parameters
+        
+    Returns:
+        Paths of the files that were synthesized
+    """
+    from datetime import datetime
+    from src.planner import MAX_CHUNK_CHARS
+    from src.scheduler import SynthesisScheduler
+    from src.ssml import is_ssml
+    from src.text import chunk_spans
+    
+    provider = (provider or settings.default_provider).lower()
+    max_chunk_chars = MAX_CHUNK_CHARS.get(provider, 4096)
+    
+    if output_dir is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        batch_dir = Path(settings.output_dir) / f"batch_{timestamp}"
+    else:
+        batch_dir = Path(output_dir)
+    batch_dir = batch_dir.resolve()
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    
+    paths = [Path(f) for f in input_files] if input_files else [Path("input/text.txt")]
+    
+    # One class only, so no slots are held back for higher classes
+    with SynthesisScheduler(max_concurrency=concurrency, reserved={}) as scheduler:
+        jobs = []
+        for path in paths:
+            text = read_input_file(path)
+            output_path = batch_dir / f"{path.stem}.{settings.output_format}"
+            if is_ssml(text):
+                job = scheduler.submit(
+                    text, priority, tenant, provider, deployment, output_path, voice, **kwargs
+                )
+            else:
+                spans = chunk_spans(text, max_chunk_chars)
+                job = scheduler.submit_chunked(
+                    [text[start:end] for start, end in spans], output_path, priority, tenant,
+                    provider, deployment, voice, offsets=[start for start, _ in spans], **kwargs
+                )
+            jobs.append((path, job))
+        
+        print(f"Submitted {len(jobs)} files ({priority}, tenant {tenant}, concurrency {concurrency})...")
+        
+        written = []
+        for path, job in jobs:
+            try:
+                written.append(job.result())
+                print(f"  ✓ {path} -> {written[-1]}")
+            except Exception as e:
+                print(f"  ✗ {path}: {e}")
+        
+        metrics = scheduler.metrics()[priority]
+    
+    print(f"\n✓ {len(written)}/{len(jobs)} files written to: {batch_dir}")
+    print(f"  Queue wait: mean {metrics['mean_wait_s']:.2f}s, max {metrics['max_wait_s']:.2f}s")
+    
+    return written
+
+
+def build_bundle(
+    catalog_file: str,
+    output: Optional[str] = None,
+    concurrency: int = 4,
+    compact: bool = False
+) -> Path:
+    """Render a prompt catalog into a packed bundle.
+    
+    Args:
+        catalog_file: Path to the prompt catalog JSON file
+        output: Bundle archive path (default: output/<catalog name>.bundle)
+        concurrency: Number of prompts rendered at once
+        compact: Rewrite the archive without stale clips
+        
+    Returns:
+        Path to the bundle archive
+    """
+    from src.bundle import BundleBuilder, index_path_for, load_catalog
+    
+    catalog_path = Path(catalog_file)
+    catalog = load_catalog(catalog_path)
+    
+    print(f"Loaded {len(catalog)} prompts from {catalog_path}")
+    
+    bundle_path = Path(output) if output else Path(settings.output_dir) / f"{catalog_path.stem}.bundle"
+    counts = BundleBuilder(bundle_path, concurrency=concurrency).build(catalog, compact=compact)
+    
+    print(f"Rendered {counts['rendered']}, reused {counts['reused']}, removed {counts['removed']} prompts")
+    print(f"✓ Bundle saved to: {bundle_path}")
+    print(f"✓ Index saved to: {index_path_for(bundle_path)}")
+    
+    return bundle_path
+
+
+def plan_synthesis(
+    input_files: Optional[list[str]] = None,
+    provider: Optional[str] = None,
+    rate: float = 1.0,
+    concurrency: int = 4,
+    quota_rpm: Optional[int] = None,
+    as_json: bool = False
+) -> dict:
+    """Estimate cost, audio duration and schedule of a run without synthesizing.
+    
+    Args:
+        input_files: Input files to plan (default: input/text.txt)
+        provider: Provider to plan for (default: from .env)
+        rate: Speaking rate (azure-speech rate or azure-openai speed)
+        concurrency: Number of concurrent requests
+        quota_rpm: Requests-per-minute quota (default: unlimited)
+        as_json: Print the plan as JSON for schedulers
+        
+    Returns:
+        Plan as a dictionary
+    """
+    import json
+    from src.planner import format_duration, plan_run
+    
+    provider = (provider or settings.default_provider).lower()
+    paths = [Path(f) for f in input_files] if input_files else [None]
+    inputs = []
+    for path in paths:
+        text = read_input_file(path)
+        inputs.append((str(path or "input/text.txt"), text))
+    
+    plan = plan_run(inputs, provider, rate=rate, concurrency=concurrency, quota_rpm=quota_rpm)
+    
+    if as_json:
+        print(json.dumps(plan.to_dict(), indent=2))
+        return plan.to_dict()
+    
+    print(f"Plan for {provider} (concurrency {concurrency}"
+          f"{f', quota {quota_rpm} rpm' if quota_rpm else ''}):")
+    for item in plan.inputs:
+        kind = "SSML" if item.ssml else "text"
+        print(f"  - {item.name} ({kind})")
+        print(f"    Billable characters: {item.billable_chars}")
+        print(f"    Estimated audio:     {format_duration(item.audio_seconds)}"
+              f"{f' (incl. {item.break_seconds:.1f}s breaks)' if item.break_seconds else ''}")
+        print(f"    Chunks:              {len(item.chunks)} ({', '.join(map(str, item.chunks))} chars)")
+    
+    print(f"\nTotal billable characters: {plan.billable_chars}")
+    print(f"Total estimated audio:     {format_duration(plan.audio_seconds)}")
+    print(f"Requests:                  {plan.requests}")
+    print(f"Estimated wall-clock time: {format_duration(plan.wall_seconds)}")
+    
+    return plan.to_dict()
+
+
 def list_providers() -> None:
     """List all available TTS providers."""
     providers = ProviderFactory.get_available_providers()
@@ -215,6 +804,82 @@ def show_voice_info(voice_name: str, provider: Optional[str] = None, deployment:
     print()
 
 
+def refresh_voice_catalog() -> None:
+    """Fetch all Azure AI Speech voices and cache their capabilities locally."""
+    from src.voice_catalog import VoiceCatalog
+    
+    tts_provider = ProviderFactory.create("azure-speech")
+    catalog = VoiceCatalog.from_voice_info(tts_provider.list_voice_info())
+    catalog_path = Path(settings.azure_speech_voice_catalog)
+    catalog.save(catalog_path)
+    
+    print(f"✓ Cached {len(catalog)} voices to: {catalog_path}")
+
+
+def validate_inputs(input_files: list[str], voice: Optional[str] = None) -> None:
+    """Validate input files offline against the cached voice catalog.
+    
+    Args:
+        input_files: Input files to check (default: input/text.txt)
+        voice: Voice used for plain text inputs (default: from .env)
+    """
+    from src.ssml import SSMLValidationError
+    
+    tts_provider = ProviderFactory.create("azure-speech")
+    if not tts_provider.voice_catalog_path or not tts_provider.voice_catalog_path.exists():
+        print("Warning: No voice catalog cached; only checking SSML structure.")
+        print("Run 'python main.py voice-catalog' to enable style, role and locale checks.")
+    
+    failed = 0
+    for input_file in input_files or ["input/text.txt"]:
+        text = read_input_file(Path(input_file))
+        start = time.perf_counter()
+        try:
+            tts_provider.validate(text, voice or tts_provider.default_voice)
+        except SSMLValidationError as e:
+            failed += 1
+            print(f"✗ {input_file}")
+            for issue in e.issues:
+                print(f"    {issue}")
+        else:
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            print(f"✓ {input_file} ({elapsed_us:.0f} µs)")
+    
+    if failed:
+        sys.exit(1)
+
+
+def run_profiled(command) -> None:
+    """Run a CLI command under the profiler and write the profile next to the output.
+    
+    Writes ``output/profiles/<command>_<timestamp>.txt`` (stage timings, top
+    functions, allocations), ``.folded`` (collapsed stacks for flamegraph
+    tools) and ``.pstats`` (raw cProfile data).
+    
+    Args:
+        command: Callable running the command
+    """
+    from datetime import datetime
+    
+    imported = time.perf_counter()
+    settings_parsed = profiling.milestones.get("settings", profiling.STARTED_AT)
+    
+    profiler = profiling.Profiler()
+    profiler.record("startup", profiling.STARTED_AT, imported)
+    profiler.record("startup;import config + parse Settings", profiling.STARTED_AT, settings_parsed)
+    profiler.record("startup;import providers + SDKs", settings_parsed, imported)
+    
+    try:
+        with profiler:
+            command()
+    finally:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = sys.argv[1] if len(sys.argv) > 1 else "main"
+        prefix = Path(settings.output_dir) / "profiles" / f"{name}_{timestamp}"
+        for path in profiler.write(prefix):
+            print(f"✓ Profile saved to: {path}")
+
+
 def print_usage() -> None:
     """Print usage information."""
     print("""
@@ -225,10 +890,21 @@ Usage:
 
 Commands:
     synthesize               Convert text from input file to speech
+    matrix                   Render the input across providers/deployments/voices/styles
+    bundle <catalog.json>    Render a prompt catalog into a packed bundle
+    plan                     Estimate cost, duration and schedule without synthesizing
+    batch                    Synthesize several input files through the priority scheduler
+    stream                   Speak text piped on stdin while it is still being written
     providers                List available TTS providers
     deployments              List available Azure OpenAI deployments
     voices [provider]        List available voices for a provider
     voice-info <voice-name>  Show detailed info about a specific voice
+    voice-catalog            Cache Azure AI Speech voice capabilities for offline validation
+    validate                 Check SSML input against the cached voice catalog (no network)
+
+Global options:
+    --profile                Write a profile report, collapsed stacks (flamegraph)
+                             and cProfile data to output/profiles/
 
 Options for 'synthesize':
     --input <path>           Input text file (default: input/text.txt)
@@ -240,6 +916,52 @@ Options for 'synthesize':
     --style <name>           Speaking style (azure-speech only, e.g., cheerful, sad)
     --rate <value>           Speech rate (azure-speech only, e.g., 1.0, 1.5)
     --pitch <value>          Pitch adjustment (azure-speech only, e.g., 0%, +10%)
+    --progressive            Stream short-first segments, report time-to-first-audio
+    --hls <dir>              Write HLS segments + live playlist.m3u8 while synthesizing
+    --segment-duration <s>   Maximum HLS segment duration (default: 6)
+    --seek-index             Write a <file>.seek time-to-byte-offset sidecar
+    --word-timings           Write <file>.words.json and <file>.vtt (azure-speech only)
+    --auto-language          Speak each sentence with the voice of its detected language
+    --timeout <seconds>      Per-request deadline (default: SYNTHESIS_TIMEOUT from .env)
+
+Options for 'matrix':
+    --input <path>           Input text file (default: input/text.txt)
+    --providers <list>       Comma-separated providers (default: from .env)
+    --deployments <list>     Comma-separated Azure OpenAI deployments, or 'all'
+    --voices <list>          Comma-separated voices ('all' = every Azure OpenAI voice)
+    --styles <list>          Comma-separated speaking styles (azure-speech only)
+    --output-dir <path>      Matrix output directory (default: auto-generated)
+    --concurrency <n>        Cells synthesized at once (default: 4)
+    --speed, --rate, --pitch Same as for 'synthesize'
+
+Options for 'bundle':
+    --output <path>          Bundle archive path (default: output/<catalog>.bundle)
+    --concurrency <n>        Prompts rendered at once (default: 4)
+    --compact                Rewrite the archive without stale clips
+
+Options for 'plan':
+    --input <path>           Input file, repeatable (default: input/text.txt)
+    --provider <name>        Provider to plan for (default: from .env)
+    --rate <value>           Speaking rate / speed (default: 1.0)
+    --concurrency <n>        Concurrent requests (default: 4)
+    --quota <rpm>            Requests-per-minute quota (default: unlimited)
+    --json                   Print the plan as JSON
+
+Options for 'batch':
+    --input <path>           Input file, repeatable (default: input/text.txt)
+    --provider, --deployment, --voice, --timeout  Same as for 'synthesize'
+    --output-dir <path>      Output directory (default: output/batch_<timestamp>)
+    --priority <class>       Priority class: interactive, standard, bulk (default: bulk)
+    --tenant <name>          Tenant the jobs are accounted to (default: default)
+    --concurrency <n>        Concurrent synthesis calls (default: 4)
+
+Options for 'stream':
+    --provider, --deployment, --voice, --output, --timeout  Same as for 'synthesize'
+    --speed, --style, --rate, --pitch, --seek-index         Same as for 'synthesize'
+
+Options for 'validate':
+    --input <path>           Input file, repeatable (default: input/text.txt)
+    --voice <name>           Voice for plain text input (default: from .env)
 
 Options for 'voice-info':
     --provider <name>        TTS provider (default: azure-speech)
@@ -259,6 +981,9 @@ Examples:
     # Custom input file
     python main.py synthesize --input my-script.txt --provider azure-speech
     
+    # Compare all deployments and voices side by side
+    python main.py matrix --providers azure-openai --deployments all --voices all
+    
     # List providers and voices
     python main.py providers
     python main.py deployments
@@ -272,6 +997,12 @@ Examples:
 
 def main() -> None:
     """Main application entry point."""
+    # Global option, accepted before or after the command
+    if "--profile" in sys.argv[1:]:
+        sys.argv.remove("--profile")
+        run_profiled(main)
+        return
+    
     if len(sys.argv) < 2:
         print_usage()
         sys.exit(1)
@@ -287,6 +1018,12 @@ def main() -> None:
             voice = None
             output = None
             speed = 1.0
+            progressive = False
+            hls_dir = None
+            segment_duration = 6.0
+            seek_index = None
+            word_timings = False
+            auto_language = False
             kwargs = {}
             
             # Parse optional arguments
@@ -295,6 +1032,24 @@ def main() -> None:
                 if sys.argv[i] == "--input" and i + 1 < len(sys.argv):
                     input_file = sys.argv[i + 1]
                     i += 2
+                elif sys.argv[i] == "--progressive":
+                    progressive = True
+                    i += 1
+                elif sys.argv[i] == "--hls" and i + 1 < len(sys.argv):
+                    hls_dir = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--segment-duration" and i + 1 < len(sys.argv):
+                    segment_duration = float(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--seek-index":
+                    seek_index = True
+                    i += 1
+                elif sys.argv[i] == "--word-timings":
+                    word_timings = True
+                    i += 1
+                elif sys.argv[i] == "--auto-language":
+                    auto_language = True
+                    i += 1
                 elif sys.argv[i] == "--provider" and i + 1 < len(sys.argv):
                     provider = sys.argv[i + 1]
                     i += 2
@@ -319,11 +1074,235 @@ def main() -> None:
                 elif sys.argv[i] == "--pitch" and i + 1 < len(sys.argv):
                     kwargs["pitch"] = sys.argv[i + 1]
                     i += 2
+                elif sys.argv[i] == "--timeout" and i + 1 < len(sys.argv):
+                    kwargs["timeout"] = float(sys.argv[i + 1])
+                    i += 2
+                else:
+                    print(f"Warning: Unknown argument '{sys.argv[i]}'")
+                    i += 1
+            
+            synthesize_from_file(
+                input_file, provider, deployment, voice, output, speed,
+                progressive=progressive, hls_dir=hls_dir,
+                segment_duration=segment_duration, seek_index=seek_index,
+                word_timings=word_timings, auto_language=auto_language, **kwargs
+            )
+        
+        elif command == "matrix":
+            input_file = None
+            providers = None
+            deployments = None
+            voices = None
+            styles = None
+            output_dir = None
+            concurrency = 4
+            speed = 1.0
+            kwargs = {}
+            
+            # Parse optional arguments
+            i = 2
+            while i < len(sys.argv):
+                if sys.argv[i] == "--input" and i + 1 < len(sys.argv):
+                    input_file = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--providers" and i + 1 < len(sys.argv):
+                    providers = parse_list(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--deployments" and i + 1 < len(sys.argv):
+                    deployments = parse_list(sys.argv[i + 1])
+                    if deployments == ["all"]:
+                        deployments = ProviderFactory.get_available_deployments()
+                    i += 2
+                elif sys.argv[i] == "--voices" and i + 1 < len(sys.argv):
+                    voices = parse_list(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--styles" and i + 1 < len(sys.argv):
+                    styles = parse_list(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--output-dir" and i + 1 < len(sys.argv):
+                    output_dir = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--concurrency" and i + 1 < len(sys.argv):
+                    concurrency = int(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--speed" and i + 1 < len(sys.argv):
+                    speed = float(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--rate" and i + 1 < len(sys.argv):
+                    kwargs["rate"] = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--pitch" and i + 1 < len(sys.argv):
+                    kwargs["pitch"] = sys.argv[i + 1]
+                    i += 2
+                else:
+                    print(f"Warning: Unknown argument '{sys.argv[i]}'")
+                    i += 1
+            
+            synthesize_matrix(
+                input_file, providers, deployments, voices, styles,
+                output_dir, concurrency, speed, **kwargs
+            )
+        
+        elif command == "bundle":
+            if len(sys.argv) < 3:
+                print("Error: Catalog file required for 'bundle' command")
+                print("Usage: python main.py bundle <catalog.json> [--output <path>] [--concurrency <n>]")
+                sys.exit(1)
+            
+            catalog_file = sys.argv[2]
+            output = None
+            concurrency = 4
+            compact = False
+            
+            # Parse optional arguments
+            i = 3
+            while i < len(sys.argv):
+                if sys.argv[i] == "--output" and i + 1 < len(sys.argv):
+                    output = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--concurrency" and i + 1 < len(sys.argv):
+                    concurrency = int(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--compact":
+                    compact = True
+                    i += 1
+                else:
+                    print(f"Warning: Unknown argument '{sys.argv[i]}'")
+                    i += 1
+            
+            build_bundle(catalog_file, output, concurrency, compact)
+        
+        elif command == "plan":
+            input_files = []
+            provider = None
+            rate = 1.0
+            concurrency = 4
+            quota_rpm = None
+            as_json = False
+            
+            # Parse optional arguments
+            i = 2
+            while i < len(sys.argv):
+                if sys.argv[i] == "--input" and i + 1 < len(sys.argv):
+                    input_files.append(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--provider" and i + 1 < len(sys.argv):
+                    provider = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] in ("--rate", "--speed") and i + 1 < len(sys.argv):
+                    rate = parse_rate(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--concurrency" and i + 1 < len(sys.argv):
+                    concurrency = int(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--quota" and i + 1 < len(sys.argv):
+                    quota_rpm = int(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--json":
+                    as_json = True
+                    i += 1
+                else:
+                    print(f"Warning: Unknown argument '{sys.argv[i]}'")
+                    i += 1
+            
+            plan_synthesis(input_files, provider, rate, concurrency, quota_rpm, as_json)
+        
+        elif command == "batch":
+            input_files = []
+            provider = None
+            deployment = None
+            voice = None
+            output_dir = None
+            priority = "bulk"
+            tenant = "default"
+            concurrency = 4
+            kwargs = {}
+            
+            # Parse optional arguments
+            i = 2
+            while i < len(sys.argv):
+                if sys.argv[i] == "--input" and i + 1 < len(sys.argv):
+                    input_files.append(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--provider" and i + 1 < len(sys.argv):
+                    provider = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--deployment" and i + 1 < len(sys.argv):
+                    deployment = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--voice" and i + 1 < len(sys.argv):
+                    voice = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--output-dir" and i + 1 < len(sys.argv):
+                    output_dir = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--priority" and i + 1 < len(sys.argv):
+                    priority = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--tenant" and i + 1 < len(sys.argv):
+                    tenant = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--concurrency" and i + 1 < len(sys.argv):
+                    concurrency = int(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--timeout" and i + 1 < len(sys.argv):
+                    kwargs["timeout"] = float(sys.argv[i + 1])
+                    i += 2
+                else:
+                    print(f"Warning: Unknown argument '{sys.argv[i]}'")
+                    i += 1
+            
+            synthesize_batch(
+                input_files, provider, deployment, voice, output_dir,
+                priority, tenant, concurrency, **kwargs
+            )
+        
+        elif command == "stream":
+            provider = None
+            deployment = None
+            voice = None
+            output = None
+            seek_index = None
+            kwargs = {}
+            
+            # Parse optional arguments
+            i = 2
+            while i < len(sys.argv):
+                if sys.argv[i] == "--provider" and i + 1 < len(sys.argv):
+                    provider = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--deployment" and i + 1 < len(sys.argv):
+                    deployment = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--voice" and i + 1 < len(sys.argv):
+                    voice = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--output" and i + 1 < len(sys.argv):
+                    output = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--speed" and i + 1 < len(sys.argv):
+                    kwargs["speed"] = float(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--style" and i + 1 < len(sys.argv):
+                    kwargs["style"] = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--rate" and i + 1 < len(sys.argv):
+                    kwargs["rate"] = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--pitch" and i + 1 < len(sys.argv):
+                    kwargs["pitch"] = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--timeout" and i + 1 < len(sys.argv):
+                    kwargs["timeout"] = float(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--seek-index":
+                    seek_index = True
+                    i += 1
                 else:
                     print(f"Warning: Unknown argument '{sys.argv[i]}'")
                     i += 1
             
-            synthesize_from_file(input_file, provider, deployment, voice, output, speed, **kwargs)
+            synthesize_stream(provider, deployment, voice, output, seek_index, **kwargs)
         
         elif command == "providers":
             list_providers()
@@ -361,6 +1340,28 @@ def main() -> None:
             
             show_voice_info(voice_name, provider)
         
+        elif command == "voice-catalog":
+            refresh_voice_catalog()
+        
+        elif command == "validate":
+            input_files = []
+            voice = None
+            
+            # Parse optional arguments
+            i = 2
+            while i < len(sys.argv):
+                if sys.argv[i] == "--input" and i + 1 < len(sys.argv):
+                    input_files.append(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--voice" and i + 1 < len(sys.argv):
+                    voice = sys.argv[i + 1]
+                    i += 2
+                else:
+                    print(f"Warning: Unknown argument '{sys.argv[i]}'")
+                    i += 1
+            
+            validate_inputs(input_files, voice)
+        
         else:
             print(f"Error: Unknown command '{command}'")
             print_usage()
@@ -0,0 +1,268 @@
+"""Lightweight audio container helpers (frame scanning, duration, stitching).
+
+Only header-level parsing is done here: MP3 and ADTS/AAC streams are walked
+frame by frame and WAV files are handled through the standard ``wave``
+module. Nothing is ever decoded.
+"""
+
+import io
+import wave
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+
+# MPEG audio Layer III bitrate tables (kbps), indexed by bitrate index
+_MP3_BITRATES_V1 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+_MP3_BITRATES_V2 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+
+# Sample rates indexed by MPEG version bits, then sample rate index
+_MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],  # MPEG 1
+    2: [22050, 24000, 16000],  # MPEG 2
+    0: [11025, 12000, 8000],   # MPEG 2.5
+}
+
+_ADTS_SAMPLE_RATES = [
+    96000, 88200, 64000, 48000, 44100, 32000, 24000,
+    22050, 16000, 12000, 11025, 8000, 7350,
+]
+
+
+class Frame(NamedTuple):
+    """A single compressed audio frame located in a byte stream."""
+
+    offset: int
+    length: int
+    samples: int
+    sample_rate: int
+
+    @property
+    def duration(self) -> float:
+        """Frame duration in seconds."""
+        return self.samples / self.sample_rate
+
+
+def _parse_mp3_header(header: bytes) -> Optional[tuple[int, int, int]]:
+    """Parse a 4-byte MPEG Layer III frame header.
+
+    Args:
+        header: First four bytes of a candidate frame
+
+    Returns:
+        Tuple of (frame length, samples per frame, sample rate), or None if
+        the bytes are not a valid Layer III header
+    """
+    if header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+
+    if version == 1 or layer != 1:
+        return None
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    if version == 3:
+        bitrate = _MP3_BITRATES_V1[bitrate_index] * 1000
+        return 144 * bitrate // sample_rate + padding, 1152, sample_rate
+
+    bitrate = _MP3_BITRATES_V2[bitrate_index] * 1000
+    return 72 * bitrate // sample_rate + padding, 576, sample_rate
+
+
+def _parse_adts_header(header: bytes) -> Optional[tuple[int, int, int]]:
+    """Parse a 7-byte ADTS (AAC) frame header.
+
+    Args:
+        header: First seven bytes of a candidate frame
+
+    Returns:
+        Tuple of (frame length, samples per frame, sample rate), or None if
+        the bytes are not a valid ADTS header
+    """
+    if header[0] != 0xFF or (header[1] & 0xF6) != 0xF0:
+        return None
+
+    sample_rate_index = (header[2] >> 2) & 0x0F
+    if sample_rate_index >= len(_ADTS_SAMPLE_RATES):
+        return None
+
+    length = ((header[3] & 0x03) << 11) | (header[4] << 3) | (header[5] >> 5)
+    if length < 7:
+        return None
+
+    blocks = (header[6] & 0x03) + 1
+    return length, 1024 * blocks, _ADTS_SAMPLE_RATES[sample_rate_index]
+
+
+class FrameScanner:
+    """Incremental MP3/ADTS frame scanner.
+
+    Bytes can be fed in arbitrarily sized pieces (e.g. as they arrive from the
+    network); complete frames are reported with absolute stream offsets and
+    incomplete tails are kept until the next call.
+    """
+
+    def __init__(self, audio_format: str = "mp3"):
+        """Initialize the scanner.
+
+        Args:
+            audio_format: Container format, "mp3" or "aac"
+        """
+        if audio_format not in ("mp3", "aac"):
+            raise ValueError(f"Frame scanning not supported for format: {audio_format}")
+
+        self.audio_format = audio_format
+        self._parse = _parse_mp3_header if audio_format == "mp3" else _parse_adts_header
+        self._header_size = 4 if audio_format == "mp3" else 7
+        self._buffer = bytearray()
+        self._buffer_offset = 0
+        self._skip = 0
+        self._started = False
+
+    def feed(self, data: bytes) -> list[Frame]:
+        """Feed more bytes and return the frames completed by them.
+
+        Args:
+            data: Next piece of the byte stream
+
+        Returns:
+            List of complete frames found in the stream so far
+        """
+        self._buffer.extend(data)
+        frames = []
+        pos = 0
+
+        # Skip a leading ID3v2 tag before the first frame
+        if not self._started and self.audio_format == "mp3":
+            if len(self._buffer) < 10:
+                return frames
+            if self._buffer[:3] == b"ID3":
+                size = 0
+                for byte in self._buffer[6:10]:
+                    size = (size << 7) | (byte & 0x7F)
+                footer = 10 if self._buffer[5] & 0x10 else 0
+                self._skip = 10 + size + footer
+        self._started = True
+
+        if self._skip:
+            skipped = min(self._skip, len(self._buffer))
+            self._skip -= skipped
+            pos = skipped
+
+        while len(self._buffer) - pos >= self._header_size:
+            parsed = self._parse(bytes(self._buffer[pos:pos + self._header_size]))
+            if parsed is None:
+                # Lost sync: advance until the next plausible header
+                pos += 1
+                continue
+
+            length, samples, sample_rate = parsed
+            if len(self._buffer) - pos < length:
+                break
+
+            frames.append(Frame(self._buffer_offset + pos, length, samples, sample_rate))
+            pos += length
+
+        del self._buffer[:pos]
+        self._buffer_offset += pos
+        return frames
+
+
+def iter_frames(data: bytes, audio_format: str = "mp3") -> Iterator[Frame]:
+    """Iterate over the frames of a complete MP3/ADTS byte string.
+
+    Args:
+        data: Audio bytes
+        audio_format: Container format, "mp3" or "aac"
+
+    Returns:
+        Iterator of frames in stream order
+    """
+    yield from FrameScanner(audio_format).feed(data)
+
+
+def audio_duration(path: Path) -> Optional[float]:
+    """Get the duration of an audio file without decoding it.
+
+    Args:
+        path: Path to an MP3, AAC (ADTS) or WAV file
+
+    Returns:
+        Duration in seconds, or None if the format is not supported
+    """
+    audio_format = path.suffix.lower().lstrip(".")
+
+    if audio_format == "wav":
+        with wave.open(str(path), "rb") as wav_file:
+            return wav_file.getnframes() / wav_file.getframerate()
+
+    if audio_format in ("mp3", "aac"):
+        return sum(frame.duration for frame in iter_frames(path.read_bytes(), audio_format))
+
+    return None
+
+
+def bytes_duration(data: bytes, audio_format: str) -> Optional[float]:
+    """Get the duration of in-memory audio without decoding it.
+
+    Args:
+        data: Complete MP3, AAC (ADTS) or WAV file bytes
+        audio_format: Container format of the data
+
+    Returns:
+        Duration in seconds, or None if the format is not supported
+    """
+    if audio_format == "wav":
+        with wave.open(io.BytesIO(data), "rb") as wav_file:
+            return wav_file.getnframes() / wav_file.getframerate()
+
+    if audio_format in ("mp3", "aac"):
+        return sum(frame.duration for frame in iter_frames(data, audio_format))
+
+    return None
+
+
+def concat_audio(parts: list[bytes], audio_format: str) -> bytes:
+    """Stitch independently synthesized audio parts into one stream.
+
+    MP3 and ADTS streams are self-delimiting and are simply concatenated.
+    WAV parts are merged into a single RIFF container; all parts must share
+    the same sample format.
+
+    Args:
+        parts: Audio bytes of each part, in playback order
+        audio_format: Container format of the parts (mp3, aac, wav, ...)
+
+    Returns:
+        Stitched audio bytes
+    """
+    if audio_format != "wav":
+        return b"".join(parts)
+
+    if not parts:
+        return b""
+
+    output = io.BytesIO()
+    params = None
+    with wave.open(output, "wb") as writer:
+        for part in parts:
+            with wave.open(io.BytesIO(part), "rb") as reader:
+                part_params = reader.getparams()[:3]
+                if params is None:
+                    params = part_params
+                    writer.setnchannels(params[0])
+                    writer.setsampwidth(params[1])
+                    writer.setframerate(params[2])
+                elif part_params != params:
+                    raise ValueError(
+                        f"Cannot stitch WAV parts with different formats: {params} vs {part_params}"
+                    )
+                writer.writeframes(reader.readframes(reader.getnframes()))
+
+    return output.getvalue()
@@ -0,0 +1,395 @@
+"""Packed prompt bundles: pre-rendered clips in one archive with a compact index.
+
+A bundle is two files:
+
+- ``<name>.bundle``: append-only archive holding the audio of every prompt
+  back to back after an 8-byte magic header.
+- ``<name>.bundle.idx``: compact binary index mapping prompt id to
+  (offset, length, digest) inside the archive.
+
+The digest covers everything that affects the audio (text, provider,
+deployment, voice, parameters, output format; prompts without a voice use the
+provider's current default voice), so rebuilding a bundle only
+re-renders prompts whose definition changed. Changed prompts are appended to
+the archive and the index is replaced atomically; stale bytes are reclaimed
+with ``compact=True``.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from src.providers.base import TTSProvider
+
+
+ARCHIVE_MAGIC = b"AVBNDL01"
+INDEX_MAGIC = b"AVIDX001"
+
+# Index header: magic, audio format (8 bytes, NUL padded), entry count
+_INDEX_HEADER = struct.Struct("<8s8sI")
+# Index entry after the id: offset, length, digest
+_INDEX_ENTRY = struct.Struct("<QI16s")
+
+
+def index_path_for(bundle_path: Path) -> Path:
+    """Get the index file path of a bundle archive."""
+    return bundle_path.with_name(bundle_path.name + ".idx")
+
+
+def load_catalog(catalog_path: Path) -> dict[str, dict]:
+    """Load a prompt catalog.
+
+    The catalog is a JSON object mapping prompt id to either plain text or an
+    object with "text" and optional "provider", "deployment", "voice" and
+    "params". It may also be wrapped in a top-level "prompts" key.
+
+    Args:
+        catalog_path: Path to the catalog JSON file
+
+    Returns:
+        Dictionary mapping prompt id to its normalized definition
+    """
+    # Imported here so bundles can be read without loading the settings
+    from src.config import settings
+
+    if not catalog_path.exists():
+        raise FileNotFoundError(f"Catalog file not found: {catalog_path}")
+
+    data = json.loads(catalog_path.read_text(encoding="utf-8"))
+    prompts = data.get("prompts", data) if isinstance(data, dict) else None
+    if not isinstance(prompts, dict):
+        raise ValueError(f"Catalog must be a JSON object of prompts: {catalog_path}")
+
+    catalog = {}
+    for prompt_id, entry in prompts.items():
+        if isinstance(entry, str):
+            entry = {"text": entry}
+        if not isinstance(entry, dict) or not entry.get("text"):
+            raise ValueError(f"Prompt '{prompt_id}' has no text")
+
+        catalog[prompt_id] = {
+            "text": entry["text"],
+            "provider": entry.get("provider") or settings.default_provider,
+            "deployment": entry.get("deployment"),
+            "voice": entry.get("voice"),
+            "params": entry.get("params", {}),
+        }
+
+    return catalog
+
+
+def prompt_digest(entry: dict, audio_format: str, default_voice: Optional[str] = None) -> bytes:
+    """Compute the digest identifying the rendered audio of a prompt.
+
+    Args:
+        entry: Normalized catalog entry
+        audio_format: Output audio format
+        default_voice: Voice the provider uses when the entry names none
+
+    Returns:
+        16-byte digest
+    """
+    spec = {**entry, "voice": entry.get("voice") or default_voice, "format": audio_format}
+    spec = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(spec.encode("utf-8"), digest_size=16).digest()
+
+
+def read_index(index_path: Path) -> tuple[str, dict[str, tuple[int, int, bytes]]]:
+    """Read a bundle index.
+
+    Args:
+        index_path: Path to the ``.idx`` file
+
+    Returns:
+        Tuple of (audio format, mapping of id to (offset, length, digest))
+    """
+    data = index_path.read_bytes()
+    magic, audio_format, count = _INDEX_HEADER.unpack_from(data, 0)
+    if magic != INDEX_MAGIC:
+        raise ValueError(f"Not a prompt bundle index: {index_path}")
+
+    entries = {}
+    pos = _INDEX_HEADER.size
+    for _ in range(count):
+        (id_length,) = struct.unpack_from("<H", data, pos)
+        pos += 2
+        prompt_id = data[pos:pos + id_length].decode("utf-8")
+        pos += id_length
+        entries[prompt_id] = _INDEX_ENTRY.unpack_from(data, pos)
+        pos += _INDEX_ENTRY.size
+
+    return audio_format.rstrip(b"\0").decode("ascii"), entries
+
+
+def write_index(index_path: Path, audio_format: str, entries: dict[str, tuple[int, int, bytes]]) -> None:
+    """Atomically write a bundle index.
+
+    Args:
+        index_path: Path to the ``.idx`` file
+        audio_format: Audio format of the bundled clips
+        entries: Mapping of id to (offset, length, digest)
+    """
+    parts = [_INDEX_HEADER.pack(INDEX_MAGIC, audio_format.encode("ascii"), len(entries))]
+    for prompt_id, (offset, length, digest) in entries.items():
+        encoded = prompt_id.encode("utf-8")
+        parts.append(struct.pack("<H", len(encoded)) + encoded)
+        parts.append(_INDEX_ENTRY.pack(offset, length, digest))
+
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_bytes(b"".join(parts))
+    os.replace(tmp_path, index_path)
+
+
+class BundleBuilder:
+    """Render a prompt catalog into a packed bundle."""
+
+    def __init__(
+        self,
+        bundle_path: Path,
+        concurrency: int = 4,
+        audio_format: Optional[str] = None,
+        provider_factory: Optional[Callable[[Optional[str], Optional[str]], TTSProvider]] = None
+    ):
+        """Initialize the builder.
+
+        Args:
+            bundle_path: Path of the ``.bundle`` archive
+            concurrency: Number of prompts rendered at once
+            audio_format: Audio format (default: from .env)
+            provider_factory: Callable (provider, deployment) -> TTSProvider
+                (default: ProviderFactory.create)
+        """
+        if audio_format is None:
+            from src.config import settings
+            audio_format = settings.output_format
+
+        if provider_factory is None:
+            # Imported here so the reader does not pull in every provider SDK
+            from src.factory import ProviderFactory
+            provider_factory = ProviderFactory.create
+
+        self.bundle_path = bundle_path
+        self.index_path = index_path_for(bundle_path)
+        self.concurrency = concurrency
+        self.audio_format = audio_format
+        self.provider_factory = provider_factory
+
+    def build(self, catalog: dict[str, dict], compact: bool = False) -> dict[str, int]:
+        """Render changed prompts and update the bundle.
+
+        Args:
+            catalog: Normalized catalog from ``load_catalog``
+            compact: Rewrite the archive without stale clips
+
+        Returns:
+            Counts of rendered, reused and removed prompts
+        """
+        existing: dict[str, tuple[int, int, bytes]] = {}
+        if not (self.bundle_path.exists() and self.index_path.exists()):
+            compact = True
+        else:
+            index_format, existing = read_index(self.index_path)
+            if index_format != self.audio_format:
+                # Every clip changes format; start a fresh archive
+                existing = {}
+                compact = True
+
+        providers = self._providers(catalog)
+        digests = {
+            prompt_id: prompt_digest(
+                entry, self.audio_format,
+                getattr(providers[(entry["provider"], entry["deployment"])], "default_voice", None)
+            )
+            for prompt_id, entry in catalog.items()
+        }
+        reused = {
+            prompt_id: existing[prompt_id] for prompt_id, digest in digests.items()
+            if prompt_id in existing and existing[prompt_id][2] == digest
+        }
+        changed = [prompt_id for prompt_id in catalog if prompt_id not in reused]
+
+        rendered = self._render(catalog, changed, providers)
+        if compact:
+            entries = self._rewrite(reused, rendered, digests)
+        else:
+            entries = self._append(reused, rendered, digests)
+
+        # Keep catalog order in the index
+        ordered = {prompt_id: entries[prompt_id] for prompt_id in catalog}
+        write_index(self.index_path, self.audio_format, ordered)
+
+        return {
+            "rendered": len(changed),
+            "reused": len(reused),
+            "removed": len(set(existing) - set(catalog)),
+        }
+
+    def _providers(self, catalog: dict[str, dict]) -> dict[tuple, TTSProvider]:
+        """Create one provider per (provider, deployment) used by the catalog."""
+        providers = {}
+        for entry in catalog.values():
+            key = (entry["provider"], entry["deployment"])
+            if key not in providers:
+                providers[key] = self.provider_factory(*key)
+        return providers
+
+    def _render(
+        self,
+        catalog: dict[str, dict],
+        prompt_ids: list[str],
+        providers: dict[tuple, TTSProvider]
+    ) -> dict[str, bytes]:
+        """Render prompts in parallel through the providers.
+
+        Args:
+            catalog: Normalized catalog
+            prompt_ids: Prompts to render
+            providers: Providers from ``_providers``
+
+        Returns:
+            Mapping of prompt id to audio bytes
+        """
+        if not prompt_ids:
+            return {}
+
+        work_dir = Path(tempfile.mkdtemp(prefix="bundle_"))
+
+        def render(item: tuple[int, str]) -> tuple[str, bytes]:
+            number, prompt_id = item
+            entry = catalog[prompt_id]
+            tts_provider = providers[(entry["provider"], entry["deployment"])]
+            path = tts_provider.synthesize(
+                text=entry["text"],
+                output_path=work_dir / f"{number:06d}.{self.audio_format}",
+                voice=entry["voice"],
+                **entry["params"]
+            )
+            audio = path.read_bytes()
+            path.unlink(missing_ok=True)
+            return prompt_id, audio
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                return dict(executor.map(render, enumerate(prompt_ids)))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _append(
+        self,
+        reused: dict[str, tuple[int, int, bytes]],
+        rendered: dict[str, bytes],
+        digests: dict[str, bytes]
+    ) -> dict[str, tuple[int, int, bytes]]:
+        """Append rendered clips to the existing archive."""
+        entries = dict(reused)
+        with open(self.bundle_path, "ab") as archive:
+            offset = archive.tell()
+            for prompt_id, audio in rendered.items():
+                archive.write(audio)
+                entries[prompt_id] = (offset, len(audio), digests[prompt_id])
+                offset += len(audio)
+            archive.flush()
+            os.fsync(archive.fileno())
+        return entries
+
+    def _rewrite(
+        self,
+        reused: dict[str, tuple[int, int, bytes]],
+        rendered: dict[str, bytes],
+        digests: dict[str, bytes]
+    ) -> dict[str, tuple[int, int, bytes]]:
+        """Write a fresh archive holding only live clips."""
+        self.bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        entries = {}
+        tmp_path = self.bundle_path.with_name(self.bundle_path.name + ".tmp")
+
+        old_archive = None
+        if reused:
+            old_archive = open(self.bundle_path, "rb")
+        try:
+            with open(tmp_path, "wb") as archive:
+                archive.write(ARCHIVE_MAGIC)
+                for prompt_id, (old_offset, length, digest) in reused.items():
+                    old_archive.seek(old_offset)
+                    entries[prompt_id] = (archive.tell(), length, digest)
+                    archive.write(old_archive.read(length))
+                for prompt_id, audio in rendered.items():
+                    entries[prompt_id] = (archive.tell(), len(audio), digests[prompt_id])
+                    archive.write(audio)
+                archive.flush()
+                os.fsync(archive.fileno())
+        finally:
+            if old_archive is not None:
+                old_archive.close()
+
+        os.replace(tmp_path, self.bundle_path)
+        return entries
+
+
+class PromptBundle:
+    """Memory-mapped reader serving zero-copy prompt slices by id."""
+
+    def __init__(self, bundle_path: Path):
+        """Open a bundle.
+
+        Args:
+            bundle_path: Path of the ``.bundle`` archive
+        """
+        self.bundle_path = bundle_path
+        self.audio_format, entries = read_index(index_path_for(bundle_path))
+        self._entries = {prompt_id: (offset, length) for prompt_id, (offset, length, _) in entries.items()}
+
+        self._file = open(bundle_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+            self.close()
+            raise ValueError(f"Not a prompt bundle: {bundle_path}")
+        self._view = memoryview(self._mmap)
+
+    def __enter__(self) -> "PromptBundle":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __contains__(self, prompt_id: str) -> bool:
+        return prompt_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def get(self, prompt_id: str) -> memoryview:
+        """Get the audio of a prompt without copying it.
+
+        Args:
+            prompt_id: Prompt id from the catalog
+
+        Returns:
+            Read-only memoryview into the mapped archive
+
+        Raises:
+            KeyError: If the prompt is not in the bundle
+        """
+        offset, length = self._entries[prompt_id]
+        return self._view[offset:offset + length]
+
+    def close(self) -> None:
+        """Release the memory map and the archive file.
+
+        Slices returned by ``get`` must be released before closing.
+        """
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,163 @@
+"""Deadlines and cooperative cancellation for synthesis calls."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+class SynthesisCancelled(RuntimeError):
+    """Raised when a synthesis call was cancelled by its caller."""
+
+
+class SynthesisTimeout(SynthesisCancelled, TimeoutError):
+    """Raised when a synthesis call ran past its deadline."""
+
+
+class CancellationToken:
+    """A deadline plus a cancel flag shared between a caller and a synthesis call.
+
+    Callers keep a reference and call ``cancel()`` from any thread; providers
+    poll the token between blocking steps and register callbacks that abort
+    in-flight network work (closing a stream, stopping a synthesizer).
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancellationToken"] = None):
+        """Initialize the token.
+
+        Args:
+            timeout: Seconds from now until the deadline (None or <= 0: no deadline)
+            parent: Optional parent token; cancelling the parent cancels this
+                token and the parent's deadline also applies
+        """
+        self.deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+        if parent is not None and parent.deadline is not None:
+            self.deadline = parent.deadline if self.deadline is None else min(self.deadline, parent.deadline)
+
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self._parent = parent
+
+        if parent is not None:
+            parent.add_callback(self.cancel)
+            if parent.cancelled:
+                self.cancel()
+
+    @classmethod
+    def from_kwargs(cls, kwargs: dict, default_timeout: Optional[float] = None) -> "CancellationToken":
+        """Build the token for a provider call from its keyword arguments.
+
+        Args:
+            kwargs: Provider kwargs; ``cancel_token`` and ``timeout`` are used
+            default_timeout: Timeout applied when the call does not set one
+
+        Returns:
+            Token combining the caller's token and the call's timeout
+        """
+        timeout = kwargs.get("timeout", default_timeout)
+        return cls(timeout=timeout, parent=kwargs.get("cancel_token"))
+
+    def release(self) -> None:
+        """Detach from the parent token once the guarded call has finished."""
+        if self._parent is not None:
+            self._parent.remove_callback(self.cancel)
+            self._parent = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether ``cancel()`` was called."""
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """Get the time left until the deadline.
+
+        Returns:
+            Seconds left (never negative), or None when there is no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self) -> None:
+        """Cancel the token and run the registered abort callbacks."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback run once when the token is cancelled.
+
+        Args:
+            callback: Zero-argument callable
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback added with ``add_callback``.
+
+        Args:
+            callback: Previously registered callable
+        """
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """Register an abort callback for the duration of a block.
+
+        Args:
+            callback: Zero-argument callable
+        """
+        self.add_callback(callback)
+        try:
+            yield
+        finally:
+            self.remove_callback(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise if the token was cancelled or its deadline has passed.
+
+        Raises:
+            SynthesisCancelled: If the token was cancelled
+            SynthesisTimeout: If the deadline has passed
+        """
+        if self.cancelled:
+            raise SynthesisCancelled("Speech synthesis was cancelled")
+        if self.expired:
+            raise SynthesisTimeout("Speech synthesis exceeded its deadline")
+
+    def wait_for(self, event: threading.Event, poll_interval: float = 0.05) -> bool:
+        """Wait for an event until it is set, the token is cancelled or the deadline passes.
+
+        Args:
+            event: Event signalling completion of the guarded work
+            poll_interval: Maximum time between cancellation checks
+
+        Returns:
+            True if the event was set, False if cancelled or expired first
+        """
+        while not event.is_set():
+            if self.cancelled or self.expired:
+                return False
+            remaining = self.remaining()
+            event.wait(poll_interval if remaining is None else min(poll_interval, remaining))
+        return True
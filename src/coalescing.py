@@ -0,0 +1,391 @@
+"""Single-flight coalescing of identical in-flight synthesis requests.
+
+Concurrent requests with the same canonical key (provider, voice, text and
+parameters) share one upstream ``synthesize`` call; every waiter receives the
+same result or the same error. Thread-based and asyncio callers share the
+same in-flight table, so a request started by a worker thread also serves
+coroutines asking for the same audio, and vice versa.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+
+from src.cancellation import CancellationToken, SynthesisTimeout
+from src.providers.base import TTSProvider
+from src.seek_index import SEEK_FORMATS, sidecar_path
+
+
+class _Flight:
+    """One upstream call and the callers waiting for it."""
+
+    def __init__(self):
+        """Initialize a flight with its own cancellation token."""
+        self.future: Future = Future()
+        self.token = CancellationToken()
+        self.waiters = 1
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key.
+
+    The upstream call runs on its own thread under the flight's cancellation
+    token, not under any caller's. Each caller waits with its own deadline
+    and cancellation token; the upstream call is cancelled only once every
+    caller has given up, so it effectively runs with the most generous
+    deadline among them.
+    """
+
+    def __init__(self):
+        """Initialize an empty in-flight table."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Flight] = {}
+        self.upstream = 0
+        self.coalesced = 0
+
+    def _join(self, key: Hashable) -> tuple[_Flight, bool]:
+        """Join the in-flight call for a key, or register a new one.
+
+        Args:
+            key: Canonical request key
+
+        Returns:
+            Tuple of (flight, whether the caller is the leader)
+        """
+        with self._lock:
+            flight = self._calls.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self.coalesced += 1
+                return flight, False
+
+            flight = _Flight()
+            self._calls[key] = flight
+            self.upstream += 1
+            return flight, True
+
+    def _remove(self, key: Hashable, flight: _Flight) -> None:
+        """Drop a flight from the table; the caller must hold the lock."""
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+
+    def _run(self, key: Hashable, flight: _Flight, fn: Callable[[CancellationToken], Any]) -> None:
+        """Execute the upstream call and publish its outcome to all waiters."""
+        try:
+            result = fn(flight.token)
+        except BaseException as e:
+            with self._lock:
+                self._remove(key, flight)
+            flight.future.set_exception(e)
+        else:
+            with self._lock:
+                self._remove(key, flight)
+            flight.future.set_result(result)
+        finally:
+            flight.token.release()
+
+    def _leave(self, key: Hashable, flight: _Flight) -> None:
+        """Withdraw a waiter; the last one to leave cancels the upstream call."""
+        with self._lock:
+            flight.waiters -= 1
+            abandoned = flight.waiters == 0 and not flight.future.done()
+            if abandoned:
+                # Later callers must start a fresh call, not join a cancelled one
+                self._remove(key, flight)
+        if abandoned:
+            flight.token.cancel()
+
+    def _wait(self, key: Hashable, flight: _Flight, token: CancellationToken) -> Any:
+        """Wait for a flight's result within a caller's deadline.
+
+        Raises:
+            SynthesisCancelled: If the caller's token was cancelled first
+            SynthesisTimeout: If the caller's deadline passed first
+        """
+        done = threading.Event()
+        flight.future.add_done_callback(lambda _: done.set())
+        if not token.wait_for(done):
+            self._leave(key, flight)
+            token.raise_if_cancelled()
+        return flight.future.result()
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[CancellationToken], Any],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> tuple[Any, bool]:
+        """Run ``fn`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Canonical request key
+            fn: Callable performing the upstream call; receives the flight's
+                cancellation token
+            cancel_token: The caller's own deadline and cancellation token
+
+        Returns:
+            Tuple of (result, whether the call was shared with a leader)
+        """
+        flight, leader = self._join(key)
+        if leader:
+            threading.Thread(target=self._run, args=(key, flight, fn), daemon=True).start()
+        return self._wait(key, flight, cancel_token or CancellationToken()), not leader
+
+    async def do_async(
+        self,
+        key: Hashable,
+        fn: Callable[[CancellationToken], Any],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> tuple[Any, bool]:
+        """Asyncio variant of ``do``.
+
+        Waiters await the flight on the event loop without holding a thread;
+        only the upstream call runs on its own thread. Cancelling a waiting
+        coroutine withdraws only that waiter; the upstream call is cancelled
+        once no waiter is left.
+
+        Args:
+            key: Canonical request key
+            fn: Blocking callable performing the upstream call; receives the
+                flight's cancellation token
+            cancel_token: The caller's own deadline and cancellation token
+
+        Returns:
+            Tuple of (result, whether the call was shared with a leader)
+        """
+        flight, leader = self._join(key)
+        if leader:
+            threading.Thread(target=self._run, args=(key, flight, fn), daemon=True).start()
+
+        token = cancel_token or CancellationToken()
+        loop = asyncio.get_running_loop()
+        # Shielded so that a waiter giving up never cancels the shared call
+        result = asyncio.shield(asyncio.wrap_future(flight.future))
+        cancelled = loop.create_future()
+
+        def on_cancel() -> None:
+            loop.call_soon_threadsafe(lambda: cancelled.done() or cancelled.set_result(None))
+
+        try:
+            with token.on_cancel(on_cancel):
+                await asyncio.wait(
+                    (result, cancelled), timeout=token.remaining(), return_when=asyncio.FIRST_COMPLETED
+                )
+        except asyncio.CancelledError:
+            result.cancel()
+            self._leave(key, flight)
+            raise
+
+        if not result.done():
+            result.cancel()
+            self._leave(key, flight)
+            token.raise_if_cancelled()
+            raise SynthesisTimeout("Speech synthesis exceeded its deadline")
+        return result.result(), not leader
+
+    def stats(self) -> dict[str, int]:
+        """Get coalescing metrics.
+
+        Returns:
+            Dictionary with upstream calls, coalesced calls and calls in flight
+        """
+        with self._lock:
+            return {
+                "upstream": self.upstream,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class CoalescingProvider(TTSProvider):
+    """TTS provider wrapper that coalesces identical concurrent requests."""
+
+    # Per-call parameters that do not change the produced audio
+    IGNORED_KWARGS = ("timeout", "cancel_token", "seek_index")
+
+    def __init__(self, provider: TTSProvider, single_flight: Optional[SingleFlight] = None):
+        """Initialize the wrapper.
+
+        Args:
+            provider: Provider performing the upstream calls
+            single_flight: Optional in-flight table to share between wrappers
+        """
+        super().__init__(provider.config)
+        self.provider = provider
+        self.single_flight = single_flight or SingleFlight()
+
+    def request_key(self, text: str, voice: Optional[str], kwargs: dict) -> tuple:
+        """Build the canonical key of a request.
+
+        Args:
+            text: Text or SSML
+            voice: Requested voice (None means the provider default)
+            kwargs: Provider-specific parameters
+
+        Returns:
+            Hashable key identifying requests that produce the same audio
+        """
+        params = tuple(sorted(
+            (name, repr(value)) for name, value in kwargs.items()
+            if name not in self.IGNORED_KWARGS
+        ))
+        selected_voice = voice or getattr(self.provider, "default_voice", None)
+        return (self.provider.provider_name, selected_voice, text.strip(), params)
+
+    def synthesize(
+        self,
+        text: str,
+        output_path: Optional[Path] = None,
+        voice: Optional[str] = None,
+        **kwargs
+    ) -> Path:
+        """Synthesize speech, sharing the upstream call with identical requests.
+
+        The shared call renders into a private scratch file; every waiter,
+        the first one included, gets its own copy of the audio (plus a
+        ``.seek`` sidecar if it asked for ``seek_index``). The shared call is
+        cancelled only when every waiter has been cancelled or timed out.
+
+        Args:
+            text: Text to convert to speech
+            output_path: Optional custom output path
+            voice: Voice to use (defaults to provider config)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Path to generated audio file
+        """
+        key = self.request_key(text, voice, kwargs)
+        token = CancellationToken.from_kwargs(kwargs, getattr(self.provider, "timeout", None))
+        try:
+            (audio, index), _ = self.single_flight.do(
+                key, lambda flight_token: self._upstream(text, voice, kwargs, flight_token), token
+            )
+        finally:
+            token.release()
+        return self._deliver(audio, index, output_path, kwargs)
+
+    async def asynthesize(
+        self,
+        text: str,
+        output_path: Optional[Path] = None,
+        voice: Optional[str] = None,
+        **kwargs
+    ) -> Path:
+        """Asyncio variant of ``synthesize``.
+
+        Args:
+            text: Text to convert to speech
+            output_path: Optional custom output path
+            voice: Voice to use (defaults to provider config)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Path to generated audio file
+        """
+        key = self.request_key(text, voice, kwargs)
+        token = CancellationToken.from_kwargs(kwargs, getattr(self.provider, "timeout", None))
+        try:
+            (audio, index), _ = await self.single_flight.do_async(
+                key, lambda flight_token: self._upstream(text, voice, kwargs, flight_token), token
+            )
+        finally:
+            token.release()
+        return await asyncio.to_thread(self._deliver, audio, index, output_path, kwargs)
+
+    def _audio_format(self, kwargs: dict) -> str:
+        """Get the audio format a request produces."""
+        return kwargs.get("response_format", getattr(self.provider, "output_format", "mp3"))
+
+    def _upstream(
+        self,
+        text: str,
+        voice: Optional[str],
+        kwargs: dict,
+        flight_token: CancellationToken
+    ) -> tuple[bytes, Optional[bytes]]:
+        """Run the shared call into a private scratch file and read the result.
+
+        The call runs under the flight's token instead of the leader's
+        deadline and cancellation token; waiters enforce their own. Nothing
+        is written to a caller's path here, so a cancelled leader leaves no
+        file behind.
+
+        Returns:
+            Tuple of (audio bytes, seek index bytes or None)
+        """
+        audio_format = self._audio_format(kwargs)
+        kwargs = {
+            **kwargs,
+            "cancel_token": flight_token,
+            "timeout": None,
+            "seek_index": audio_format in SEEK_FORMATS,
+        }
+        work_dir = Path(tempfile.mkdtemp(prefix="coalesced_"))
+        try:
+            result_path = self.provider.synthesize(
+                text=text, output_path=work_dir / f"shared.{audio_format}", voice=voice, **kwargs
+            )
+            index_path = sidecar_path(result_path)
+            index = index_path.read_bytes() if index_path.exists() else None
+            return result_path.read_bytes(), index
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _deliver(self, audio: bytes, index: Optional[bytes], output_path: Optional[Path], kwargs: dict) -> Path:
+        """Write the shared audio (and, if requested, its seek index) to a waiter's own file.
+
+        Args:
+            audio: Audio bytes of the shared result
+            index: Seek index bytes of the shared result, if one was built
+            output_path: Path requested by the waiter
+            kwargs: The waiter's provider-specific parameters
+
+        Returns:
+            Path of the waiter's audio file
+        """
+        output_dir = Path(self.provider.config.get("output_dir", "output"))
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if output_path is None:
+            # Unique name per waiter
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            fd, name = tempfile.mkstemp(
+                prefix=f"coalesced_{timestamp}_",
+                suffix=f".{self._audio_format(kwargs)}",
+                dir=output_dir
+            )
+            with os.fdopen(fd, "wb") as audio_file:
+                audio_file.write(audio)
+            output_path = Path(name)
+        else:
+            if not output_path.is_absolute():
+                output_path = output_dir / output_path
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(audio)
+
+        # Formats without seek support have no index to copy
+        if kwargs.get("seek_index") and index is not None:
+            sidecar_path(output_path).write_bytes(index)
+        return output_path
+
+    def get_available_voices(self) -> list[str]:
+        """Get available voices of the wrapped provider."""
+        return self.provider.get_available_voices()
+
+    @property
+    def provider_name(self) -> str:
+        """Get provider name of the wrapped provider."""
+        return self.provider.provider_name
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider-specific extras such as get_voice_info
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
@@ -1,9 +1,11 @@
 """Configuration management using pydantic-settings."""
 
-from typing import Dict
+from typing import Dict, List
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src import profiling
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -36,10 +38,32 @@ class Settings(BaseSettings):
     azure_speech_voice: str = "en-US-JennyNeural"
     azure_speech_language: str = "en-US"
     
+    # Additional Speech resources for multi-region routing (comma-separated:
+    # key@region or key@https://custom-endpoint). When set, these replace the
+    # single api_key/region pair above.
+    # Example: "key1@eastus,key2@westeurope,key3@southeastasia"
+    azure_speech_resources: str = ""
+    
+    # Voices for automatic per-sentence language routing (comma-separated:
+    # language:voice). Unlisted languages use built-in defaults, except the
+    # language of azure_speech_language, which uses azure_speech_voice.
+    # Example: "fr:fr-FR-HenriNeural,es:es-MX-DaliaNeural"
+    azure_speech_language_voices: str = ""
+    
+    # Local cache of Azure AI Speech voice capabilities used to validate SSML
+    # offline before dispatch (refresh with: python main.py voice-catalog)
+    azure_speech_voice_catalog: str = ".cache/azure_speech_voices.json"
+    
+    # Default per-request synthesis deadline in seconds (0 disables it)
+    synthesis_timeout: float = 300.0
+    
     # Output settings
     output_dir: str = "output"
     output_format: str = "mp3"
     
+    # Write a <file>.seek index (time to byte offset) next to generated audio
+    seek_index: bool = False
+    
     def get_deployments(self) -> Dict[str, Dict[str, str]]:
         """Parse deployments configuration into a dictionary.
         
@@ -71,6 +95,53 @@ class Settings(BaseSettings):
         
         return deployments
     
+    def get_language_voices(self) -> Dict[str, str]:
+        """Parse the language routing voices configuration.
+        
+        Returns:
+            Dictionary mapping language codes (e.g. "fr") to voice names
+        """
+        voices = {}
+        for voice_config in self.azure_speech_language_voices.split(","):
+            if not voice_config.strip():
+                continue
+            
+            language, _, voice = voice_config.strip().partition(":")
+            if not language or not voice:
+                raise ValueError(
+                    f"Invalid language voice '{voice_config.strip()}'. "
+                    f"Expected language:voice, e.g. fr:fr-FR-DeniseNeural"
+                )
+            voices[language.strip().lower()] = voice.strip()
+        
+        return voices
+    
+    def get_speech_resources(self) -> List[Dict[str, str]]:
+        """Parse Azure AI Speech resources configuration.
+        
+        Returns:
+            List of resource dictionaries with "key" and either "region" or
+            "endpoint". Falls back to the single api_key/region pair.
+        """
+        if not self.azure_speech_resources:
+            return [{"key": self.azure_speech_api_key, "region": self.azure_speech_region}]
+        
+        resources = []
+        for resource_config in self.azure_speech_resources.split(","):
+            key, _, location = resource_config.strip().partition("@")
+            if not key or not location:
+                raise ValueError(
+                    f"Invalid Speech resource '{resource_config.strip()}'. "
+                    f"Expected key@region or key@https://endpoint"
+                )
+            
+            if location.startswith(("https://", "wss://")):
+                resources.append({"key": key, "endpoint": location})
+            else:
+                resources.append({"key": key, "region": location})
+        
+        return resources
+    
     def get_deployment_config(self, deployment_name: str = None) -> Dict[str, str]:
         """Get configuration for a specific deployment.
         
@@ -96,3 +167,4 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+profiling.milestone("settings")
@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from src.coalescing import CoalescingProvider, SingleFlight
 from src.config import settings
 from src.providers.base import TTSProvider
 from src.providers.azure_openai import AzureOpenAIProvider
@@ -17,17 +18,23 @@ class ProviderFactory:
         "azure-speech": AzureSpeechProvider,
     }
     
+    # In-flight table shared by all coalescing providers of this process
+    single_flight = SingleFlight()
+    
     @classmethod
     def create(
         cls,
         provider: Optional[str] = None,
-        deployment_name: Optional[str] = None
+        deployment_name: Optional[str] = None,
+        coalesce: bool = False
     ) -> TTSProvider:
         """Create a TTS provider instance.
         
         Args:
             provider: Provider to use (azure-openai, azure-speech). If None, uses default.
             deployment_name: For azure-openai: deployment name. Ignored for azure-speech.
+            coalesce: Share identical in-flight requests with every other
+                coalescing provider of this process
             
         Returns:
             Initialized TTS provider instance
@@ -55,7 +62,12 @@ class ProviderFactory:
         config = cls._get_provider_config(provider, deployment_name)
         
         # Create and return provider instance
-        return provider_class(config)
+        tts_provider = provider_class(config)
+        
+        if coalesce:
+            return CoalescingProvider(tts_provider, cls.single_flight)
+        
+        return tts_provider
     
     @classmethod
     def _get_provider_config(cls, provider: str, deployment_name: Optional[str] = None) -> dict:
@@ -71,6 +83,7 @@ class ProviderFactory:
         config = {
             "output_dir": settings.output_dir,
             "output_format": settings.output_format,
+            "timeout": settings.synthesis_timeout,
         }
         
         if provider == "azure-openai":
@@ -93,8 +106,10 @@ class ProviderFactory:
             config.update({
                 "api_key": settings.azure_speech_api_key,
                 "region": settings.azure_speech_region,
+                "resources": settings.get_speech_resources(),
                 "voice": settings.azure_speech_voice,
                 "language": settings.azure_speech_language,
+                "voice_catalog": settings.azure_speech_voice_catalog,
             })
         
         return config
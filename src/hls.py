@@ -0,0 +1,188 @@
+"""Progressive HLS output: fixed-duration audio segments plus a live playlist.
+
+Audio is cut on MP3/ADTS frame boundaries (no re-encoding) into packed audio
+segments. The playlist is rewritten atomically every time a segment lands, so
+players and CDNs can start fetching while synthesis is still in progress; it
+is finalized with ``#EXT-X-ENDLIST`` when the writer is closed.
+"""
+
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+from src.audio import FrameScanner
+
+
+# Owner of the ID3 PRIV frame carrying the timestamp of packed audio segments
+_TIMESTAMP_OWNER = b"com.apple.streaming.transportStreamTimestamp\x00"
+
+
+def _syncsafe(value: int) -> bytes:
+    """Encode an integer as a 4-byte ID3v2 syncsafe integer."""
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def timestamp_tag(seconds: float) -> bytes:
+    """Build the ID3 tag that starts every packed audio segment.
+
+    HLS packed audio has no container timestamps, so each segment carries
+    the presentation time of its first sample as a 33-bit, 90 kHz MPEG-2 PTS.
+
+    Args:
+        seconds: Presentation time of the segment's first sample
+
+    Returns:
+        ID3v2.4 tag bytes
+    """
+    pts = round(seconds * 90000) & ((1 << 33) - 1)
+    data = _TIMESTAMP_OWNER + struct.pack(">Q", pts)
+    frame = b"PRIV" + _syncsafe(len(data)) + b"\x00\x00" + data
+    return b"ID3\x04\x00\x00" + _syncsafe(len(frame)) + frame
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so readers never see it half-written."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class HLSSegmentWriter:
+    """Split a growing MP3/AAC stream into HLS segments and a live playlist."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        audio_format: str = "mp3",
+        segment_duration: float = 6.0,
+        playlist_name: str = "playlist.m3u8"
+    ):
+        """Initialize the writer.
+
+        Args:
+            output_dir: Directory receiving the segments and the playlist
+            audio_format: Stream format, "mp3" or "aac"
+            segment_duration: Maximum segment duration in seconds
+            playlist_name: File name of the media playlist
+        """
+        if audio_format not in ("mp3", "aac"):
+            raise ValueError(f"HLS output requires mp3 or aac audio, got: {audio_format}")
+
+        self.output_dir = output_dir
+        self.audio_format = audio_format
+        self.segment_duration = segment_duration
+        self.playlist_path = output_dir / playlist_name
+        self.segments: list[tuple[str, float]] = []
+        self.closed = False
+
+        self._scanner = FrameScanner(audio_format)
+        self._pending = bytearray()
+        self._pending_offset = 0
+        self._segment = bytearray()
+        self._segment_samples = 0
+        self._sample_rate: Optional[int] = None
+        self._start_time = 0.0
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._write_playlist()
+
+    def __enter__(self) -> "HLSSegmentWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Only finalize complete streams; a failed run leaves a live playlist
+        if exc_type is None:
+            self.close()
+
+    @property
+    def duration(self) -> float:
+        """Duration of the audio written to segments so far, in seconds."""
+        return self._start_time
+
+    def write(self, data: bytes) -> None:
+        """Append bytes of the current stream.
+
+        Args:
+            data: Next piece of the audio stream, in any size
+        """
+        if self.closed:
+            raise ValueError("HLS writer is closed")
+
+        self._pending.extend(data)
+        for frame in self._scanner.feed(data):
+            start = frame.offset - self._pending_offset
+            self._add_frame(bytes(self._pending[start:start + frame.length]), frame.samples, frame.sample_rate)
+            consumed = start + frame.length
+            del self._pending[:consumed]
+            self._pending_offset += consumed
+
+    def write_part(self, audio: bytes) -> None:
+        """Append a complete, independently encoded audio file.
+
+        Each part may start with its own ID3 tag, so it is scanned as a new
+        stream; segments still continue across part boundaries.
+
+        Args:
+            audio: Complete MP3/AAC file bytes
+        """
+        self._scanner = FrameScanner(self.audio_format)
+        self._pending = bytearray()
+        self._pending_offset = 0
+        self.write(audio)
+
+    def close(self) -> Path:
+        """Flush the last segment and finalize the playlist.
+
+        Returns:
+            Path of the playlist
+        """
+        if not self.closed:
+            self._flush_segment()
+            self.closed = True
+            self._write_playlist()
+        return self.playlist_path
+
+    def _add_frame(self, frame: bytes, samples: int, sample_rate: int) -> None:
+        """Add a frame, cutting a segment first if it would grow past the target."""
+        if self._sample_rate is None:
+            self._sample_rate = sample_rate
+
+        if self._segment and (self._segment_samples + samples) / self._sample_rate > self.segment_duration:
+            self._flush_segment()
+
+        self._segment.extend(frame)
+        self._segment_samples += samples
+
+    def _flush_segment(self) -> None:
+        """Write the buffered frames as the next segment and publish it."""
+        if not self._segment:
+            return
+
+        duration = self._segment_samples / self._sample_rate
+        name = f"segment_{len(self.segments):05d}.{self.audio_format}"
+        _write_atomic(self.output_dir / name, timestamp_tag(self._start_time) + bytes(self._segment))
+
+        self.segments.append((name, duration))
+        self._start_time += duration
+        self._segment = bytearray()
+        self._segment_samples = 0
+        self._write_playlist()
+
+    def _write_playlist(self) -> None:
+        """Rewrite the media playlist with every published segment."""
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{math.ceil(self.segment_duration)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+        ]
+        for name, duration in self.segments:
+            lines.append(f"#EXTINF:{duration:.3f},")
+            lines.append(name)
+        if self.closed:
+            lines.append("#EXT-X-ENDLIST")
+
+        _write_atomic(self.playlist_path, ("\n".join(lines) + "\n").encode("utf-8"))
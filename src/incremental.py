@@ -0,0 +1,376 @@
+"""Incremental text input: speak text streams (e.g. LLM tokens) as they are generated.
+
+Fragments are cut into speakable units at sentence boundaries (the first unit
+may end at a clause boundary to start audio sooner) and synthesis starts on
+the first unit while more text is still arriving. Providers that accept
+streamed text input (Azure AI Speech text streaming) receive the fragments
+directly; otherwise units are pipelined as concurrent ``synthesize`` calls.
+Either way the result is one ordered audio stream.
+"""
+
+import asyncio
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from src.cancellation import CancellationToken, SynthesisCancelled, SynthesisTimeout
+from src.providers.base import TTSProvider
+from src.text import CLAUSE_END, SENTENCE_END
+from src.timings import WordTimeline
+
+
+class UnitSegmenter:
+    """Cut a stream of text fragments into speakable units."""
+
+    def __init__(self, min_chars: int = 20, max_chars: int = 400):
+        """Initialize the segmenter.
+
+        Args:
+            min_chars: Units shorter than this are merged with the next one
+            max_chars: Units are force-cut (clause, then word boundary) beyond this
+        """
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+        self._position = 0
+        self._emitted = 0
+        # Offset in the fed text at which each emitted unit starts
+        self.offsets: list[int] = []
+
+    def feed(self, fragment: str) -> list[str]:
+        """Add a fragment and return the units it completed.
+
+        Args:
+            fragment: Next piece of text
+
+        Returns:
+            List of complete units (possibly empty)
+        """
+        self._buffer += fragment
+        units = []
+
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                break
+            unit = self._take(cut)
+            if unit:
+                units.append(unit)
+
+        return units
+
+    def flush(self) -> list[str]:
+        """Return whatever text is left once the input has ended.
+
+        Returns:
+            List with the final unit, or an empty list
+        """
+        unit = self._take(len(self._buffer))
+        return [unit] if unit else []
+
+    def _take(self, cut: int) -> str:
+        """Remove the first ``cut`` characters of the buffer and return them stripped."""
+        text = self._buffer[:cut]
+        self._buffer = self._buffer[cut:]
+        unit = text.strip()
+        if unit:
+            self.offsets.append(self._position + len(text) - len(text.lstrip()))
+            self._emitted += 1
+        self._position += cut
+        return unit
+
+    def _find_cut(self) -> Optional[int]:
+        """Find where the next unit ends in the buffer, if it is complete yet."""
+        for match in SENTENCE_END.finditer(self._buffer):
+            if match.end() >= self.min_chars:
+                return match.end()
+
+        # The very first unit may end at a clause to start audio sooner
+        if self._emitted == 0:
+            for match in CLAUSE_END.finditer(self._buffer):
+                if match.end() >= self.min_chars:
+                    return match.end()
+
+        if len(self._buffer) > self.max_chars:
+            clauses = [m.end() for m in CLAUSE_END.finditer(self._buffer, 0, self.max_chars)]
+            if clauses:
+                return clauses[-1]
+            space = self._buffer.rfind(" ", 0, self.max_chars)
+            return space + 1 if space > 0 else self.max_chars
+
+        return None
+
+
+@dataclass
+class IncrementalStats:
+    """Timing of an incremental synthesis run."""
+
+    units: int = 0
+    time_to_first_audio: Optional[float] = None
+    total_time: float = 0.0
+    text_stream: bool = False
+
+
+class IncrementalSynthesizer:
+    """Speak an iterator or async iterator of text fragments as one ordered audio stream."""
+
+    def __init__(
+        self,
+        provider: TTSProvider,
+        max_workers: int = 3,
+        min_chars: int = 20,
+        max_chars: int = 400,
+        use_text_stream: bool = True
+    ):
+        """Initialize the synthesizer.
+
+        Args:
+            provider: TTS provider
+            max_workers: Units synthesized concurrently in pipelined mode
+            min_chars: Minimum unit size
+            max_chars: Maximum unit size
+            use_text_stream: Use the provider's streamed text input when available
+        """
+        self.provider = provider
+        self.max_workers = max_workers
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.use_text_stream = use_text_stream
+        self.output_format = getattr(provider, "output_format", "mp3")
+        self.stats = IncrementalStats()
+
+    # Parameters that need SSML, which streamed text input cannot carry
+    SSML_KWARGS = ("style", "rate", "pitch")
+
+    def _supports_text_stream(self, kwargs: dict) -> bool:
+        """Whether the provider can take streamed text input for this request."""
+        supports = getattr(self.provider, "supports_text_stream", None)
+        if any(kwargs.get(name) for name in self.SSML_KWARGS):
+            return False
+        return bool(self.use_text_stream and supports and supports())
+
+    def stream(self, fragments: Iterable[str], voice: Optional[str] = None, **kwargs) -> Iterator[bytes]:
+        """Synthesize text fragments as they arrive.
+
+        Args:
+            fragments: Iterator of text fragments (e.g. LLM tokens)
+            voice: Voice to use (defaults to provider config)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Iterator of audio chunks in playback order. In pipelined mode each
+            chunk is a complete audio file for one unit (WAV chunks carry
+            their own header; see ``concat_audio``).
+        """
+        self.stats = IncrementalStats(text_stream=self._supports_text_stream(kwargs))
+        start = time.perf_counter()
+
+        if self.stats.text_stream:
+            chunks = self._text_stream(fragments, voice, kwargs)
+        else:
+            chunks = self._pipeline(fragments, voice, kwargs)
+
+        for chunk in chunks:
+            if self.stats.time_to_first_audio is None:
+                self.stats.time_to_first_audio = time.perf_counter() - start
+            yield chunk
+
+        self.stats.total_time = time.perf_counter() - start
+
+    async def astream(
+        self,
+        fragments: AsyncIterable[str],
+        voice: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """Asyncio variant of ``stream`` for async fragment sources.
+
+        The async source is drained on the event loop and bridged to the
+        thread-based pipeline, so the loop is never blocked by synthesis.
+
+        Args:
+            fragments: Async iterator of text fragments
+            voice: Voice to use (defaults to provider config)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Async iterator of audio chunks in playback order
+        """
+        loop = asyncio.get_running_loop()
+        fragment_queue: queue.Queue = queue.Queue()
+        end = object()
+
+        async def pump() -> None:
+            try:
+                async for fragment in fragments:
+                    fragment_queue.put(fragment)
+            finally:
+                fragment_queue.put(end)
+
+        def blocking_fragments() -> Iterator[str]:
+            while (fragment := fragment_queue.get()) is not end:
+                yield fragment
+
+        token = CancellationToken(parent=kwargs.get("cancel_token"))
+        pump_task = asyncio.ensure_future(pump())
+        chunks = self.stream(blocking_fragments(), voice=voice, **{**kwargs, "cancel_token": token})
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                pending = loop.run_in_executor(None, next, chunks, end)
+                chunk = await asyncio.shield(pending)
+                pending = None
+                if chunk is end:
+                    break
+                yield chunk
+        finally:
+            # A generator cannot be closed while ``next`` still runs it in the
+            # executor: stop the pipeline, let that call return, then close
+            token.cancel()
+            pump_task.cancel()
+            if pending is not None:
+                await asyncio.gather(pending, return_exceptions=True)
+            await loop.run_in_executor(None, chunks.close)
+            token.release()
+
+    def _text_stream(self, fragments: Iterable[str], voice: Optional[str], kwargs: dict) -> Iterator[bytes]:
+        """Feed fragments to the provider's streamed text input under per-unit deadlines.
+
+        Fragments are passed through unchanged; a segmenter running alongside
+        finds the units and where they start in the streamed text. The timeout
+        starts when a unit's text is complete, so time spent waiting for the
+        source (e.g. LLM generation) never counts. A unit's deadline is met once
+        the provider reports a word boundary at or past the unit's start (through
+        the ``timeline`` it fills); providers that report no boundaries meet one
+        pending deadline per audio chunk received. Once the input has ended the
+        rest of the stream must finish within one timeout.
+        """
+        segmenter = UnitSegmenter(self.min_chars, self.max_chars)
+        timeout = kwargs.get("timeout", getattr(self.provider, "timeout", None))
+        token = CancellationToken(parent=kwargs.get("cancel_token"))
+        progress = kwargs.get("timeline")
+        if progress is None:
+            progress = WordTimeline()
+        reported_before = len(progress)
+        kwargs = {**kwargs, "cancel_token": token, "timeout": None, "timeline": progress}
+
+        # (start offset, deadline) of units with no audio yet, oldest first
+        pending: deque[tuple[int, float]] = deque()
+        final_deadline: list[Optional[float]] = [None]
+        lock = threading.Lock()
+        timed_out = threading.Event()
+        done = threading.Event()
+
+        def begin(units: list[str]) -> None:
+            self.stats.units += len(units)
+            if units and timeout and timeout > 0:
+                deadline = time.monotonic() + timeout
+                with lock:
+                    for start in segmenter.offsets[-len(units):]:
+                        pending.append((start, deadline))
+
+        def counted_fragments() -> Iterator[str]:
+            for fragment in fragments:
+                yield fragment
+                begin(segmenter.feed(fragment))
+            begin(segmenter.flush())
+            if timeout and timeout > 0:
+                final_deadline[0] = time.monotonic() + timeout
+
+        def expired() -> bool:
+            now = time.monotonic()
+            with lock:
+                if len(progress) > reported_before:
+                    reached = progress.text_offsets[-1]
+                    while pending and pending[0][0] <= reached:
+                        pending.popleft()
+                if pending and now >= pending[0][1]:
+                    return True
+            return final_deadline[0] is not None and now >= final_deadline[0]
+
+        def watchdog() -> None:
+            while not done.wait(0.05):
+                if expired():
+                    timed_out.set()
+                    token.cancel()
+                    return
+
+        watcher = threading.Thread(target=watchdog, name="tts-incremental-watchdog", daemon=True)
+        watcher.start()
+        try:
+            for chunk in self.provider.stream_text(counted_fragments(), voice=voice, **kwargs):
+                if len(progress) == reported_before:
+                    with lock:
+                        if pending:
+                            pending.popleft()
+                yield chunk
+        except SynthesisCancelled:
+            if timed_out.is_set():
+                raise SynthesisTimeout("Speech synthesis exceeded its per-unit deadline") from None
+            raise
+        finally:
+            done.set()
+            token.release()
+
+    def _pipeline(self, fragments: Iterable[str], voice: Optional[str], kwargs: dict) -> Iterator[bytes]:
+        """Pipeline per-unit synthesize calls while fragments keep arriving.
+
+        A feeder thread consumes the (possibly slow) fragment source and
+        dispatches each completed unit immediately; the caller's thread
+        yields results strictly in unit order.
+        """
+        segmenter = UnitSegmenter(self.min_chars, self.max_chars)
+        token = CancellationToken(parent=kwargs.get("cancel_token"))
+        kwargs = {**kwargs, "cancel_token": token}
+        futures: queue.Queue = queue.Queue()
+        end = object()
+
+        work_dir = Path(tempfile.mkdtemp(prefix="incremental_"))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def dispatch(unit: str) -> None:
+            index = self.stats.units
+            self.stats.units += 1
+            futures.put(executor.submit(self._render, index, unit, work_dir, voice, kwargs))
+
+        def feed() -> None:
+            try:
+                for fragment in fragments:
+                    if token.cancelled:
+                        return
+                    for unit in segmenter.feed(fragment):
+                        dispatch(unit)
+                for unit in segmenter.flush():
+                    dispatch(unit)
+            except BaseException as e:
+                failed: Future = Future()
+                failed.set_exception(e)
+                futures.put(failed)
+            finally:
+                futures.put(end)
+
+        feeder = threading.Thread(target=feed, name="tts-incremental-feeder", daemon=True)
+        feeder.start()
+        try:
+            while (future := futures.get()) is not end:
+                yield future.result()
+        finally:
+            token.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            token.release()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _render(self, index: int, unit: str, work_dir: Path, voice: Optional[str], kwargs: dict) -> bytes:
+        """Synthesize one unit into memory."""
+        output_path = work_dir / f"unit_{index:05d}.{self.output_format}"
+        result_path = self.provider.synthesize(text=unit, output_path=output_path, voice=voice, **kwargs)
+        audio = result_path.read_bytes()
+        result_path.unlink(missing_ok=True)
+        return audio
@@ -0,0 +1,408 @@
+"""Per-sentence language detection and routing for multilingual plain text.
+
+Every sentence is classified locally (no network) by its script and, for
+Latin-script text, by function words and diacritics. Runs of sentences in the
+same language become segments, each spoken by the voice configured for its
+language. Segments are rendered concurrently and stitched in order, so a
+mixed-language document needs no hand-written ``<lang>``/``<voice>`` markup.
+"""
+
+import math
+import re
+import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.audio import bytes_duration, concat_audio
+from src.cancellation import CancellationToken
+from src.providers.base import TTSProvider
+from src.seek_index import SeekIndexBuilder, supports_seek_index
+from src.ssml import is_ssml
+from src.text import sentence_spans
+from src.timings import WordTimeline
+
+
+# Voices used for detected languages without a configured voice
+DEFAULT_VOICES = {
+    "en": "en-US-JennyNeural",
+    "fr": "fr-FR-DeniseNeural",
+    "es": "es-ES-ElviraNeural",
+    "de": "de-DE-KatjaNeural",
+    "it": "it-IT-ElsaNeural",
+    "pt": "pt-BR-FranciscaNeural",
+    "nl": "nl-NL-ColetteNeural",
+    "ru": "ru-RU-SvetlanaNeural",
+    "uk": "uk-UA-PolinaNeural",
+    "el": "el-GR-AthinaNeural",
+    "ar": "ar-SA-ZariyahNeural",
+    "he": "he-IL-HilaNeural",
+    "hi": "hi-IN-SwaraNeural",
+    "th": "th-TH-PremwadeeNeural",
+    "zh": "zh-CN-XiaoxiaoNeural",
+    "ja": "ja-JP-NanamiNeural",
+    "ko": "ko-KR-SunHiNeural",
+}
+
+# Unicode ranges of scripts that identify a language on their own
+_SCRIPTS = (
+    ("ja", ((0x3040, 0x30FF),)),
+    ("ko", ((0xAC00, 0xD7AF), (0x1100, 0x11FF), (0x3130, 0x318F))),
+    ("zh", ((0x4E00, 0x9FFF), (0x3400, 0x4DBF))),
+    ("ru", ((0x0400, 0x04FF),)),
+    ("el", ((0x0370, 0x03FF),)),
+    ("ar", ((0x0600, 0x06FF),)),
+    ("he", ((0x0590, 0x05FF),)),
+    ("hi", ((0x0900, 0x097F),)),
+    ("th", ((0x0E00, 0x0E7F),)),
+)
+
+# Letters only used by Ukrainian among Cyrillic languages
+_UKRAINIAN_LETTERS = set("іїєґІЇЄҐ")
+
+# Frequent function words (and greetings, which often stand alone). Words shared
+# between languages count for less (see ``_WORD_WEIGHTS``); Italian leaves out
+# "le", which is far more frequent in French
+_STOPWORDS = {
+    "en": set(
+        "the and is are was were of to in that it this with for you not have be "
+        "what which from they we will would there their can how hello thank thanks".split()
+    ),
+    "fr": set(
+        "le la les de des du un une et est sont je tu il elle nous vous ils pas que qui à a "
+        "dans pour avec sur ce cette au aux mais comment bonjour merci oui très "
+        "aujourd hui allez suis".split()
+    ),
+    "es": set(
+        "el la los las de del un una y es son que en por para con no se su al como está a mi "
+        "usted hoy hola gracias muy pero yo qué cómo buenos días".split()
+    ),
+    "de": set(
+        "der die das und ist sind nicht ein eine ich du er sie wir ihr mit auf für "
+        "von zu dem den wie geht ihnen heute guten tag danke hallo auch".split()
+    ),
+    "it": set(
+        "il lo gli di da de che è sono un una e a per con non mi ti si come sta oggi "
+        "buongiorno ciao grazie della sono anche molto questo".split()
+    ),
+    "pt": set(
+        "o os as de do da dos das um uma e a é são que em para com não se seu sua você "
+        "olá obrigado obrigada muito bom dia está hoje meu minha".split()
+    ),
+    "nl": set(
+        "de het een en is zijn niet ik jij hij zij wij met op voor van dat dit "
+        "hoe gaat goedemorgen dank hallo ook".split()
+    ),
+}
+
+# Letters that point to one Latin-script language
+_DIACRITICS = {
+    "fr": set("çàèùâêîôûëïœ"),
+    "es": set("ñ¿¡"),
+    "de": set("äöüß"),
+    "it": set("òì"),
+    "pt": set("ãõ"),
+}
+
+# Number of languages using each stopword or letter; a clue shared by n
+# languages scores 1/n, so words like "de" or "la" cannot outweigh a
+# language-specific word or diacritic
+_WORD_WEIGHTS = Counter(word for words in _STOPWORDS.values() for word in words)
+_LETTER_WEIGHTS = Counter(char for chars in _DIACRITICS.values() for char in chars)
+
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def _script_language(text: str) -> Optional[str]:
+    """Get the language implied by the dominant non-Latin script, if any."""
+    counts: Counter = Counter()
+    latin = 0
+    for char in text:
+        code = ord(char)
+        if char.isascii():
+            latin += char.isalpha()
+            continue
+        for language, ranges in _SCRIPTS:
+            if any(low <= code <= high for low, high in ranges):
+                counts[language] += 1
+                break
+        else:
+            latin += char.isalpha()
+
+    if not counts:
+        return None
+
+    # Kana marks Japanese even though most of its characters are Han
+    if counts["ja"]:
+        counts["ja"] += counts.pop("zh", 0)
+
+    language, count = counts.most_common(1)[0]
+    if count < latin:
+        return None
+    if language == "ru" and any(char in _UKRAINIAN_LETTERS for char in text):
+        return "uk"
+    return language
+
+
+def detect_language(text: str, candidates: Optional[Iterable[str]] = None) -> Optional[str]:
+    """Detect the language of a sentence.
+
+    Args:
+        text: A sentence of plain text
+        candidates: Language codes to choose from (default: all supported)
+
+    Returns:
+        ISO 639-1 language code, or None if the sentence gives no clear signal
+    """
+    allowed = set(candidates) if candidates is not None else None
+
+    language = _script_language(text)
+    if language is not None:
+        return language if allowed is None or language in allowed else None
+
+    lowered = text.lower()
+    words = _WORD.findall(lowered)
+    scores: Counter = Counter()
+    for language, stopwords in _STOPWORDS.items():
+        if allowed is not None and language not in allowed:
+            continue
+        letters = _DIACRITICS.get(language, ())
+        scores[language] = sum(1 / _WORD_WEIGHTS[word] for word in words if word in stopwords)
+        scores[language] += sum(1 / _LETTER_WEIGHTS[char] for char in lowered if char in letters)
+
+    ranked = scores.most_common(2)
+    if not ranked or ranked[0][1] == 0:
+        return None
+    if len(ranked) > 1 and math.isclose(ranked[0][1], ranked[1][1]):
+        return None
+    return ranked[0][0]
+
+
+def voice_locale(voice: str) -> str:
+    """Get the locale of a voice name, e.g. ``fr-FR-DeniseNeural`` -> ``fr-FR``."""
+    return "-".join(voice.split("-")[:2])
+
+
+def _voice_language(voice: str) -> Optional[str]:
+    """Get the language code of a voice name, or None if the name has no locale."""
+    locale = voice_locale(voice)
+    return locale.split("-")[0].lower() if "-" in locale else None
+
+
+@dataclass
+class LanguageSegment:
+    """A run of consecutive sentences in one language."""
+
+    index: int
+    language: str
+    voice: str
+    text: str
+    offset: int
+
+    @property
+    def locale(self) -> str:
+        """Locale of the segment's voice."""
+        return voice_locale(self.voice)
+
+
+class LanguageRouter:
+    """Split multilingual text by language and speak each part with a matching voice."""
+
+    def __init__(
+        self,
+        provider: TTSProvider,
+        voices: Optional[dict[str, str]] = None,
+        default_language: Optional[str] = None,
+        max_workers: int = 4
+    ):
+        """Initialize the router.
+
+        Args:
+            provider: TTS provider used for every segment
+            voices: Mapping of language code to voice name; languages missing
+                here use ``DEFAULT_VOICES``
+            default_language: Language (or locale) of sentences without a clear
+                signal (default: the provider's language)
+            max_workers: Maximum number of segments rendered concurrently
+
+        Raises:
+            ValueError: If no voice is known for the default language
+        """
+        self.provider = provider
+        self.max_workers = max_workers
+        self.output_format = getattr(provider, "output_format", "mp3")
+
+        default_language = default_language or getattr(provider, "language", "en-US")
+        self.default_language = default_language.split("-")[0].lower()
+
+        self.voices = dict(DEFAULT_VOICES)
+        default_voice = getattr(provider, "default_voice", None)
+        if default_voice:
+            self.voices[self.default_language] = default_voice
+        self.voices.update({language.lower(): voice for language, voice in (voices or {}).items()})
+
+        if self.default_language not in self.voices:
+            raise ValueError(
+                f"No voice for the default language '{self.default_language}'; "
+                f"set the provider's voice or add '{self.default_language}' to the language voices"
+            )
+
+    def plan(self, text: str, voice: Optional[str] = None) -> list[LanguageSegment]:
+        """Split text into language segments.
+
+        Sentences without a clear signal join the segment before them (or the
+        one after them at the start of the text). SSML documents already choose
+        their voices and are returned as a single segment.
+
+        Args:
+            text: Plain text or SSML
+            voice: Voice for the language of its locale (e.g. ``fr-FR-HenriNeural``
+                for French); names without a locale apply to the default
+                language (default: from the mapping)
+
+        Returns:
+            Segments in text order
+        """
+        voices = dict(self.voices)
+        if voice:
+            voices[_voice_language(voice) or self.default_language] = voice
+
+        if is_ssml(text):
+            return [LanguageSegment(0, self.default_language, voices[self.default_language], text, 0)]
+
+        # (language or None, start offset, end offset) per sentence
+        sentences = [
+            [detect_language(text[start:end], voices), start, end]
+            for start, end in sentence_spans(text)
+        ]
+
+        # Undetected sentences take the language of their neighbours
+        previous = None
+        for sentence in sentences:
+            if sentence[0] is None:
+                sentence[0] = previous
+            previous = sentence[0]
+        following = self.default_language
+        for sentence in reversed(sentences):
+            if sentence[0] is None:
+                sentence[0] = following
+            following = sentence[0]
+
+        segments: list[LanguageSegment] = []
+        for language, start, end in sentences:
+            if segments and segments[-1].language == language:
+                last = segments[-1]
+                last.text = text[last.offset:end]
+            else:
+                segments.append(LanguageSegment(len(segments), language, voices[language], text[start:end], start))
+
+        return segments
+
+    def synthesize(
+        self,
+        text: str,
+        output_path: Optional[Path] = None,
+        voice: Optional[str] = None,
+        seek_index: bool = False,
+        segments: Optional[list[LanguageSegment]] = None,
+        **kwargs
+    ) -> Path:
+        """Speak every language segment with its voice and stitch the audio.
+
+        Args:
+            text: Plain text or SSML
+            output_path: Output file path (default: auto-generated)
+            voice: Voice for the language of its locale (see ``plan``)
+            seek_index: Write a ``.seek`` sidecar with segment boundaries
+            segments: Segments already returned by ``plan`` for this text and
+                voice (default: planned here)
+            **kwargs: Additional provider-specific parameters. A ``timeline``
+                (``WordTimeline``) receives the word timing of every segment,
+                shifted to its place in the stitched output.
+
+        Returns:
+            Path to the stitched audio file
+        """
+        if segments is None:
+            segments = self.plan(text, voice)
+
+        output_dir = Path(getattr(self.provider, "output_dir", "output"))
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = output_dir / f"multilingual_{timestamp}.{self.output_format}"
+        elif not output_path.is_absolute():
+            output_path = output_dir / output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Remaining segments are cancelled as soon as one of them fails
+        token = CancellationToken(parent=kwargs.get("cancel_token"))
+        kwargs = {**kwargs, "cancel_token": token}
+        timeline = kwargs.pop("timeline", None)
+        timelines = [WordTimeline() if timeline is not None else None for _ in segments]
+
+        work_dir = Path(tempfile.mkdtemp(prefix="languages_"))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [
+                executor.submit(self._render, segment, work_dir, segment_timeline, kwargs)
+                for segment, segment_timeline in zip(segments, timelines)
+            ]
+            parts = [future.result() for future in futures]
+        finally:
+            token.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            token.release()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        output_path.write_bytes(concat_audio(parts, self.output_format))
+
+        if seek_index and supports_seek_index(self.output_format):
+            index_builder = SeekIndexBuilder(self.output_format)
+            for part in parts:
+                index_builder.add_part(part)
+            index_builder.write(output_path)
+
+        if timeline is not None:
+            audio_time = 0.0
+            for segment, part, segment_timeline in zip(segments, parts, timelines):
+                timeline.extend(segment_timeline, audio_time, segment.offset)
+                audio_time += bytes_duration(part, self.output_format) or 0.0
+
+        return output_path
+
+    def _render(
+        self,
+        segment: LanguageSegment,
+        work_dir: Path,
+        timeline: Optional[WordTimeline],
+        kwargs: dict
+    ) -> bytes:
+        """Synthesize one segment into memory.
+
+        Args:
+            segment: Segment to speak
+            work_dir: Scratch directory for the provider's output file
+            timeline: Timeline receiving the segment's word timing, if requested
+            kwargs: Provider-specific parameters
+
+        Returns:
+            Audio bytes of the segment
+        """
+        if timeline is not None:
+            kwargs = {**kwargs, "timeline": timeline}
+
+        output_path = work_dir / f"segment_{segment.index:05d}.{self.output_format}"
+        result_path = self.provider.synthesize(
+            text=segment.text,
+            output_path=output_path,
+            voice=segment.voice,
+            language=segment.locale,
+            **kwargs
+        )
+        audio = result_path.read_bytes()
+        result_path.unlink(missing_ok=True)
+        return audio
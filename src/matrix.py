@@ -0,0 +1,276 @@
+"""Fan-out matrix synthesis for comparing voices, styles and deployments."""
+
+import csv
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from typing import Optional
+
+from src.audio import audio_duration
+from src.config import settings
+from src.factory import ProviderFactory
+from src.providers.azure_openai import AzureOpenAIProvider
+from src.ssml import is_ssml, retarget_ssml, ssml_to_text
+
+
+@dataclass(frozen=True)
+class MatrixCell:
+    """One combination of provider, deployment, voice and style."""
+
+    provider: str
+    voice: str
+    deployment: Optional[str] = None
+    style: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        """Human-readable cell label."""
+        parts = [self.provider, self.deployment, self.voice, self.style]
+        return "/".join(part for part in parts if part)
+
+    def relative_path(self, output_format: str) -> Path:
+        """Get the output path of this cell inside the matrix directory.
+
+        Layout: ``azure-openai/<deployment>/<voice>.<fmt>`` and
+        ``azure-speech/<voice>/<style or default>.<fmt>``.
+
+        Args:
+            output_format: Audio file extension
+
+        Returns:
+            Relative path for the cell's audio file
+        """
+        if self.provider == "azure-openai":
+            return Path(self.provider) / (self.deployment or "default") / f"{self.voice}.{output_format}"
+        return Path(self.provider) / self.voice / f"{self.style or 'default'}.{output_format}"
+
+
+@dataclass
+class MatrixResult:
+    """Outcome of synthesizing a single matrix cell."""
+
+    cell: MatrixCell
+    path: Optional[Path] = None
+    latency: float = 0.0
+    size_bytes: int = 0
+    duration: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert the result to a JSON-serializable dictionary."""
+        return {
+            "provider": self.cell.provider,
+            "deployment": self.cell.deployment,
+            "voice": self.cell.voice,
+            "style": self.cell.style,
+            "path": str(self.path) if self.path else None,
+            "latency_s": round(self.latency, 3),
+            "size_bytes": self.size_bytes,
+            "duration_s": round(self.duration, 3) if self.duration is not None else None,
+            "error": self.error,
+        }
+
+
+@dataclass
+class MatrixSpec:
+    """Axes of a synthesis matrix.
+
+    Deployments only apply to azure-openai and styles only apply to
+    azure-speech. Voices are routed to the provider that knows them: the
+    Azure OpenAI voice names go to azure-openai, anything else to
+    azure-speech. The special voice name "all" expands to every Azure OpenAI
+    voice.
+    """
+
+    providers: list[str] = field(default_factory=lambda: [settings.default_provider])
+    deployments: list[str] = field(default_factory=list)
+    voices: list[str] = field(default_factory=list)
+    styles: list[str] = field(default_factory=list)
+
+    def cells(self) -> list[MatrixCell]:
+        """Expand the spec into the cartesian product of its axes.
+
+        Returns:
+            List of matrix cells
+        """
+        openai_voices = []
+        speech_voices = []
+        for voice in self.voices:
+            if voice == "all":
+                openai_voices.extend(AzureOpenAIProvider.VOICES)
+            elif voice in AzureOpenAIProvider.VOICES:
+                openai_voices.append(voice)
+            else:
+                speech_voices.append(voice)
+
+        cells = []
+        for provider in self.providers:
+            provider = provider.lower()
+            if provider == "azure-openai":
+                deployments = self.deployments or [settings.default_deployment]
+                for deployment in deployments:
+                    voices = openai_voices or [settings.get_deployment_config(deployment).get("voice", "alloy")]
+                    for voice in dict.fromkeys(voices):
+                        cells.append(MatrixCell(provider, voice, deployment=deployment))
+            elif provider == "azure-speech":
+                voices = speech_voices or [settings.azure_speech_voice]
+                styles = self.styles or [None]
+                for voice, style in product(dict.fromkeys(voices), dict.fromkeys(styles)):
+                    cells.append(MatrixCell(provider, voice, style=style))
+            else:
+                available = ", ".join(ProviderFactory.get_available_providers())
+                raise ValueError(f"Unknown provider '{provider}'. Available providers: {available}")
+
+        return cells
+
+
+class MatrixRunner:
+    """Render one script across every cell of a matrix concurrently."""
+
+    def __init__(
+        self,
+        text: str,
+        output_dir: Optional[Path] = None,
+        concurrency: int = 4,
+        speed: float = 1.0,
+        **kwargs
+    ):
+        """Initialize the runner.
+
+        The input is preprocessed once here: SSML is detected and a plain
+        text rendition is prepared for providers that do not accept markup.
+        For azure-speech cells, SSML input is rewritten to the cell's voice
+        and style (see ``retarget_ssml``).
+
+        Args:
+            text: Script to synthesize (plain text or SSML)
+            output_dir: Matrix output directory (default: output/matrix_<timestamp>)
+            concurrency: Maximum number of cells synthesized at once
+            speed: Speech speed for azure-openai cells
+            **kwargs: Additional azure-speech parameters (rate, pitch)
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        if output_dir is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_dir = Path(settings.output_dir) / f"matrix_{timestamp}"
+
+        self.text = text
+        self.is_ssml = is_ssml(text)
+        self.plain_text = ssml_to_text(text) if self.is_ssml else text
+        self.output_dir = output_dir.resolve()
+        self.concurrency = concurrency
+        self.speed = speed
+        self.kwargs = kwargs
+
+    def run(self, cells: list[MatrixCell]) -> list[MatrixResult]:
+        """Synthesize all cells and write the comparison report.
+
+        Args:
+            cells: Matrix cells to render
+
+        Returns:
+            Results in the same order as the cells
+        """
+        results: dict[MatrixCell, MatrixResult] = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {executor.submit(self._run_cell, cell): cell for cell in cells}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.cell] = result
+                status = "✗" if result.error else "✓"
+                print(f"  {status} {result.cell.label} ({result.latency:.2f}s)")
+
+        ordered = [results[cell] for cell in cells]
+        self.write_report(ordered)
+        return ordered
+
+    def _run_cell(self, cell: MatrixCell) -> MatrixResult:
+        """Synthesize a single cell.
+
+        A provider instance is created per cell because providers keep
+        per-call state (e.g. the Speech voice name) on the instance.
+
+        Args:
+            cell: Matrix cell to render
+
+        Returns:
+            Result of the cell; failures are recorded instead of raised
+        """
+        result = MatrixResult(cell)
+        output_path = self.output_dir / cell.relative_path(settings.output_format)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if cell.provider == "azure-openai":
+            text = self.plain_text
+            synth_kwargs = {"speed": self.speed}
+        elif self.is_ssml:
+            # SSML picks its own voice and style, so the cell's are written into it
+            text = retarget_ssml(self.text, cell.voice, cell.style)
+            synth_kwargs = dict(self.kwargs)
+        else:
+            text = self.text
+            synth_kwargs = dict(self.kwargs)
+            if cell.style:
+                synth_kwargs["style"] = cell.style
+
+        start = time.perf_counter()
+        try:
+            tts_provider = ProviderFactory.create(cell.provider, cell.deployment)
+            result.path = tts_provider.synthesize(
+                text=text,
+                output_path=output_path,
+                voice=cell.voice,
+                **synth_kwargs
+            )
+        except Exception as e:
+            result.error = str(e)
+        result.latency = time.perf_counter() - start
+
+        if result.path is not None and result.path.exists():
+            result.size_bytes = result.path.stat().st_size
+            try:
+                result.duration = audio_duration(result.path)
+            except Exception:
+                result.duration = None
+
+        return result
+
+    def write_report(self, results: list[MatrixResult]) -> Path:
+        """Write the comparison report as JSON and CSV.
+
+        Args:
+            results: Cell results
+
+        Returns:
+            Path to the JSON report
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        rows = [result.to_dict() for result in results]
+
+        report_path = self.output_dir / "report.json"
+        report_path.write_text(
+            json.dumps(
+                {
+                    "input_characters": len(self.text),
+                    "ssml": self.is_ssml,
+                    "concurrency": self.concurrency,
+                    "cells": rows,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+        with open(self.output_dir / "report.csv", "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(rows[0].keys()) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+
+        return report_path
@@ -0,0 +1,272 @@
+"""Pre-flight planning: billable characters, audio duration and schedule estimates.
+
+All figures are estimates computed locally, without any network call, so
+schedulers can size runs and apply admission control before synthesis.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from src.ssml import is_ssml, local_name, parse_break, parse_rate
+from src.text import chunk_text
+
+
+# Average speaking speed at rate 1.0, in characters per second
+CHARS_PER_SECOND = 14.0
+# Ideographic / syllabic scripts carry more speech per character
+CJK_CHARS_PER_SECOND = 4.5
+
+# Largest input per request: Azure OpenAI accepts 4096 characters; Azure
+# Speech requests are kept well below its 10 minute audio limit
+MAX_CHUNK_CHARS = {
+    "azure-openai": 4096,
+    "azure-speech": 5000,
+}
+
+# Latency model per request: fixed overhead (s) + audio seconds * real-time factor
+LATENCY_MODEL = {
+    "azure-openai": (0.8, 0.25),
+    "azure-speech": (0.3, 0.1),
+}
+
+
+def is_cjk(char: str) -> bool:
+    """Check whether a character is a CJK ideograph (billed twice by Azure AI Speech)."""
+    name = unicodedata.name(char, "")
+    return name.startswith(("CJK UNIFIED IDEOGRAPH", "CJK COMPATIBILITY IDEOGRAPH"))
+
+
+def is_syllabic(char: str) -> bool:
+    """Check whether a character is an ideograph, kana or Hangul syllable."""
+    name = unicodedata.name(char, "")
+    return is_cjk(char) or name.startswith(("HIRAGANA", "KATAKANA", "HANGUL"))
+
+
+def speaking_seconds(text: str, rate: float = 1.0) -> float:
+    """Estimate how long it takes to speak a text.
+
+    Args:
+        text: Plain text
+        rate: Speaking rate multiplier
+
+    Returns:
+        Estimated speech duration in seconds (pauses excluded)
+    """
+    cjk = sum(1 for char in text if is_syllabic(char))
+    other = len(" ".join(text.split())) - cjk
+    seconds = other / CHARS_PER_SECOND + cjk / CJK_CHARS_PER_SECOND
+    return seconds / max(rate, 0.1)
+
+
+def billable_characters(text: str, provider: str) -> int:
+    """Count the characters a request is billed for.
+
+    Azure AI Speech bills SSML markup except the ``speak`` and ``voice``
+    tags themselves (and comments), and counts each CJK ideograph twice
+    (kana and Hangul count once).
+    Azure OpenAI bills the input exactly as sent.
+
+    Args:
+        text: Plain text or SSML
+        provider: Provider name
+
+    Returns:
+        Estimated billable character count
+    """
+    if provider != "azure-speech":
+        return len(text)
+
+    if is_ssml(text):
+        text = re.sub(r"<\?xml[^>]*\?>|<!--.*?-->|</?(speak|voice)\b[^>]*>", "", text, flags=re.DOTALL)
+
+    return len(text) + sum(1 for char in text if is_cjk(char))
+
+
+@dataclass
+class InputPlan:
+    """Plan for a single input."""
+
+    name: str
+    ssml: bool
+    billable_chars: int
+    spoken_chars: int
+    break_seconds: float
+    audio_seconds: float
+    chunks: list[int] = field(default_factory=list)
+
+
+@dataclass
+class RunPlan:
+    """Plan for a whole run."""
+
+    provider: str
+    concurrency: int
+    quota_rpm: Optional[int]
+    inputs: list[InputPlan] = field(default_factory=list)
+    billable_chars: int = 0
+    audio_seconds: float = 0.0
+    requests: int = 0
+    wall_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert the plan to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def _analyze_ssml(ssml: str, rate: float) -> tuple[int, float, float]:
+    """Walk an SSML document, applying nested prosody rates and breaks.
+
+    Args:
+        ssml: SSML document
+        rate: Base rate multiplier
+
+    Returns:
+        Tuple of (spoken characters, break seconds, audio seconds)
+    """
+    try:
+        root = ET.fromstring(ssml.strip().encode("utf-8"))
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid SSML: {e}") from e
+
+    totals = {"chars": 0, "breaks": 0.0, "speech": 0.0}
+
+    def add_text(text: Optional[str], current_rate: float) -> None:
+        if text and text.strip():
+            totals["chars"] += len(" ".join(text.split()))
+            totals["speech"] += speaking_seconds(text, current_rate)
+
+    def walk(element: ET.Element, current_rate: float) -> None:
+        name = local_name(element.tag)
+        if name == "break":
+            totals["breaks"] += parse_break(element.attrib)
+        elif name == "prosody" and "rate" in element.attrib:
+            current_rate *= parse_rate(element.attrib["rate"])
+
+        add_text(element.text, current_rate)
+        for child in element:
+            walk(child, current_rate)
+            # Tail text belongs to the parent's prosody
+            add_text(child.tail, current_rate)
+
+    walk(root, rate)
+    return totals["chars"], totals["breaks"], totals["speech"] + totals["breaks"]
+
+
+def plan_input(
+    text: str,
+    provider: str,
+    rate: float = 1.0,
+    name: str = "input",
+    max_chunk_chars: Optional[int] = None
+) -> InputPlan:
+    """Plan a single input.
+
+    Args:
+        text: Plain text or SSML
+        provider: Provider name
+        rate: Speaking rate (speech rate or OpenAI speed)
+        name: Input name for reporting
+        max_chunk_chars: Chunk size limit (default: provider limit)
+
+    Returns:
+        Input plan
+    """
+    max_chunk_chars = max_chunk_chars or MAX_CHUNK_CHARS.get(provider, 4096)
+    billable = billable_characters(text, provider)
+
+    if is_ssml(text):
+        spoken, breaks, audio = _analyze_ssml(text, rate)
+        # SSML documents cannot be split without breaking their markup
+        chunks = [billable]
+        return InputPlan(name, True, billable, spoken, breaks, audio, chunks)
+
+    chunks = [len(chunk) for chunk in chunk_text(text, max_chunk_chars)]
+    audio = speaking_seconds(text, rate)
+    return InputPlan(name, False, billable, len(" ".join(text.split())), 0.0, audio, chunks)
+
+
+def estimate_wall_time(
+    chunk_seconds: list[float],
+    provider: str,
+    concurrency: int,
+    quota_rpm: Optional[int] = None
+) -> float:
+    """Simulate dispatching chunks over a worker pool and a request quota.
+
+    Args:
+        chunk_seconds: Estimated audio seconds of every chunk, in dispatch order
+        provider: Provider name (selects the latency model)
+        concurrency: Number of concurrent requests
+        quota_rpm: Requests-per-minute quota (None: unlimited)
+
+    Returns:
+        Estimated wall-clock seconds until the last chunk completes
+    """
+    if not chunk_seconds:
+        return 0.0
+
+    overhead, real_time_factor = LATENCY_MODEL.get(provider, (0.5, 0.2))
+    spacing = 60.0 / quota_rpm if quota_rpm else 0.0
+
+    workers = [0.0] * max(concurrency, 1)
+    finish = 0.0
+    for index, seconds in enumerate(chunk_seconds):
+        free_at = heapq.heappop(workers)
+        start = max(free_at, index * spacing)
+        end = start + overhead + seconds * real_time_factor
+        heapq.heappush(workers, end)
+        finish = max(finish, end)
+
+    return finish
+
+
+def plan_run(
+    inputs: list[tuple[str, str]],
+    provider: str,
+    rate: float = 1.0,
+    concurrency: int = 4,
+    quota_rpm: Optional[int] = None,
+    max_chunk_chars: Optional[int] = None
+) -> RunPlan:
+    """Plan a run over several inputs.
+
+    Args:
+        inputs: List of (name, text) pairs
+        provider: Provider name
+        rate: Speaking rate (speech rate or OpenAI speed)
+        concurrency: Number of concurrent requests
+        quota_rpm: Requests-per-minute quota (None: unlimited)
+        max_chunk_chars: Chunk size limit (default: provider limit)
+
+    Returns:
+        Run plan with totals and estimated wall-clock time
+    """
+    run = RunPlan(provider, concurrency, quota_rpm)
+    chunk_seconds = []
+
+    for name, text in inputs:
+        plan = plan_input(text, provider, rate, name, max_chunk_chars)
+        run.inputs.append(plan)
+        run.billable_chars += plan.billable_chars
+        run.audio_seconds += plan.audio_seconds
+        run.requests += len(plan.chunks)
+
+        # Spread the input's audio over its chunks by size
+        total_chars = sum(plan.chunks) or 1
+        chunk_seconds.extend(plan.audio_seconds * chars / total_chars for chars in plan.chunks)
+
+    run.wall_seconds = estimate_wall_time(chunk_seconds, provider, concurrency, quota_rpm)
+    return run
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as h:mm:ss or m:ss."""
+    seconds = int(math.ceil(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
@@ -0,0 +1,327 @@
+"""Built-in profiling for the synthesis pipeline.
+
+A ``Profiler`` combines three views of a run:
+
+- wall-clock spans around pipeline stages (startup, provider setup, SSML
+  building, network waits, disk writes), nested per thread
+- cProfile function statistics of the thread that started profiling
+- a sampling thread that records the Python stack of every thread, written
+  as collapsed stacks (``frame;frame;frame count``) for flamegraph.pl,
+  speedscope or inferno
+
+plus tracemalloc allocation peaks. Instrumented code calls the module-level
+``span`` and ``record`` helpers; while no profiler is active they return
+immediately, so instrumentation costs a global lookup per call.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+# Process start as seen by profiling: main.py imports this module first
+STARTED_AT = time.perf_counter()
+
+# Startup stages finished before any profiler exists (name -> perf_counter value)
+milestones: dict[str, float] = {}
+
+# Profiler receiving spans, or None while profiling is disabled
+_active: Optional["Profiler"] = None
+
+_DISABLED = nullcontext()
+
+# Report limits
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 10
+
+
+def active() -> Optional["Profiler"]:
+    """Get the running profiler, or None while profiling is disabled."""
+    return _active
+
+
+def span(name: str):
+    """Time a pipeline stage if profiling is enabled.
+
+    Args:
+        name: Stage name, nested under the thread's enclosing span
+
+    Returns:
+        Context manager timing the stage (a no-op while disabled)
+    """
+    profiler = _active
+    if profiler is None:
+        return _DISABLED
+    return profiler.span(name)
+
+
+def record(name: str, start: float, end: float) -> None:
+    """Record a stage measured elsewhere if profiling is enabled.
+
+    Args:
+        name: Stage name, nested under the thread's enclosing span
+        start: ``time.perf_counter()`` value at the start of the stage
+        end: ``time.perf_counter()`` value at the end of the stage
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.record(name, start, end)
+
+
+def milestone(name: str) -> None:
+    """Note when a startup stage finished, for the startup report of ``--profile``.
+
+    Args:
+        name: Milestone name (e.g. "settings")
+    """
+    milestones.setdefault(name, time.perf_counter())
+
+
+def _frame_label(frame) -> str:
+    """Label a stack frame as ``function (file.py:line)``."""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """Collect spans, function statistics, stack samples and allocations for a run."""
+
+    def __init__(self, cpu: bool = True, memory: bool = True, sample_interval: float = 0.005):
+        """Initialize the profiler.
+
+        Args:
+            cpu: Run cProfile on the starting thread
+            memory: Trace allocations with tracemalloc
+            sample_interval: Seconds between stack samples (0 disables sampling)
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.sample_interval = sample_interval
+
+        # (thread name, span path, start, end)
+        self.spans: list[tuple[str, str, float, float]] = []
+        self.samples: Counter = Counter()
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+        self._stacks: dict[int, list[str]] = {}
+        self._profile: Optional[cProfile.Profile] = None
+        self._stats: Optional[pstats.Stats] = None
+        self._memory_peak = 0
+        self._allocations: list[tracemalloc.Statistic] = []
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def duration(self) -> float:
+        """Profiled wall-clock time in seconds."""
+        if self.started_at is None:
+            return 0.0
+        return (self.stopped_at or time.perf_counter()) - self.started_at
+
+    def start(self) -> None:
+        """Start profiling and make this the active profiler."""
+        global _active
+
+        self.started_at = time.perf_counter()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.sample_interval > 0:
+            self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+            self._sampler.start()
+        if self.cpu:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        _active = self
+
+    def stop(self) -> None:
+        """Stop profiling and collect the results."""
+        global _active
+
+        if _active is self:
+            _active = None
+
+        if self._profile is not None:
+            self._profile.disable()
+            self._stats = pstats.Stats(self._profile, stream=io.StringIO())
+            self._profile = None
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+        if self.memory and tracemalloc.is_tracing():
+            self._memory_peak = tracemalloc.get_traced_memory()[1]
+            # Leave out the profiler's own bookkeeping
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, module.__file__)
+                for module in (cProfile, pstats, tracemalloc, sys.modules[__name__])
+            ])
+            self._allocations = snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+            tracemalloc.stop()
+
+        self.stopped_at = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a stage, nested under the current thread's enclosing span.
+
+        Args:
+            name: Stage name
+        """
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            path = ";".join(stack)
+            stack.pop()
+            self.spans.append((threading.current_thread().name, path, start, end))
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Record a stage measured elsewhere.
+
+        Args:
+            name: Stage name; ``;`` separates nested names
+            start: ``time.perf_counter()`` value at the start of the stage
+            end: ``time.perf_counter()`` value at the end of the stage
+        """
+        stack = self._stacks.get(threading.get_ident(), [])
+        path = ";".join(stack + [name])
+        self.spans.append((threading.current_thread().name, path, start, end))
+
+    def _sample(self) -> None:
+        """Record the stack of every other thread until profiling stops."""
+        own_ident = threading.get_ident()
+
+        while not self._stop_sampling.wait(self.sample_interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+
+                frames = []
+                while frame is not None:
+                    frames.append(_frame_label(frame))
+                    frame = frame.f_back
+                frames.reverse()
+
+                # Prefix with the thread and its open spans so stages group together
+                prefix = [names.get(ident, str(ident))] + list(self._stacks.get(ident, ()))
+                self.samples[";".join(prefix + frames)] += 1
+
+    def collapsed_stacks(self) -> str:
+        """Render the stack samples in collapsed-stack format.
+
+        Returns:
+            One ``frame;frame;frame count`` line per distinct stack
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+    def span_summary(self) -> list[tuple[str, int, float, float, float]]:
+        """Aggregate spans by stage.
+
+        Returns:
+            List of (span path, count, total, mean, max) in seconds, ordered
+            as a tree: stages by first start, each followed by its children
+        """
+        stages: dict[str, list] = {}
+        for _, path, start, end in sorted(self.spans, key=lambda item: item[2]):
+            elapsed = end - start
+            stage = stages.setdefault(path, [0, 0.0, 0.0, start])
+            stage[0] += 1
+            stage[1] += elapsed
+            stage[2] = max(stage[2], elapsed)
+
+        def tree_key(path: str) -> tuple:
+            names = path.split(";")
+            prefixes = (";".join(names[:depth]) for depth in range(1, len(names) + 1))
+            return tuple(stages[prefix][3] if prefix in stages else stages[path][3] for prefix in prefixes)
+
+        return [
+            (path, stages[path][0], stages[path][1], stages[path][1] / stages[path][0], stages[path][2])
+            for path in sorted(stages, key=tree_key)
+        ]
+
+    def report(self) -> str:
+        """Render a text report of the run.
+
+        Returns:
+            Report with stage timings, top functions and allocations
+        """
+        lines = [f"Profiled wall-clock time: {self.duration:.3f}s", ""]
+
+        lines.append("Stages (spans in worker threads overlap, so totals can exceed wall time)")
+        lines.append(f"  {'stage':<56} {'count':>6} {'total':>9} {'mean':>9} {'max':>9}")
+        for path, count, total, mean, longest in self.span_summary():
+            depth = path.count(";")
+            label = "  " * depth + path.rsplit(";", 1)[-1]
+            lines.append(f"  {label:<56} {count:>6} {total:>8.3f}s {mean:>8.3f}s {longest:>8.3f}s")
+        lines.append("")
+
+        if self._stats is not None:
+            lines.append(f"Top {TOP_FUNCTIONS} functions by cumulative time (profiling thread only)")
+            stream = io.StringIO()
+            self._stats.stream = stream
+            self._stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            lines.extend("  " + line for line in stream.getvalue().strip().splitlines())
+            lines.append("")
+
+        if self.memory:
+            lines.append(f"Peak traced memory: {self._memory_peak / 1024 / 1024:.1f} MiB")
+            lines.append(f"Top {TOP_ALLOCATIONS} allocation sites still live at the end of the run")
+            for statistic in self._allocations:
+                lines.append(f"  {statistic}")
+            lines.append("")
+
+        if self.samples:
+            lines.append(f"Stack samples: {sum(self.samples.values())} "
+                         f"(every {self.sample_interval * 1000:.0f} ms, all threads)")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, prefix: Path) -> list[Path]:
+        """Write the report, collapsed stacks and raw cProfile data.
+
+        Args:
+            prefix: Path prefix; ``.txt``, ``.folded`` and ``.pstats`` are appended
+
+        Returns:
+            Paths of the written files
+        """
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        paths = []
+
+        report_path = prefix.with_name(prefix.name + ".txt")
+        report_path.write_text(self.report(), encoding="utf-8")
+        paths.append(report_path)
+
+        if self.samples:
+            folded_path = prefix.with_name(prefix.name + ".folded")
+            folded_path.write_text(self.collapsed_stacks(), encoding="utf-8")
+            paths.append(folded_path)
+
+        if self._stats is not None:
+            stats_path = prefix.with_name(prefix.name + ".pstats")
+            self._stats.dump_stats(str(stats_path))
+            paths.append(stats_path)
+
+        return paths
@@ -0,0 +1,274 @@
+"""Time-to-first-audio oriented progressive synthesis.
+
+The input is cut into a deliberately short first segment (first clause or
+sentence) followed by geometrically larger segments. The first segment is
+dispatched immediately and the rest are dispatched concurrently, so later
+audio is rendered while earlier audio is already being consumed. Segments
+are delivered in order as a stream.
+"""
+
+import shutil
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.audio import bytes_duration
+from src.cancellation import CancellationToken
+from src.providers.base import TTSProvider
+from src.ssml import is_ssml
+from src.text import Span, clause_spans, sentence_spans
+from src.timings import WordTimeline
+
+
+@dataclass
+class Segment:
+    """A synthesized segment delivered by the progressive stream."""
+
+    index: int
+    text: str
+    audio: bytes
+    latency: float
+    timeline: Optional[WordTimeline] = None
+    offset: int = 0
+
+
+@dataclass
+class ProgressiveStats:
+    """Timing of a progressive synthesis run."""
+
+    segments: int = 0
+    time_to_first_audio: Optional[float] = None
+    total_time: float = 0.0
+    segment_latencies: list[float] = field(default_factory=list)
+
+
+def plan_segment_spans(
+    text: str,
+    first_segment_chars: int = 80,
+    growth: float = 2.0,
+    max_segment_chars: int = 4000
+) -> list[Span]:
+    """Cut text into a short first segment and geometrically larger ones.
+
+    Args:
+        text: Plain text to segment
+        first_segment_chars: Target size of the first segment; when the first
+            sentence is longer, only its leading clauses are used
+        growth: Size multiplier from one segment to the next
+        max_segment_chars: Upper bound for any segment built from whole sentences
+
+    Returns:
+        List of (start, end) offsets of the segments in playback order
+    """
+    sentences = sentence_spans(text)
+    if not sentences:
+        return []
+
+    # First segment: first sentence, or its leading clauses if that is too
+    # long (very short clauses such as "Well," are merged with the next one)
+    first = sentences.pop(0)
+    if first[1] - first[0] > first_segment_chars:
+        clauses = clause_spans(text, *first)
+        taken = 1
+        while taken < len(clauses) and clauses[taken - 1][1] - first[0] < first_segment_chars // 3:
+            taken += 1
+        if taken < len(clauses):
+            sentences.insert(0, (clauses[taken][0], first[1]))
+            first = (first[0], clauses[taken - 1][1])
+
+    segments = [first]
+    target = max(first[1] - first[0], 1) * growth
+    current: Optional[Span] = None
+
+    for start, end in sentences:
+        if current and end - current[0] > max_segment_chars:
+            segments.append(current)
+            target *= growth
+            current = None
+
+        current = (current[0], end) if current else (start, end)
+
+        if current[1] - current[0] >= target:
+            segments.append(current)
+            target *= growth
+            current = None
+
+    if current:
+        segments.append(current)
+
+    return segments
+
+
+def plan_segments(
+    text: str,
+    first_segment_chars: int = 80,
+    growth: float = 2.0,
+    max_segment_chars: int = 4000
+) -> list[str]:
+    """Cut text into a short first segment and geometrically larger ones.
+
+    Args:
+        text: Plain text to segment
+        first_segment_chars: Target size of the first segment
+        growth: Size multiplier from one segment to the next
+        max_segment_chars: Upper bound for any segment built from whole sentences
+
+    Returns:
+        List of text segments in playback order (slices of ``text``, see
+        ``plan_segment_spans``)
+    """
+    return [
+        text[start:end]
+        for start, end in plan_segment_spans(text, first_segment_chars, growth, max_segment_chars)
+    ]
+
+
+class ProgressiveSynthesizer:
+    """Progressive, ordered segment streaming on top of ``TTSProvider.synthesize``."""
+
+    def __init__(
+        self,
+        provider: TTSProvider,
+        max_workers: int = 4,
+        first_segment_chars: int = 80,
+        growth: float = 2.0,
+        max_segment_chars: int = 4000
+    ):
+        """Initialize the progressive synthesizer.
+
+        Args:
+            provider: TTS provider used for every segment
+            max_workers: Maximum number of segments rendered concurrently
+            first_segment_chars: Target size of the first segment
+            growth: Size multiplier from one segment to the next
+            max_segment_chars: Upper bound for segments built from whole sentences
+        """
+        self.provider = provider
+        self.max_workers = max_workers
+        self.first_segment_chars = first_segment_chars
+        self.growth = growth
+        self.max_segment_chars = max_segment_chars
+        self.output_format = getattr(provider, "output_format", "mp3")
+        self.stats = ProgressiveStats()
+
+    def segments_for(self, text: str) -> list[str]:
+        """Get the segment plan for a text.
+
+        SSML documents cannot be cut without breaking their markup and are
+        sent as a single segment.
+
+        Args:
+            text: Plain text or SSML
+
+        Returns:
+            List of segments
+        """
+        return [text[start:end] for start, end in self.spans_for(text)]
+
+    def spans_for(self, text: str) -> list[Span]:
+        """Get the segment plan for a text as (start, end) offsets.
+
+        Args:
+            text: Plain text or SSML
+
+        Returns:
+            List of segment spans in playback order
+        """
+        if is_ssml(text):
+            return [(0, len(text))]
+        return plan_segment_spans(text, self.first_segment_chars, self.growth, self.max_segment_chars)
+
+    def stream(self, text: str, voice: Optional[str] = None, **kwargs) -> Iterator[Segment]:
+        """Synthesize text progressively and yield segments in playback order.
+
+        Args:
+            text: Plain text or SSML
+            voice: Voice to use (defaults to provider config)
+            **kwargs: Additional provider-specific parameters. A ``timeline``
+                (``WordTimeline``) receives the word timing of every segment,
+                shifted to its place in the stitched output.
+
+        Returns:
+            Iterator of synthesized segments; ``self.stats`` is updated as
+            segments are delivered
+        """
+        spans = self.spans_for(text)
+        self.stats = ProgressiveStats(segments=len(spans))
+        start = time.perf_counter()
+
+        # Segments still rendering are cancelled if the consumer stops early
+        token = CancellationToken(parent=kwargs.get("cancel_token"))
+        kwargs = {**kwargs, "cancel_token": token}
+
+        # Each segment gets its own timeline, merged in playback order
+        timeline = kwargs.pop("timeline", None)
+        audio_time = 0.0
+
+        work_dir = Path(tempfile.mkdtemp(prefix="progressive_"))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            # Submission order is dispatch order: the short first segment
+            # always gets a worker straight away
+            futures: list[Future] = [
+                executor.submit(
+                    self._render, index, text, span, work_dir, start, voice,
+                    {**kwargs, "timeline": WordTimeline()} if timeline is not None else kwargs
+                )
+                for index, span in enumerate(spans)
+            ]
+
+            for future in futures:
+                segment = future.result()
+                if self.stats.time_to_first_audio is None:
+                    self.stats.time_to_first_audio = time.perf_counter() - start
+                self.stats.segment_latencies.append(segment.latency)
+                if timeline is not None:
+                    timeline.extend(segment.timeline, audio_time, segment.offset)
+                    audio_time += bytes_duration(segment.audio, self.output_format) or 0.0
+                yield segment
+
+            self.stats.total_time = time.perf_counter() - start
+        finally:
+            token.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            token.release()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _render(
+        self,
+        index: int,
+        source: str,
+        span: Span,
+        work_dir: Path,
+        start: float,
+        voice: Optional[str],
+        kwargs: dict
+    ) -> Segment:
+        """Synthesize one segment into memory.
+
+        Args:
+            index: Segment position
+            source: Full input text
+            span: (start, end) offsets of the segment in ``source``
+            work_dir: Scratch directory for the provider's output file
+            start: Stream start time (perf_counter)
+            voice: Voice to use
+            kwargs: Provider-specific parameters
+
+        Returns:
+            Synthesized segment
+        """
+        text = source[span[0]:span[1]]
+        output_path = work_dir / f"segment_{index:05d}.{self.output_format}"
+        result_path = self.provider.synthesize(
+            text=text,
+            output_path=output_path,
+            voice=voice,
+            **kwargs
+        )
+        audio = result_path.read_bytes()
+        result_path.unlink(missing_ok=True)
+        return Segment(index, text, audio, time.perf_counter() - start, kwargs.get("timeline"), span[0])
@@ -2,15 +2,22 @@
 
 from pathlib import Path
 from typing import Optional
+import os
 import time
 
-from openai import AzureOpenAI
+from openai import APITimeoutError, AzureOpenAI
+from src import profiling
+from src.cancellation import CancellationToken, SynthesisTimeout
 from src.providers.base import TTSProvider
+from src.seek_index import SeekIndexBuilder, supports_seek_index
 
 
 class AzureOpenAIProvider(TTSProvider):
     """Azure OpenAI TTS provider implementation."""
     
+    # Azure OpenAI TTS supports these voices
+    VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+    
     def __init__(self, config: dict):
         """Initialize Azure OpenAI provider.
         
@@ -19,11 +26,19 @@ class AzureOpenAIProvider(TTSProvider):
         """
         super().__init__(config)
         
-        self.client = AzureOpenAI(
-            api_key=config.get("api_key"),
-            api_version=config.get("api_version", "2024-02-15-preview"),
-            azure_endpoint=config.get("endpoint")
-        )
+        # Default per-request deadline in seconds (None or 0: no deadline)
+        self.timeout = config.get("timeout") or None
+        
+        client_options = {
+            "api_key": config.get("api_key"),
+            "api_version": config.get("api_version", "2024-02-15-preview"),
+            "azure_endpoint": config.get("endpoint"),
+        }
+        # timeout=None would disable the SDK's default timeout, so only
+        # override it when a deadline is configured
+        if self.timeout:
+            client_options["timeout"] = self.timeout
+        self.client = AzureOpenAI(**client_options)
         
         self.deployment = config.get("deployment")
         self.model = config.get("model", self.deployment)
@@ -47,10 +62,15 @@ class AzureOpenAIProvider(TTSProvider):
             text: Text to convert to speech
             output_path: Optional custom output path
             voice: Voice to use (defaults to configured voice)
-            **kwargs: Additional parameters (speed, response_format, etc.)
+            **kwargs: Additional parameters (speed, response_format, timeout,
+                cancel_token, seek_index, etc.)
             
         Returns:
             Path to generated audio file
+            
+        Raises:
+            SynthesisCancelled: If the call was cancelled through ``cancel_token``
+            SynthesisTimeout: If the call ran past its deadline
         """
         # Use provided voice or default
         selected_voice = voice or self.default_voice
@@ -71,17 +91,63 @@ class AzureOpenAIProvider(TTSProvider):
         speed = kwargs.get("speed", 1.0)
         response_format = kwargs.get("response_format", self.output_format)
         
-        # Generate speech
-        response = self.client.audio.speech.create(
-            model=self.deployment,
-            voice=selected_voice,
-            input=text,
-            speed=speed,
-            response_format=response_format
-        )
+        token = CancellationToken.from_kwargs(kwargs, self.timeout)
+        
+        # Seek index sidecar, built from the frames as they are written
+        seek_index = None
+        if kwargs.get("seek_index") and supports_seek_index(response_format):
+            seek_index = SeekIndexBuilder(response_format)
         
-        # Save to file
-        response.stream_to_file(output_path)
+        # Audio is streamed into a temporary file and renamed into place once
+        # complete, so a failed call never touches an existing file at output_path
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        
+        try:
+            token.raise_if_cancelled()
+            
+            # Generate speech, streaming the body so the deadline and
+            # cancellation are checked between chunks
+            request_options = {}
+            remaining = token.remaining()
+            if remaining is not None:
+                request_options["timeout"] = remaining
+            
+            request_start = time.perf_counter()
+            with self.client.audio.speech.with_streaming_response.create(
+                model=self.deployment,
+                voice=selected_voice,
+                input=text,
+                speed=speed,
+                response_format=response_format,
+                **request_options
+            ) as response:
+                profiling.record("azure-openai: response headers", request_start, time.perf_counter())
+                
+                # Closing the response aborts the stream from a cancelling thread
+                with profiling.span("azure-openai: stream body to disk"), \
+                        token.on_cancel(response.close), open(tmp_path, "wb") as audio_file:
+                    for chunk in response.iter_bytes():
+                        token.raise_if_cancelled()
+                        audio_file.write(chunk)
+                        if seek_index:
+                            seek_index.feed(chunk)
+            
+            token.raise_if_cancelled()
+            os.replace(tmp_path, output_path)
+            if seek_index:
+                with profiling.span("azure-openai: write seek index"):
+                    seek_index.write(output_path)
+        except APITimeoutError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise SynthesisTimeout("Speech synthesis exceeded its deadline") from e
+        except BaseException:
+            # Remove partially written audio
+            tmp_path.unlink(missing_ok=True)
+            if token.cancelled or token.expired:
+                token.raise_if_cancelled()
+            raise
+        finally:
+            token.release()
         
         return output_path
     
@@ -91,8 +157,7 @@ class AzureOpenAIProvider(TTSProvider):
         Returns:
             List of available voice names
         """
-        # Azure OpenAI TTS supports these voices
-        return ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+        return list(self.VOICES)
     
     @property
     def provider_name(self) -> str:
@@ -1,47 +1,109 @@
 """Azure AI Speech text-to-speech provider implementation."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 from datetime import datetime
+from xml.sax.saxutils import escape
+import queue
+import threading
+import time
 import azure.cognitiveservices.speech as speechsdk
 
+from src import profiling
+from src.cancellation import CancellationToken, SynthesisCancelled
 from src.providers.base import TTSProvider
+from src.providers.speech_pool import SpeechResource, SpeechResourcePool
+from src.seek_index import SeekIndexBuilder, supports_seek_index
+from src.ssml import SSMLValidationError, is_ssml, validate_ssml
+from src.timings import PUNCTUATION, SENTENCE, WORD, WordTimeline
+from src.voice_catalog import VoiceCatalog
 
 
 class AzureSpeechProvider(TTSProvider):
     """Azure AI Speech TTS provider implementation."""
     
+    # Cancellation error codes that indicate a throttled or degraded resource;
+    # requests failing with these are retried on another resource of the pool
+    RETRYABLE_ERRORS = (
+        "TooManyRequests",
+        "ServiceUnavailable",
+        "ServiceTimeout",
+        "ServiceError",
+        "ConnectionFailure",
+    )
+    
+    # SDK event offsets are reported in 100-nanosecond ticks
+    TICKS_PER_SECOND = 10_000_000
+    
     def __init__(self, config: dict):
         """Initialize Azure AI Speech provider.
         
         Args:
-            config: Configuration dictionary with Azure AI Speech settings
+            config: Configuration dictionary with Azure AI Speech settings.
+                ``resources`` may list several Speech resources (dicts with
+                "key" and "region" or "endpoint"); otherwise ``api_key`` and
+                ``region`` describe a single resource.
         """
         super().__init__(config)
         
-        # Initialize speech config
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=config.get("api_key"),
-            region=config.get("region")
-        )
-        
         self.default_voice = config.get("voice", "en-US-JennyNeural")
         self.language = config.get("language", "en-US")
         self.output_dir = Path(config.get("output_dir", "output"))
         self.output_format = config.get("output_format", "mp3")
         
+        # Default per-request deadline in seconds (None or 0: no deadline)
+        self.timeout = config.get("timeout") or None
+        
+        # Pool of Speech resources shared by all providers with the same resources
+        resources = config.get("resources") or [
+            {"key": config.get("api_key"), "region": config.get("region")}
+        ]
+        self.pool = SpeechResourcePool.shared(resources)
+        
+        # Cached voice catalog used to validate requests before dispatch
+        catalog_path = config.get("voice_catalog")
+        self.voice_catalog_path = Path(catalog_path) if catalog_path else None
+        
+        # Speech config of the first resource, used for voice discovery
+        self.speech_config = self._create_speech_config(self.pool.resources[0])
+        
+        # Create output directory if it doesn't exist
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _create_speech_config(
+        self,
+        resource: SpeechResource,
+        text_stream: bool = False
+    ) -> speechsdk.SpeechConfig:
+        """Create a speech config for a Speech resource.
+        
+        Args:
+            resource: Speech resource to connect to
+            text_stream: Connect to the v2 websocket endpoint required for
+                streamed text input
+            
+        Returns:
+            Speech config with the configured output format
+        """
+        if resource.endpoint:
+            speech_config = speechsdk.SpeechConfig(subscription=resource.key, endpoint=resource.endpoint)
+        elif text_stream:
+            endpoint = f"wss://{resource.region}.tts.speech.microsoft.com/cognitiveservices/websocket/v2"
+            speech_config = speechsdk.SpeechConfig(subscription=resource.key, endpoint=endpoint)
+        else:
+            speech_config = speechsdk.SpeechConfig(subscription=resource.key, region=resource.region)
+        
         # Set output format
         if self.output_format == "mp3":
-            self.speech_config.set_speech_synthesis_output_format(
+            speech_config.set_speech_synthesis_output_format(
                 speechsdk.SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3
             )
         elif self.output_format == "wav":
-            self.speech_config.set_speech_synthesis_output_format(
+            speech_config.set_speech_synthesis_output_format(
                 speechsdk.SpeechSynthesisOutputFormat.Riff24Khz16BitMonoPcm
             )
         
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return speech_config
     
     def synthesize(
         self,
@@ -52,14 +114,25 @@ class AzureSpeechProvider(TTSProvider):
     ) -> Path:
         """Synthesize speech using Azure AI Speech.
         
+        Requests are routed to the pool resource with the best first-byte
+        latency; if a resource throttles or fails, the request is retried on
+        the next one.
+        
         Args:
             text: Text to convert to speech
             output_path: Optional custom output path
             voice: Voice to use (defaults to configured voice)
-            **kwargs: Additional parameters (rate, pitch, style, etc.)
+            **kwargs: Additional parameters (rate, pitch, style, language,
+                timeout, cancel_token, seek_index, etc.). Pass ``timeline`` (a
+                ``WordTimeline``) to capture word, bookmark and viseme timing.
             
         Returns:
             Path to generated audio file
+            
+        Raises:
+            SSMLValidationError: If the request fails offline validation
+            SynthesisCancelled: If the call was cancelled through ``cancel_token``
+            SynthesisTimeout: If the call ran past its deadline
         """
         # Use provided voice or default
         selected_voice = voice or self.default_voice
@@ -75,15 +148,8 @@ class AzureSpeechProvider(TTSProvider):
             if not output_path.is_absolute():
                 output_path = self.output_dir / output_path
         
-        # Set the voice name
-        self.speech_config.speech_synthesis_voice_name = selected_voice
-        
         # Check if input is already SSML
-        text_stripped = text.strip()
-        is_ssml = (text_stripped.startswith('<?xml') or 
-                   text_stripped.startswith('<speak'))
-        
-        if is_ssml:
+        if is_ssml(text):
             # Use provided SSML directly
             ssml_text = text
         else:
@@ -94,27 +160,60 @@ class AzureSpeechProvider(TTSProvider):
             
             # Build SSML if additional parameters provided
             if style or rate != "1.0" or pitch != "0%":
-                ssml_text = self._build_ssml(text, selected_voice, rate, pitch, style)
+                with profiling.span("azure-speech: build SSML"):
+                    ssml_text = self._build_ssml(
+                        text, selected_voice, rate, pitch, style, kwargs.get("language")
+                    )
             else:
                 ssml_text = None
         
-        # Configure audio output
-        audio_config = speechsdk.audio.AudioOutputConfig(filename=str(output_path))
+        # Reject requests the service would cancel before spending a round-trip
+        with profiling.span("azure-speech: validate"):
+            self.validate(ssml_text or text, selected_voice)
         
-        # Create synthesizer
-        synthesizer = speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config,
-            audio_config=audio_config
-        )
+        token = CancellationToken.from_kwargs(kwargs, self.timeout)
+        tried: set[str] = set()
+        build_index = bool(kwargs.get("seek_index")) and supports_seek_index(self.output_format)
         
-        # Synthesize speech
-        if ssml_text:
-            result = synthesizer.speak_ssml_async(ssml_text).get()
-        else:
-            result = synthesizer.speak_text_async(text).get()
+        try:
+            while True:
+                resource = self.pool.acquire(exclude=tried)
+                tried.add(resource.name)
+                
+                first_byte_latency = None
+                failed = False
+                # Each attempt rewrites the file, so it gets a fresh index and timeline
+                seek_index = SeekIndexBuilder(self.output_format) if build_index else None
+                attempt_timeline = WordTimeline() if kwargs.get("timeline") is not None else None
+                try:
+                    result, first_byte_latency = self._speak(
+                        resource, selected_voice, text, ssml_text, output_path, token,
+                        seek_index, attempt_timeline
+                    )
+                    failed = self._is_retryable(result)
+                except SynthesisCancelled:
+                    # The caller gave up; this says nothing about the resource
+                    raise
+                except Exception:
+                    failed = True
+                    raise
+                finally:
+                    self.pool.release(resource, first_byte_latency, failed)
+                
+                # Fall back to the next resource when this one throttled
+                if failed and len(tried) < len(self.pool):
+                    output_path.unlink(missing_ok=True)
+                    continue
+                break
+        finally:
+            token.release()
         
         # Check result
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+            if seek_index:
+                seek_index.write(output_path)
+            if attempt_timeline is not None:
+                kwargs["timeline"].extend(attempt_timeline)
             return output_path
         elif result.reason == speechsdk.ResultReason.Canceled:
             cancellation_details = result.cancellation_details
@@ -125,13 +224,341 @@ class AzureSpeechProvider(TTSProvider):
         else:
             raise RuntimeError(f"Speech synthesis failed with reason: {result.reason}")
     
+    def _speak(
+        self,
+        resource: SpeechResource,
+        voice: str,
+        text: str,
+        ssml_text: Optional[str],
+        output_path: Path,
+        token: CancellationToken,
+        seek_index: Optional[SeekIndexBuilder] = None,
+        timeline: Optional[WordTimeline] = None
+    ) -> tuple[speechsdk.SpeechSynthesisResult, Optional[float]]:
+        """Run one synthesis request against a Speech resource.
+        
+        Args:
+            resource: Speech resource to use
+            voice: Voice name
+            text: Plain text (used when no SSML is given)
+            ssml_text: SSML to synthesize, or None for plain text
+            output_path: Output file path
+            token: Deadline and cancellation token
+            seek_index: Optional seek index builder fed with the audio as it
+                streams into the output file
+            timeline: Optional timeline receiving boundary, bookmark and
+                viseme events
+            
+        Returns:
+            Tuple of (synthesis result, first-byte latency in seconds or None)
+            
+        Raises:
+            SynthesisCancelled: If the call was cancelled through the token
+            SynthesisTimeout: If the call ran past its deadline
+        """
+        token.raise_if_cancelled()
+        
+        with profiling.span("azure-speech: SDK setup"):
+            # A fresh config per request keeps concurrent calls from sharing
+            # the voice setting
+            speech_config = self._create_speech_config(resource)
+            speech_config.speech_synthesis_voice_name = voice
+            
+            # Configure audio output
+            audio_config = speechsdk.audio.AudioOutputConfig(filename=str(output_path))
+            
+            # Create synthesizer
+            synthesizer = speechsdk.SpeechSynthesizer(
+                speech_config=speech_config,
+                audio_config=audio_config
+            )
+        
+        # Completion is signalled through events so that waiting can honour
+        # the deadline instead of blocking on the result future
+        done = threading.Event()
+        first_audio: list[float] = []
+        start = time.perf_counter()
+        
+        def on_synthesizing(evt) -> None:
+            if not first_audio:
+                first_audio.append(time.perf_counter() - start)
+            if seek_index:
+                seek_index.feed(evt.result.audio_data)
+        
+        synthesizer.synthesizing.connect(on_synthesizing)
+        synthesizer.synthesis_completed.connect(lambda evt: done.set())
+        synthesizer.synthesis_canceled.connect(lambda evt: done.set())
+        
+        if timeline is not None:
+            # Offsets in generated SSML are mapped back to the plain input text
+            text_offset = None
+            if ssml_text and ssml_text != text:
+                text_offset = self._text_offset_map(text, max(ssml_text.find(escape(text)), 0))
+            self._capture_timeline(synthesizer, timeline, text_offset)
+        
+        # Synthesize speech (network round-trip and the SDK's file writes)
+        with profiling.span(f"azure-speech: request ({resource.name})"):
+            if ssml_text:
+                result_future = synthesizer.speak_ssml_async(ssml_text)
+            else:
+                result_future = synthesizer.speak_text_async(text)
+            
+            if not token.wait_for(done):
+                self._stop(synthesizer)
+                # Drop the synthesizer so the SDK closes the connection and
+                # releases the output file, then remove the partial audio
+                synthesizer = audio_config = result_future = None
+                output_path.unlink(missing_ok=True)
+                token.raise_if_cancelled()
+            
+            result = result_future.get()
+            if first_audio:
+                profiling.record("azure-speech: first audio", start, start + first_audio[0])
+        
+        return result, first_audio[0] if first_audio else None
+    
+    def _capture_timeline(
+        self,
+        synthesizer: speechsdk.SpeechSynthesizer,
+        timeline: WordTimeline,
+        text_offset: Optional[Callable[[int], int]] = None
+    ) -> None:
+        """Record the synthesizer's boundary, bookmark and viseme events.
+        
+        Args:
+            synthesizer: Synthesizer about to speak
+            timeline: Timeline to fill
+            text_offset: Maps reported text offsets to offsets in the input
+                text (default: offsets are used as reported)
+        """
+        kinds = {
+            speechsdk.SpeechSynthesisBoundaryType.Word: WORD,
+            speechsdk.SpeechSynthesisBoundaryType.Punctuation: PUNCTUATION,
+            speechsdk.SpeechSynthesisBoundaryType.Sentence: SENTENCE,
+        }
+        
+        def on_boundary(evt) -> None:
+            timeline.add_boundary(
+                evt.text,
+                text_offset(evt.text_offset) if text_offset else evt.text_offset,
+                evt.audio_offset / self.TICKS_PER_SECOND,
+                evt.duration.total_seconds(),
+                kinds.get(evt.boundary_type, WORD)
+            )
+        
+        synthesizer.synthesis_word_boundary.connect(on_boundary)
+        synthesizer.bookmark_reached.connect(
+            lambda evt: timeline.add_bookmark(evt.text, evt.audio_offset / self.TICKS_PER_SECOND)
+        )
+        synthesizer.viseme_received.connect(
+            lambda evt: timeline.add_viseme(evt.viseme_id, evt.audio_offset / self.TICKS_PER_SECOND)
+        )
+    
+    @staticmethod
+    def _text_offset_map(text: str, start: int) -> Callable[[int], int]:
+        """Map offsets in generated SSML back to the plain text it escapes.
+        
+        Args:
+            text: Plain input text
+            start: Offset of the escaped text in the SSML document
+            
+        Returns:
+            Function converting an SSML offset to an offset in ``text``
+        """
+        # Input offset of every character of the escaped text
+        positions = []
+        for index, char in enumerate(text):
+            positions.extend([index] * len(escape(char)))
+        positions.append(len(text))
+        
+        def to_text(offset: int) -> int:
+            offset -= start
+            return positions[offset] if 0 <= offset < len(positions) else offset
+        
+        return to_text
+    
+    def _is_retryable(self, result: speechsdk.SpeechSynthesisResult) -> bool:
+        """Check whether a result failed because the resource throttled or degraded.
+        
+        Args:
+            result: Synthesis result
+            
+        Returns:
+            True if the request should be retried on another resource
+        """
+        if result.reason != speechsdk.ResultReason.Canceled:
+            return False
+        
+        cancellation_details = result.cancellation_details
+        if cancellation_details.reason != speechsdk.CancellationReason.Error:
+            return False
+        
+        error_code = getattr(cancellation_details, "error_code", None)
+        return getattr(error_code, "name", str(error_code)) in self.RETRYABLE_ERRORS
+    
+    def _stop(self, synthesizer: speechsdk.SpeechSynthesizer) -> None:
+        """Stop an in-flight synthesis and detach its event handlers.
+        
+        Args:
+            synthesizer: Synthesizer running the request
+        """
+        try:
+            synthesizer.stop_speaking_async().get()
+        except Exception:
+            pass
+        
+        synthesizer.synthesis_completed.disconnect_all()
+        synthesizer.synthesis_canceled.disconnect_all()
+    
+    def validate(self, text: Optional[str], voice: str) -> None:
+        """Validate a request offline against the cached voice catalog.
+        
+        SSML is checked for well-formedness and for styles, roles and locales
+        the voices cannot render; plain text requests only check the voice.
+        Capability checks are skipped until a catalog has been cached with
+        ``python main.py voice-catalog``.
+        
+        Args:
+            text: Text or SSML to be sent (None: check the voice only)
+            voice: Voice used for plain text
+            
+        Raises:
+            SSMLValidationError: If the request would be rejected by the service
+        """
+        catalog = VoiceCatalog.shared(self.voice_catalog_path) if self.voice_catalog_path else None
+        
+        if text is not None and is_ssml(text):
+            issues = validate_ssml(text, catalog)
+        elif catalog is not None and voice not in catalog:
+            issues = [f"unknown voice '{voice}'"]
+        else:
+            issues = []
+        
+        if issues:
+            raise SSMLValidationError(issues)
+    
+    def supports_text_stream(self) -> bool:
+        """Check whether streamed text input can be used.
+        
+        Requires an SDK with ``SpeechSynthesisRequest`` text streaming and a
+        frame-based output format whose chunks can be appended directly.
+        
+        Returns:
+            True if ``stream_text`` is available
+        """
+        return hasattr(speechsdk, "SpeechSynthesisRequest") and self.output_format != "wav"
+    
+    def stream_text(
+        self,
+        fragments: Iterable[str],
+        voice: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[bytes]:
+        """Synthesize streamed text input, yielding audio as it is produced.
+        
+        Fragments are written to the SDK's text input stream as they arrive
+        (from a feeder thread), so synthesis starts before the text is complete.
+        
+        Args:
+            fragments: Iterator of text fragments
+            voice: Voice to use (defaults to configured voice)
+            **kwargs: Additional parameters (timeout, cancel_token, timeline:
+                WordTimeline filled with boundary events as they are reported;
+                text offsets are positions in the streamed text)
+            
+        Returns:
+            Iterator of audio chunks in playback order
+            
+        Raises:
+            SSMLValidationError: If the voice is not in the voice catalog
+            SynthesisCancelled: If the call was cancelled through ``cancel_token``
+            SynthesisTimeout: If the call ran past its deadline
+        """
+        selected_voice = voice or self.default_voice
+        self.validate(None, selected_voice)
+        
+        token = CancellationToken.from_kwargs(kwargs, self.timeout)
+        chunks: queue.Queue = queue.Queue()
+        end = object()
+        first_audio: list[float] = []
+        synthesizer = None
+        failed = False
+        
+        # Released in the finally block below, even if setup fails
+        resource = self.pool.acquire()
+        try:
+            speech_config = self._create_speech_config(resource, text_stream=True)
+            speech_config.speech_synthesis_voice_name = selected_voice
+            
+            # No audio device: audio is collected from synthesizing events
+            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+            start = time.perf_counter()
+            
+            def on_synthesizing(evt) -> None:
+                if not first_audio:
+                    first_audio.append(time.perf_counter() - start)
+                chunks.put(evt.result.audio_data)
+            
+            synthesizer.synthesizing.connect(on_synthesizing)
+            synthesizer.synthesis_completed.connect(lambda evt: chunks.put(end))
+            synthesizer.synthesis_canceled.connect(lambda evt: chunks.put(end))
+            
+            timeline = kwargs.get("timeline")
+            if timeline is not None:
+                self._capture_timeline(synthesizer, timeline)
+            
+            request = speechsdk.SpeechSynthesisRequest(
+                input_type=speechsdk.SpeechSynthesisRequestInputType.TextStream
+            )
+            result_future = synthesizer.speak_async(request)
+            
+            def feed() -> None:
+                try:
+                    for fragment in fragments:
+                        if token.cancelled:
+                            break
+                        request.input_stream.write(fragment)
+                finally:
+                    request.input_stream.close()
+            
+            feeder = threading.Thread(target=feed, name="tts-text-stream-feeder", daemon=True)
+            feeder.start()
+            
+            while True:
+                token.raise_if_cancelled()
+                try:
+                    chunk = chunks.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                if chunk is end:
+                    break
+                yield chunk
+            
+            result = result_future.get()
+            if result.reason == speechsdk.ResultReason.Canceled:
+                failed = self._is_retryable(result)
+                cancellation_details = result.cancellation_details
+                error_msg = f"Speech synthesis canceled: {cancellation_details.reason}"
+                if cancellation_details.reason == speechsdk.CancellationReason.Error:
+                    error_msg += f"\nError details: {cancellation_details.error_details}"
+                raise RuntimeError(error_msg)
+        except BaseException:
+            # Stop the request if the caller gave up or the deadline passed
+            if synthesizer is not None:
+                self._stop(synthesizer)
+            raise
+        finally:
+            token.release()
+            self.pool.release(resource, first_audio[0] if first_audio else None, failed)
+    
     def _build_ssml(
         self,
         text: str,
         voice: str,
         rate: str,
         pitch: str,
-        style: Optional[str]
+        style: Optional[str],
+        language: Optional[str] = None
     ) -> str:
         """Build SSML for advanced speech synthesis.
         
@@ -141,12 +568,13 @@ class AzureSpeechProvider(TTSProvider):
             rate: Speech rate (e.g., "1.0", "1.5")
             pitch: Pitch adjustment (e.g., "0%", "+10%")
             style: Speaking style (e.g., "cheerful", "sad")
+            language: Document locale (default: configured language)
             
         Returns:
             SSML string
         """
         ssml = f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
-        ssml += 'xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="{}">'
+        ssml += f'xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="{language or self.language}">'
         
         # Voice element
         ssml += f'<voice name="{voice}">'
@@ -157,7 +585,7 @@ class AzureSpeechProvider(TTSProvider):
         
         # Prosody element
         ssml += f'<prosody rate="{rate}" pitch="{pitch}">'
-        ssml += text
+        ssml += escape(text)
         ssml += '</prosody>'
         
         if style:
@@ -214,27 +642,7 @@ class AzureSpeechProvider(TTSProvider):
                 # Find the requested voice
                 for voice in result.voices:
                     if voice.short_name.lower() == voice_name.lower():
-                        # Extract voice information
-                        voice_info = {
-                            "name": voice.name,
-                            "short_name": voice.short_name,
-                            "locale": voice.locale,
-                            "local_name": voice.local_name,
-                            "gender": str(voice.gender),
-                            "voice_type": str(voice.voice_type),
-                            "styles": list(voice.style_list) if hasattr(voice, 'style_list') and voice.style_list else [],
-                        }
-                        
-                        # Try to get role play list (property name might vary)
-                        roles = []
-                        if hasattr(voice, 'role_play_list') and voice.role_play_list:
-                            roles = list(voice.role_play_list)
-                        
-                        voice_info["roles"] = roles
-                        
-                        # Add secondary locales if available
-                        if hasattr(voice, 'secondary_locale_list') and voice.secondary_locale_list:
-                            voice_info["secondary_locales"] = list(voice.secondary_locale_list)
+                        voice_info = self._voice_to_info(voice)
                         
                         # Add voice properties for debugging
                         try:
@@ -267,6 +675,61 @@ class AzureSpeechProvider(TTSProvider):
             traceback.print_exc()
             return None
     
+    def list_voice_info(self) -> list[dict]:
+        """Get capabilities of every available voice in one request.
+        
+        Returns:
+            List of voice information dictionaries (same fields as
+            ``get_voice_info``, without properties)
+            
+        Raises:
+            RuntimeError: If the voices list could not be retrieved
+        """
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.speech_config, audio_config=None)
+        result = synthesizer.get_voices_async().get()
+        
+        if result.reason != speechsdk.ResultReason.VoicesListRetrieved:
+            raise RuntimeError(f"Could not retrieve voices list. Reason: {result.reason}")
+        
+        return [self._voice_to_info(voice) for voice in result.voices]
+    
+    def _voice_to_info(self, voice: speechsdk.VoiceInfo) -> dict:
+        """Extract voice information from an SDK voice entry.
+        
+        Args:
+            voice: Voice entry of a voices list result
+            
+        Returns:
+            Dictionary with name, locale, gender, styles, roles, voice_type
+            and secondary locales (multilingual voices only)
+        """
+        voice_info = {
+            "name": voice.name,
+            "short_name": voice.short_name,
+            "locale": voice.locale,
+            "local_name": voice.local_name,
+            "gender": str(voice.gender),
+            "voice_type": str(voice.voice_type),
+            "styles": list(voice.style_list) if hasattr(voice, 'style_list') and voice.style_list else [],
+        }
+        
+        # Roles and secondary locales are None when the SDK does not report
+        # them (property names vary between SDK versions), so that missing
+        # data is not mistaken for "none supported"
+        roles = None
+        if hasattr(voice, 'role_play_list'):
+            roles = list(voice.role_play_list or [])
+        
+        voice_info["roles"] = roles
+        
+        secondary_locales = None
+        if hasattr(voice, 'secondary_locale_list'):
+            secondary_locales = list(voice.secondary_locale_list or [])
+        
+        voice_info["secondary_locales"] = secondary_locales
+        
+        return voice_info
+    
     def _get_popular_voices(self) -> list[str]:
         """Get a subset of popular voices as fallback.
         
@@ -0,0 +1,188 @@
+"""Pool of Azure AI Speech resources with health tracking and latency-aware routing."""
+
+import threading
+import time
+from typing import Optional
+
+
+class SpeechResource:
+    """A single Azure AI Speech resource (key plus region or endpoint)."""
+
+    def __init__(self, key: str, region: Optional[str] = None, endpoint: Optional[str] = None):
+        """Initialize the resource.
+
+        Args:
+            key: Subscription key
+            region: Azure region (e.g. eastus)
+            endpoint: Custom endpoint URL, used instead of the region
+        """
+        if not region and not endpoint:
+            raise ValueError("A Speech resource needs a region or an endpoint")
+
+        self.key = key
+        self.region = region
+        self.endpoint = endpoint
+
+        # Health and latency state, guarded by the owning pool's lock
+        self.ewma_latency: Optional[float] = None
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+
+    @property
+    def name(self) -> str:
+        """Region or endpoint identifying the resource."""
+        return self.endpoint or self.region
+
+    def is_healthy(self, now: float) -> bool:
+        """Whether the resource is outside its failure cooldown."""
+        return now >= self.unhealthy_until
+
+
+class SpeechResourcePool:
+    """Route Speech requests across resources by health and first-byte latency.
+
+    Each resource tracks an exponentially weighted moving average (EWMA) of
+    its first-byte latency. Requests go to the healthy resource with the
+    lowest latency scaled by its in-flight load; resources that have not been
+    measured yet are tried first. Throttled or degraded resources are taken
+    out of rotation for an exponentially growing cooldown.
+    """
+
+    # Pools are shared between provider instances with the same resources,
+    # so health and latency are learned once per process
+    _shared: dict[tuple, "SpeechResourcePool"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        resources: list[SpeechResource],
+        alpha: float = 0.3,
+        base_cooldown: float = 5.0,
+        max_cooldown: float = 300.0
+    ):
+        """Initialize the pool.
+
+        Args:
+            resources: Speech resources to route across
+            alpha: EWMA smoothing factor for first-byte latency
+            base_cooldown: Cooldown in seconds after the first failure
+            max_cooldown: Upper bound for the cooldown in seconds
+        """
+        if not resources:
+            raise ValueError("At least one Speech resource is required")
+
+        self.resources = resources
+        self.alpha = alpha
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, resources: list[dict]) -> "SpeechResourcePool":
+        """Get the process-wide pool for a list of resource configurations.
+
+        Args:
+            resources: List of dicts with "key" and "region" or "endpoint"
+
+        Returns:
+            Shared pool instance
+        """
+        cache_key = tuple(
+            (resource.get("key"), resource.get("region"), resource.get("endpoint"))
+            for resource in resources
+        )
+        with cls._shared_lock:
+            if cache_key not in cls._shared:
+                cls._shared[cache_key] = cls([SpeechResource(*key) for key in cache_key])
+            return cls._shared[cache_key]
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def acquire(self, exclude: Optional[set[str]] = None) -> SpeechResource:
+        """Select a resource for the next request and mark it in flight.
+
+        Args:
+            exclude: Names of resources already tried for this request
+
+        Returns:
+            Selected resource; must be handed back with ``release``
+        """
+        exclude = exclude or set()
+        now = time.monotonic()
+
+        with self._lock:
+            candidates = [r for r in self.resources if r.name not in exclude] or list(self.resources)
+            healthy = [r for r in candidates if r.is_healthy(now)]
+
+            if healthy:
+                # Unmeasured resources are probed first, least loaded first, so
+                # a cold burst spreads out; measured ones rank by scaled latency
+                resource = min(healthy, key=lambda r: (
+                    r.ewma_latency is not None,
+                    (r.ewma_latency or 0.0) * (1 + r.in_flight),
+                    r.in_flight,
+                ))
+            else:
+                # Everything is cooling down: use the one that recovers first
+                resource = min(candidates, key=lambda r: r.unhealthy_until)
+
+            resource.in_flight += 1
+            resource.requests += 1
+            return resource
+
+    def release(
+        self,
+        resource: SpeechResource,
+        first_byte_latency: Optional[float] = None,
+        failed: bool = False
+    ) -> None:
+        """Hand a resource back and record the outcome of the request.
+
+        Args:
+            resource: Resource returned by ``acquire``
+            first_byte_latency: Seconds until the first audio arrived, if any
+            failed: Whether the resource throttled or failed the request
+        """
+        with self._lock:
+            resource.in_flight -= 1
+
+            if failed:
+                resource.failures += 1
+                resource.consecutive_failures += 1
+                cooldown = min(
+                    self.base_cooldown * 2 ** (resource.consecutive_failures - 1),
+                    self.max_cooldown
+                )
+                resource.unhealthy_until = time.monotonic() + cooldown
+                return
+
+            resource.consecutive_failures = 0
+            if first_byte_latency is not None:
+                if resource.ewma_latency is None:
+                    resource.ewma_latency = first_byte_latency
+                else:
+                    resource.ewma_latency += self.alpha * (first_byte_latency - resource.ewma_latency)
+
+    def snapshot(self) -> list[dict]:
+        """Get the current state of every resource.
+
+        Returns:
+            List of dictionaries with health and latency per resource
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "name": r.name,
+                    "healthy": r.is_healthy(now),
+                    "ewma_first_byte_s": round(r.ewma_latency, 4) if r.ewma_latency is not None else None,
+                    "in_flight": r.in_flight,
+                    "requests": r.requests,
+                    "failures": r.failures,
+                }
+                for r in self.resources
+            ]
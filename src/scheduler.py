@@ -0,0 +1,428 @@
+"""Priority scheduling of synthesis work in front of the providers.
+
+Jobs are queued per priority class (interactive, standard, bulk) and, within
+a class, per tenant. Workers always serve the highest non-empty class first
+and rotate between tenants of that class, so one tenant's backlog cannot
+starve another's. A number of workers can be reserved for higher classes:
+lower classes are never allowed to occupy them, which keeps interactive
+latency predictable while a nightly batch is running.
+
+Long bulk jobs are submitted as chunks. Every chunk is scheduled on its own,
+so higher priority work overtakes a running bulk job at the next chunk
+boundary.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from src import profiling
+from src.audio import bytes_duration, concat_audio
+from src.cancellation import CancellationToken, SynthesisCancelled
+from src.providers.base import TTSProvider
+from src.seek_index import SeekIndexBuilder, supports_seek_index
+from src.timings import WordTimeline
+
+
+# Priority classes, highest first
+PRIORITY_CLASSES = ("interactive", "standard", "bulk")
+
+
+@dataclass
+class _WorkItem:
+    """A single unit of scheduled work."""
+
+    priority: str
+    tenant: str
+    run: Callable[[TTSProvider], Path]
+    provider: Optional[str]
+    deployment: Optional[str]
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class ClassMetrics:
+    """Queue and wait-time metrics for one priority class."""
+
+    queued: int = 0
+    running: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean queue wait in seconds of the items started so far."""
+        started = self.completed + self.failed + self.running
+        return self.total_wait / started if started else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert metrics to a dictionary."""
+        return {
+            "queue_depth": self.queued,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "mean_wait_s": round(self.mean_wait, 4),
+            "max_wait_s": round(self.max_wait, 4),
+        }
+
+
+class SynthesisScheduler:
+    """Priority-class, tenant-fair scheduler for synthesis requests."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        reserved: Optional[dict[str, int]] = None,
+        provider_factory: Optional[Callable[[Optional[str], Optional[str]], TTSProvider]] = None
+    ):
+        """Initialize the scheduler and start its workers.
+
+        Args:
+            max_concurrency: Total number of concurrent synthesis calls
+            reserved: Workers reserved per class; a class may only use slots
+                not reserved for classes above it (default: 2 for interactive)
+            provider_factory: Callable (provider, deployment) -> TTSProvider
+                (default: ProviderFactory.create)
+        """
+        if reserved is None:
+            reserved = {"interactive": min(2, max_concurrency - 1)}
+
+        for priority in reserved:
+            self._check_priority(priority)
+        if sum(reserved.values()) >= max_concurrency:
+            raise ValueError("Reserved concurrency must leave at least one shared worker")
+
+        if provider_factory is None:
+            # Imported here so the scheduler does not pull in every provider SDK
+            from src.factory import ProviderFactory
+            provider_factory = ProviderFactory.create
+
+        self.max_concurrency = max_concurrency
+        self.provider_factory = provider_factory
+
+        # Slots usable by each class = total minus slots reserved above it
+        self._caps = {}
+        reserved_above = 0
+        for priority in PRIORITY_CLASSES:
+            self._caps[priority] = max_concurrency - reserved_above
+            reserved_above += reserved.get(priority, 0)
+
+        self._queues: dict[str, OrderedDict[str, deque]] = {
+            priority: OrderedDict() for priority in PRIORITY_CLASSES
+        }
+        self._metrics = {priority: ClassMetrics() for priority in PRIORITY_CLASSES}
+        self._running = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._local = threading.local()
+
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"tts-scheduler-{index}", daemon=True)
+            for index in range(max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "SynthesisScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @staticmethod
+    def _check_priority(priority: str) -> None:
+        """Raise ValueError for unknown priority classes."""
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(
+                f"Unknown priority '{priority}'. Available priorities: {', '.join(PRIORITY_CLASSES)}"
+            )
+
+    def submit(
+        self,
+        text: str,
+        priority: str = "standard",
+        tenant: str = "default",
+        provider: Optional[str] = None,
+        deployment: Optional[str] = None,
+        output_path: Optional[Path] = None,
+        voice: Optional[str] = None,
+        **kwargs
+    ) -> Future:
+        """Queue a synthesis request.
+
+        Args:
+            text: Text or SSML to synthesize
+            priority: Priority class (interactive, standard, bulk)
+            tenant: Tenant identifier used for fair sharing within the class
+            provider: Provider name (default: from .env)
+            deployment: Azure OpenAI deployment (ignored for azure-speech)
+            output_path: Optional output path
+            voice: Optional voice name
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Future resolving to the generated audio path
+        """
+        def run(tts_provider: TTSProvider) -> Path:
+            return tts_provider.synthesize(text=text, output_path=output_path, voice=voice, **kwargs)
+
+        future: Future = Future()
+        self._enqueue(_WorkItem(priority, tenant, run, provider, deployment, future))
+        return future
+
+    def submit_chunked(
+        self,
+        chunks: list[str],
+        output_path: Path,
+        priority: str = "bulk",
+        tenant: str = "default",
+        provider: Optional[str] = None,
+        deployment: Optional[str] = None,
+        voice: Optional[str] = None,
+        offsets: Optional[list[int]] = None,
+        **kwargs
+    ) -> Future:
+        """Queue a long job as independently scheduled chunks.
+
+        Each chunk is a separate work item, so the job yields its worker to
+        higher priority requests at every chunk boundary. The first chunk that
+        fails cancels the rest of the job: queued chunks never start and
+        running ones are stopped through a shared cancellation token. Chunk
+        outputs are stitched into ``output_path`` once the last chunk finishes; with
+        ``seek_index=True`` a ``.seek`` sidecar records the chunk boundaries,
+        and a ``timeline`` (``WordTimeline``) receives the merged word timings.
+
+        Args:
+            chunks: Text chunks in playback order
+            output_path: Absolute path of the stitched output file
+            priority: Priority class (default: bulk)
+            tenant: Tenant identifier used for fair sharing within the class
+            provider: Provider name (default: from .env)
+            deployment: Azure OpenAI deployment (ignored for azure-speech)
+            voice: Optional voice name
+            offsets: Offset of each chunk in the source text, e.g. the starts
+                from ``chunk_spans``, used for the timeline's text offsets
+                (default: offsets in the chunks joined by single spaces)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Future resolving to ``output_path``
+        """
+        if not chunks:
+            raise ValueError("At least one chunk is required")
+        if offsets is None:
+            offsets, position = [], 0
+            for chunk in chunks:
+                offsets.append(position)
+                position += len(chunk) + 1
+        elif len(offsets) != len(chunks):
+            raise ValueError("offsets must have one entry per chunk")
+
+        # The index and timeline cover the stitched file, not the individual parts
+        seek_index = kwargs.pop("seek_index", False)
+        timeline = kwargs.pop("timeline", None)
+        chunk_timelines = [WordTimeline() for _ in chunks] if timeline is not None else None
+
+        # Remaining chunks are cancelled as soon as one of them fails
+        token = CancellationToken(parent=kwargs.get("cancel_token"))
+        kwargs = {**kwargs, "cancel_token": token}
+
+        job_future: Future = Future()
+        chunk_futures = []
+        for index, chunk in enumerate(chunks):
+            part_path = output_path.with_name(f"{output_path.stem}.part{index:04d}{output_path.suffix}")
+            chunk_kwargs = {**kwargs, "timeline": chunk_timelines[index]} if chunk_timelines else kwargs
+            chunk_futures.append(
+                self.submit(chunk, priority, tenant, provider, deployment, part_path, voice, **chunk_kwargs)
+            )
+
+        lock = threading.Lock()
+        remaining = [len(chunk_futures)]
+
+        def on_chunk_done(chunk_future: Future) -> None:
+            if chunk_future.cancelled() or chunk_future.exception() is not None:
+                token.cancel()
+                for sibling in chunk_futures:
+                    sibling.cancel()
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                self._stitch(chunk_futures, output_path, job_future, seek_index, offsets, timeline, chunk_timelines)
+            finally:
+                token.release()
+
+        for chunk_future in chunk_futures:
+            chunk_future.add_done_callback(on_chunk_done)
+
+        return job_future
+
+    @staticmethod
+    def _stitch(
+        chunk_futures: list[Future],
+        output_path: Path,
+        job_future: Future,
+        seek_index: bool = False,
+        offsets: Optional[list[int]] = None,
+        timeline: Optional[WordTimeline] = None,
+        chunk_timelines: Optional[list[WordTimeline]] = None
+    ) -> None:
+        """Stitch finished chunk outputs and resolve the job future.
+
+        Word timings of the chunks are merged into ``timeline`` with times
+        shifted by the preceding chunks' audio and text offsets by each
+        chunk's offset in the source text.
+        """
+        part_paths = [
+            future.result() for future in chunk_futures
+            if not future.cancelled() and future.exception() is None
+        ]
+        try:
+            # Re-raise the error that failed the job, not the cancellations it caused
+            errors = [
+                future.exception() for future in chunk_futures
+                if not future.cancelled() and future.exception() is not None
+            ]
+            errors.sort(key=lambda error: isinstance(error, SynthesisCancelled))
+            if errors:
+                raise errors[0]
+            parts = [future.result().read_bytes() for future in chunk_futures]
+            audio_format = output_path.suffix.lstrip(".").lower()
+            with profiling.span("scheduler: stitch chunks"):
+                output_path.write_bytes(concat_audio(parts, audio_format))
+            if seek_index and supports_seek_index(audio_format):
+                index_builder = SeekIndexBuilder(audio_format)
+                for part in parts:
+                    index_builder.add_part(part)
+                index_builder.write(output_path)
+            if timeline is not None:
+                audio_time = 0.0
+                for offset, part, chunk_timeline in zip(offsets, parts, chunk_timelines):
+                    timeline.extend(chunk_timeline, audio_time, offset)
+                    audio_time += bytes_duration(part, audio_format) or 0.0
+            job_future.set_result(output_path)
+        except BaseException as e:
+            job_future.set_exception(e)
+        finally:
+            for path in part_paths:
+                path.unlink(missing_ok=True)
+
+    def _enqueue(self, item: _WorkItem) -> None:
+        """Add a work item to its class and tenant queue."""
+        self._check_priority(item.priority)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Scheduler has been shut down")
+
+            tenants = self._queues[item.priority]
+            tenants.setdefault(item.tenant, deque()).append(item)
+
+            metrics = self._metrics[item.priority]
+            metrics.queued += 1
+            metrics.submitted += 1
+            self._condition.notify()
+
+    def _next_item(self) -> Optional[_WorkItem]:
+        """Pick the next runnable item; the caller must hold the condition.
+
+        Returns:
+            Highest priority item the current load allows, or None
+        """
+        for priority in PRIORITY_CLASSES:
+            tenants = self._queues[priority]
+            if not tenants or self._running >= self._caps[priority]:
+                continue
+
+            # Round-robin across tenants: serve the first, then move it to the back
+            tenant, queue = next(iter(tenants.items()))
+            item = queue.popleft()
+            if queue:
+                tenants.move_to_end(tenant)
+            else:
+                del tenants[tenant]
+            return item
+
+        return None
+
+    def _worker(self) -> None:
+        """Worker loop: take the next eligible item and run it."""
+        while True:
+            with self._condition:
+                item = self._next_item()
+                while item is None:
+                    if self._closed and not any(self._queues.values()):
+                        return
+                    self._condition.wait()
+                    item = self._next_item()
+
+                metrics = self._metrics[item.priority]
+                wait = time.perf_counter() - item.enqueued_at
+                metrics.queued -= 1
+                metrics.running += 1
+                metrics.total_wait += wait
+                metrics.max_wait = max(metrics.max_wait, wait)
+                self._running += 1
+
+            succeeded = False
+            if item.future.set_running_or_notify_cancel():
+                try:
+                    item.future.set_result(item.run(self._provider(item.provider, item.deployment)))
+                    succeeded = True
+                except BaseException as e:
+                    item.future.set_exception(e)
+
+            with self._condition:
+                self._running -= 1
+                metrics.running -= 1
+                if succeeded:
+                    metrics.completed += 1
+                else:
+                    metrics.failed += 1
+                # A freed slot may unblock a capped class on another worker
+                self._condition.notify_all()
+
+    def _provider(self, provider: Optional[str], deployment: Optional[str]) -> TTSProvider:
+        """Get this worker's provider instance for a provider/deployment pair.
+
+        Providers keep per-call state on the instance, so each worker thread
+        owns its own instances.
+        """
+        cache = self._local.__dict__.setdefault("providers", {})
+        key = (provider, deployment)
+        if key not in cache:
+            cache[key] = self.provider_factory(provider, deployment)
+        return cache[key]
+
+    def metrics(self) -> dict[str, dict]:
+        """Get per-class queue depth and wait-time metrics.
+
+        Returns:
+            Dictionary mapping priority class to its metrics
+        """
+        with self._condition:
+            return {priority: metrics.to_dict() for priority, metrics in self._metrics.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; queued items are still processed.
+
+        Args:
+            wait: Block until all workers have exited
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                worker.join()
@@ -0,0 +1,320 @@
+"""Seek index sidecars: time to byte offset maps for generated audio files.
+
+Seeking to a timestamp in VBR MP3 (or ADTS AAC) normally means scanning the
+file from the start. Writers feed the bytes they write into a
+``SeekIndexBuilder``, which records every frame header as it goes by, and
+store the result next to the audio as ``<file>.seek``:
+
+- header: magic, format, sample rate, WAV block alignment and data offset,
+  total samples, frame count and chunk count
+- frame byte offsets and frame start samples (uint32 arrays)
+- chunk start samples (uint32 array), one per independently rendered chunk
+
+``SeekIndex.lookup`` answers seek requests with a binary search. WAV files
+need no frame table: offsets are computed from the sample position.
+"""
+
+import io
+import os
+import struct
+import sys
+import wave
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Optional
+
+from src.audio import FrameScanner
+
+
+SEEK_MAGIC = b"AVSEEK01"
+
+# Header: magic, format (4 bytes, NUL padded), sample rate, block align,
+# data offset, total samples, frame count, chunk count
+_HEADER = struct.Struct("<8s4sIIIQII")
+
+# Largest value the uint32 tables can hold
+_UINT32_MAX = 0xFFFFFFFF
+
+# Audio formats a seek index can be built for
+SEEK_FORMATS = ("mp3", "aac", "wav")
+
+
+def sidecar_path(audio_path: Path) -> Path:
+    """Get the seek index path of an audio file."""
+    return audio_path.with_name(audio_path.name + ".seek")
+
+
+def supports_seek_index(audio_format: str) -> bool:
+    """Check whether a seek index can be built for a format.
+
+    Args:
+        audio_format: Audio format of the file being written
+
+    Returns:
+        True if ``SeekIndexBuilder`` accepts the format
+    """
+    return audio_format in SEEK_FORMATS
+
+
+def _uint32_array(values: list[int]) -> array:
+    """Build a uint32 array, rejecting values that would overflow."""
+    if values and max(values) > _UINT32_MAX:
+        raise ValueError("Audio is too long for a seek index (more than 4 GiB or 2^32 samples)")
+    return array("I", values)
+
+
+def _wav_layout(head: bytes) -> tuple[int, int, int]:
+    """Read the layout of a WAV stream from its first bytes.
+
+    Args:
+        head: Beginning of the WAV stream, including the header
+
+    Returns:
+        Tuple of (sample rate, block alignment, offset of the PCM data)
+    """
+    stream = io.BytesIO(head)
+    with wave.open(stream, "rb") as reader:
+        # wave stops right after the "data" chunk header
+        data_offset = stream.tell()
+        block_align = reader.getnchannels() * reader.getsampwidth()
+        return reader.getframerate(), block_align, data_offset
+
+
+class SeekIndex:
+    """Time to byte offset map of one audio file."""
+
+    def __init__(
+        self,
+        audio_format: str,
+        sample_rate: int,
+        total_samples: int,
+        offsets: array,
+        samples: array,
+        chunks: array,
+        block_align: int = 0,
+        data_offset: int = 0
+    ):
+        """Initialize the index.
+
+        Args:
+            audio_format: Audio format ("mp3", "aac" or "wav")
+            sample_rate: Sample rate in Hz
+            total_samples: Total number of samples
+            offsets: Byte offset of every frame (empty for WAV)
+            samples: Start sample of every frame (empty for WAV)
+            chunks: Start sample of every chunk
+            block_align: Bytes per sample frame (WAV only)
+            data_offset: Byte offset of the PCM data (WAV only)
+        """
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.total_samples = total_samples
+        self.offsets = offsets
+        self.samples = samples
+        self.chunks = chunks
+        self.block_align = block_align
+        self.data_offset = data_offset
+
+    @property
+    def duration(self) -> float:
+        """Total duration in seconds."""
+        return self.total_samples / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def chunk_times(self) -> list[float]:
+        """Start time of every chunk in seconds."""
+        return [sample / self.sample_rate for sample in self.chunks]
+
+    def lookup(self, seconds: float) -> tuple[int, float]:
+        """Find where playback of a timestamp has to start.
+
+        Args:
+            seconds: Requested position in seconds (clamped to the audio)
+
+        Returns:
+            Tuple of (byte offset of the frame containing the position,
+            start time of that frame in seconds)
+        """
+        target = min(max(int(seconds * self.sample_rate), 0), max(self.total_samples - 1, 0))
+
+        if self.audio_format == "wav":
+            return self.data_offset + target * self.block_align, target / self.sample_rate
+
+        if not self.offsets:
+            return 0, 0.0
+
+        index = max(bisect_right(self.samples, target) - 1, 0)
+        return self.offsets[index], self.samples[index] / self.sample_rate
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index."""
+        header = _HEADER.pack(
+            SEEK_MAGIC, self.audio_format.encode("ascii"), self.sample_rate, self.block_align,
+            self.data_offset, self.total_samples, len(self.offsets), len(self.chunks)
+        )
+        tables = []
+        for table in (self.offsets, self.samples, self.chunks):
+            if sys.byteorder == "big":
+                table = array("I", table)
+                table.byteswap()
+            tables.append(table.tobytes())
+        return header + b"".join(tables)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeekIndex":
+        """Deserialize an index.
+
+        Args:
+            data: Bytes produced by ``to_bytes``
+
+        Returns:
+            Seek index
+        """
+        (magic, audio_format, sample_rate, block_align, data_offset,
+         total_samples, frame_count, chunk_count) = _HEADER.unpack_from(data, 0)
+        if magic != SEEK_MAGIC:
+            raise ValueError("Not a seek index")
+
+        tables = []
+        pos = _HEADER.size
+        for count in (frame_count, frame_count, chunk_count):
+            table = array("I")
+            table.frombytes(data[pos:pos + count * table.itemsize])
+            if sys.byteorder == "big":
+                table.byteswap()
+            tables.append(table)
+            pos += count * table.itemsize
+
+        return cls(
+            audio_format.rstrip(b"\0").decode("ascii"), sample_rate, total_samples,
+            *tables, block_align=block_align, data_offset=data_offset
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "SeekIndex":
+        """Load the seek index of an audio file.
+
+        Args:
+            path: Audio file or its ``.seek`` sidecar
+
+        Returns:
+            Seek index
+        """
+        if path.suffix != ".seek":
+            path = sidecar_path(path)
+        return cls.from_bytes(path.read_bytes())
+
+
+class SeekIndexBuilder:
+    """Build a seek index from the bytes of an audio file while it is written."""
+
+    def __init__(self, audio_format: str):
+        """Initialize the builder.
+
+        Args:
+            audio_format: Audio format ("mp3", "aac" or "wav")
+        """
+        if audio_format not in SEEK_FORMATS:
+            raise ValueError(f"Seek index not supported for format: {audio_format}")
+
+        self.audio_format = audio_format
+        self._offsets: list[int] = []
+        self._samples: list[int] = []
+        self._chunks: list[int] = []
+        self._sample_rate = 0
+        self._total_samples = 0
+        self._bytes = 0
+        self._scanner: Optional[FrameScanner] = None
+        self._part_start = 0
+
+    def feed(self, data: bytes) -> None:
+        """Record the next bytes written to the audio file.
+
+        Args:
+            data: Bytes in file order, in any size
+        """
+        if not self._chunks:
+            self.start_chunk()
+
+        if self.audio_format != "wav":
+            for frame in self._scanner.feed(data):
+                self._offsets.append(self._part_start + frame.offset)
+                self._samples.append(self._total_samples)
+                self._total_samples += frame.samples
+                self._sample_rate = self._sample_rate or frame.sample_rate
+
+        self._bytes += len(data)
+
+    def start_chunk(self) -> None:
+        """Mark a chunk boundary at the current position.
+
+        The following bytes are scanned as a new, independently encoded
+        stream (e.g. a separately rendered chunk with its own ID3 tag).
+        """
+        if self.audio_format != "wav":
+            self._scanner = FrameScanner(self.audio_format)
+        self._part_start = self._bytes
+        if not self._chunks or self._chunks[-1] != self._total_samples:
+            self._chunks.append(self._total_samples)
+
+    def add_part(self, audio: bytes) -> None:
+        """Record a complete, independently rendered chunk of the output.
+
+        WAV parts are complete RIFF files; they are expected to be stitched
+        into one stream (see ``concat_audio``), so only their sample counts
+        are recorded.
+
+        Args:
+            audio: Complete audio bytes of the chunk
+        """
+        self.start_chunk()
+        if self.audio_format == "wav":
+            sample_rate, block_align, data_offset = _wav_layout(audio[:4096])
+            self._sample_rate = self._sample_rate or sample_rate
+            self._total_samples += (len(audio) - data_offset) // block_align
+        else:
+            self.feed(audio)
+
+    def build(self, audio_path: Optional[Path] = None) -> SeekIndex:
+        """Build the index.
+
+        Args:
+            audio_path: Written audio file; required for WAV, whose layout is
+                read from the final file header
+
+        Returns:
+            Seek index
+        """
+        chunks = _uint32_array(self._chunks or [0])
+
+        if self.audio_format == "wav":
+            if audio_path is None:
+                raise ValueError("WAV seek indexes need the written file")
+            with open(audio_path, "rb") as audio_file:
+                sample_rate, block_align, data_offset = _wav_layout(audio_file.read(4096))
+            total_samples = (audio_path.stat().st_size - data_offset) // block_align
+            return SeekIndex(
+                "wav", sample_rate, total_samples, array("I"), array("I"), chunks,
+                block_align=block_align, data_offset=data_offset
+            )
+
+        return SeekIndex(
+            self.audio_format, self._sample_rate, self._total_samples,
+            _uint32_array(self._offsets), _uint32_array(self._samples), chunks
+        )
+
+    def write(self, audio_path: Path) -> Path:
+        """Build the index and store it next to the audio file.
+
+        Args:
+            audio_path: Written audio file
+
+        Returns:
+            Path of the ``.seek`` sidecar
+        """
+        index_path = sidecar_path(audio_path)
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        tmp_path.write_bytes(self.build(audio_path).to_bytes())
+        os.replace(tmp_path, index_path)
+        return index_path
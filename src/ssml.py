@@ -0,0 +1,321 @@
+"""SSML helpers shared by providers and batch tools."""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+from src.voice_catalog import VoiceCatalog
+
+
+def is_ssml(text: str) -> bool:
+    """Check whether input text is an SSML document.
+
+    Args:
+        text: Input text
+
+    Returns:
+        True if the text starts with an XML declaration or a <speak> element
+    """
+    text_stripped = text.strip()
+    return text_stripped.startswith('<?xml') or text_stripped.startswith('<speak')
+
+
+def ssml_to_text(ssml: str) -> str:
+    """Extract the spoken text from an SSML document.
+
+    Used when SSML input has to be sent to a provider that only accepts plain
+    text (e.g. Azure OpenAI), so that markup is not read out loud.
+
+    Args:
+        ssml: SSML document
+
+    Returns:
+        Plain text with whitespace collapsed
+    """
+    try:
+        root = ET.fromstring(ssml.strip().encode("utf-8"))
+        text = " ".join(root.itertext())
+    except ET.ParseError:
+        # Fall back to naive tag stripping for malformed markup
+        text = re.sub(r"<[^>]+>", " ", ssml)
+
+    return " ".join(text.split())
+
+
+_VOICE_NAME = re.compile(r'(<voice\b[^>]*?\bname\s*=\s*)(["\'])[^"\']*\2')
+_EXPRESS_AS_STYLE = re.compile(r'(<mstts:express-as\b[^>]*?\bstyle\s*=\s*)(["\'])[^"\']*\2')
+_VOICE_ELEMENT = re.compile(r'(<voice\b[^>]*>)(.*?)(</voice\s*>)', re.DOTALL)
+_SPEAK_TAG = re.compile(r'<speak\b[^>]*>')
+_MSTTS_NAMESPACE = 'xmlns:mstts="https://www.w3.org/2001/mstts"'
+
+
+def retarget_ssml(ssml: str, voice: Optional[str] = None, style: Optional[str] = None) -> str:
+    """Point an SSML document at another voice and/or speaking style.
+
+    The markup is edited in place, so formatting and comments survive. Every
+    ``<voice name>`` is replaced by ``voice``. With a ``style``, existing
+    ``mstts:express-as`` styles are replaced; a document without any gets
+    the content of each ``<voice>`` wrapped in one.
+
+    Args:
+        ssml: SSML document
+        voice: Voice name to use everywhere (None keeps the document's voices)
+        style: Speaking style to use (None keeps the document's styles)
+
+    Returns:
+        Rewritten SSML document
+    """
+    if voice:
+        ssml = _VOICE_NAME.sub(lambda match: f"{match.group(1)}{match.group(2)}{voice}{match.group(2)}", ssml)
+
+    if style:
+        ssml, replaced = _EXPRESS_AS_STYLE.subn(
+            lambda match: f"{match.group(1)}{match.group(2)}{style}{match.group(2)}", ssml
+        )
+        if not replaced:
+            ssml = _VOICE_ELEMENT.sub(
+                lambda match: f'{match.group(1)}<mstts:express-as style="{style}">'
+                              f'{match.group(2)}</mstts:express-as>{match.group(3)}',
+                ssml
+            )
+            speak = _SPEAK_TAG.search(ssml)
+            if speak and "xmlns:mstts" not in speak.group(0):
+                end = speak.end() - (2 if speak.group(0).endswith("/>") else 1)
+                ssml = f"{ssml[:end]} {_MSTTS_NAMESPACE}{ssml[end:]}"
+
+    return ssml
+
+
+# Relative rate keywords of <prosody rate="...">
+_RATE_KEYWORDS = {
+    "x-slow": 0.5,
+    "slow": 0.64,
+    "medium": 1.0,
+    "default": 1.0,
+    "fast": 1.55,
+    "x-fast": 2.0,
+}
+
+# Pause lengths of <break strength="..."> in seconds
+_BREAK_STRENGTHS = {
+    "none": 0.0,
+    "x-weak": 0.25,
+    "weak": 0.5,
+    "medium": 0.75,
+    "strong": 1.0,
+    "x-strong": 1.25,
+}
+
+
+def parse_rate(value: object) -> float:
+    """Parse a speaking rate into a multiplier.
+
+    Accepts multipliers ("1.2"), relative percentages ("+10%", "-20%") and
+    SSML keywords ("slow", "x-fast").
+
+    Args:
+        value: Rate value
+
+    Returns:
+        Rate multiplier (1.0 is normal speed)
+    """
+    text = str(value).strip().lower()
+    if text in _RATE_KEYWORDS:
+        return _RATE_KEYWORDS[text]
+
+    try:
+        if text.endswith("%"):
+            return max(0.0, 1.0 + float(text[:-1]) / 100.0)
+        return float(text)
+    except ValueError:
+        return 1.0
+
+
+def parse_break(attributes: dict) -> float:
+    """Get the pause length of a <break> element.
+
+    Args:
+        attributes: Element attributes (``time`` and/or ``strength``)
+
+    Returns:
+        Pause length in seconds; a malformed ``time`` is ignored
+    """
+    time_value = attributes.get("time", "").strip().lower()
+    try:
+        if time_value.endswith("ms"):
+            return float(time_value[:-2]) / 1000.0
+        if time_value.endswith("s"):
+            return float(time_value[:-1])
+    except ValueError:
+        # Malformed times (reported by validate_ssml) fall back to the strength
+        pass
+
+    return _BREAK_STRENGTHS.get(attributes.get("strength", "medium"), 0.75)
+
+
+def local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag.
+
+    Args:
+        tag: Element tag, e.g. "{http://www.w3.org/2001/10/synthesis}voice"
+
+    Returns:
+        Local element name, e.g. "voice"
+    """
+    return tag.rsplit("}", 1)[-1]
+
+
+class SSMLValidationError(ValueError):
+    """SSML that the service would reject, detected before dispatch."""
+
+    def __init__(self, issues: list[str]):
+        """Initialize the error.
+
+        Args:
+            issues: Problems found in the document
+        """
+        self.issues = issues
+        super().__init__("Invalid SSML:\n" + "\n".join(f"  - {issue}" for issue in issues))
+
+
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+_NUMBER = r"\d+(?:\.\d+)?"
+_PROSODY_VALUES = {
+    "rate": re.compile(rf"^(x-slow|slow|medium|fast|x-fast|default|{_NUMBER}|[+-]?{_NUMBER}%)$"),
+    "pitch": re.compile(rf"^(x-low|low|medium|high|x-high|default|[+-]?{_NUMBER}(Hz|st|%))$"),
+    "volume": re.compile(rf"^(silent|x-soft|soft|medium|loud|x-loud|default|[+-]?{_NUMBER}(%|dB)?)$"),
+}
+_BREAK_TIME = re.compile(rf"^{_NUMBER}(ms|s)$")
+
+# Longest pause the service accepts in a single <break>
+MAX_BREAK_SECONDS = 20.0
+
+
+def _find_option(options: list[str], value: str) -> bool:
+    """Case-insensitive membership test for styles, roles and locales."""
+    return value.lower() in (option.lower() for option in options)
+
+
+def validate_ssml(ssml: str, catalog: Optional[VoiceCatalog] = None) -> list[str]:
+    """Check an SSML document locally, without any network call.
+
+    Checks well-formedness and the elements this project generates
+    (``speak``, ``voice``, ``mstts:express-as``, ``prosody``, ``break`` and
+    ``lang``). With a voice catalog, voice names, styles, roles and ``lang``
+    locales are also checked against the capabilities of the enclosing voice;
+    roles and secondary locales the catalog has no data for are not checked.
+
+    Args:
+        ssml: SSML document
+        catalog: Cached voice catalog (None: skip capability checks)
+
+    Returns:
+        List of problems found (empty if the document looks valid)
+    """
+    try:
+        root = ET.fromstring(ssml.strip().encode("utf-8"))
+    except ET.ParseError as e:
+        return [f"malformed XML: {e}"]
+
+    issues = []
+    if local_name(root.tag) != "speak":
+        return [f"root element must be <speak>, found <{local_name(root.tag)}>"]
+    if "version" not in root.attrib:
+        issues.append("<speak> is missing the version attribute")
+    if _XML_LANG not in root.attrib:
+        issues.append("<speak> is missing the xml:lang attribute")
+
+    def check_voice(element: ET.Element) -> Optional[dict]:
+        name = element.attrib.get("name", "").strip()
+        if not name:
+            issues.append("<voice> is missing the name attribute")
+            return None
+        if catalog is None or "(" in name:
+            # Long-form names ("Microsoft Server Speech ... (en-US, JennyNeural)") are not indexed
+            return None
+        info = catalog.get(name)
+        if info is None:
+            issues.append(f"unknown voice '{name}'")
+        return info
+
+    def check_express_as(element: ET.Element, voice: Optional[dict]) -> None:
+        style = element.attrib.get("style")
+        role = element.attrib.get("role")
+        if not style and not role:
+            issues.append("<mstts:express-as> needs a style or role attribute")
+
+        degree = element.attrib.get("styledegree")
+        if degree is not None:
+            try:
+                valid = 0.01 <= float(degree) <= 2.0
+            except ValueError:
+                valid = False
+            if not valid:
+                issues.append(f"styledegree '{degree}' must be between 0.01 and 2")
+
+        if voice is None:
+            return
+        if style and not _find_option(voice["styles"], style):
+            supported = ", ".join(voice["styles"]) or "none"
+            issues.append(f"voice '{voice['short_name']}' does not support style '{style}' (supported: {supported})")
+        if role and voice.get("roles") is not None and not _find_option(voice["roles"], role):
+            supported = ", ".join(voice["roles"]) or "none"
+            issues.append(f"voice '{voice['short_name']}' does not support role '{role}' (supported: {supported})")
+
+    def check_lang(element: ET.Element, voice: Optional[dict]) -> None:
+        locale = element.attrib.get(_XML_LANG)
+        if not locale:
+            issues.append("<lang> is missing the xml:lang attribute")
+            return
+        if voice is None or voice.get("secondary_locales") is None:
+            # Unknown secondary locales: the voice may well speak this one
+            return
+        locales = [voice["locale"], *voice["secondary_locales"]]
+        if not _find_option(locales, locale):
+            issues.append(f"voice '{voice['short_name']}' cannot speak locale '{locale}'")
+
+    def check_prosody(element: ET.Element) -> None:
+        for attribute, pattern in _PROSODY_VALUES.items():
+            value = element.attrib.get(attribute)
+            if value is not None and not pattern.match(value.strip()):
+                issues.append(f"<prosody> has an invalid {attribute} '{value}'")
+
+    def check_break(element: ET.Element) -> None:
+        time_value = element.attrib.get("time")
+        if time_value is not None:
+            if not _BREAK_TIME.match(time_value.strip().lower()):
+                issues.append(f"<break> has an invalid time '{time_value}'")
+            elif parse_break(element.attrib) > MAX_BREAK_SECONDS:
+                issues.append(f"<break> time '{time_value}' exceeds {MAX_BREAK_SECONDS:g}s")
+        strength = element.attrib.get("strength")
+        if strength is not None and strength not in _BREAK_STRENGTHS:
+            issues.append(f"<break> has an invalid strength '{strength}'")
+
+    def walk(element: ET.Element, in_voice: bool, voice: Optional[dict]) -> None:
+        name = local_name(element.tag)
+        if name == "voice":
+            if in_voice:
+                issues.append("<voice> elements cannot be nested")
+            in_voice = True
+            voice = check_voice(element)
+        elif name in ("express-as", "lang") and not in_voice:
+            issues.append(f"<{name}> must be inside a <voice> element")
+        elif name == "express-as":
+            check_express_as(element, voice)
+        elif name == "lang":
+            check_lang(element, voice)
+        elif name == "prosody":
+            check_prosody(element)
+        elif name == "break":
+            check_break(element)
+
+        if not in_voice and element.text and element.text.strip():
+            issues.append(f"text outside a <voice> element: '{element.text.strip()[:30]}'")
+        for child in element:
+            walk(child, in_voice, voice)
+            if not in_voice and child.tail and child.tail.strip():
+                issues.append(f"text outside a <voice> element: '{child.tail.strip()[:30]}'")
+
+    walk(root, False, None)
+    return issues
@@ -0,0 +1,146 @@
+"""Plain-text segmentation helpers (sentence and clause boundaries, spans).
+
+The ``*_spans`` functions return ``(start, end)`` offsets into the input, so
+callers can map positions inside a piece (e.g. word timings) back to the
+source text; the list-of-strings helpers are the matching slices.
+"""
+
+import re
+from typing import Optional
+
+
+# Sentence end: terminator (plus closing quotes/brackets) followed by whitespace,
+# or a CJK full-width terminator, which is not followed by spaces
+SENTENCE_END = re.compile(r'[.!?…]["\')\]]*\s+|[。！？]')
+
+# Clause end inside a sentence: separator followed by whitespace, or a CJK separator
+CLAUSE_END = re.compile(r'[,;:—]\s+|[，、；：]')
+
+Span = tuple[int, int]
+
+
+def _strip_span(text: str, start: int, end: int) -> Span:
+    """Shrink a span to exclude leading and trailing whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _split_spans(pattern: re.Pattern, text: str, start: int = 0, end: Optional[int] = None) -> list[Span]:
+    """Split ``text[start:end]`` after each boundary match into non-empty stripped spans."""
+    end = len(text) if end is None else end
+    spans = []
+    position = 0
+    for match in pattern.finditer(text[start:end]):
+        spans.append(_strip_span(text, start + position, start + match.end()))
+        position = match.end()
+    spans.append(_strip_span(text, start + position, end))
+    return [(low, high) for low, high in spans if high > low]
+
+
+def sentence_spans(text: str) -> list[Span]:
+    """Find the sentences of plain text.
+
+    Args:
+        text: Plain text
+
+    Returns:
+        List of (start, end) offsets of non-empty sentences, including their
+        terminating punctuation
+    """
+    return _split_spans(SENTENCE_END, text)
+
+
+def clause_spans(text: str, start: int = 0, end: Optional[int] = None) -> list[Span]:
+    """Find the clauses of a sentence at commas, semicolons, colons and dashes.
+
+    Args:
+        text: Text containing the sentence
+        start: Offset of the sentence in ``text``
+        end: End offset of the sentence (default: end of ``text``)
+
+    Returns:
+        List of (start, end) offsets into ``text`` of non-empty clauses, with
+        their trailing punctuation
+    """
+    return _split_spans(CLAUSE_END, text, start, end)
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split plain text into sentences.
+
+    Args:
+        text: Plain text
+
+    Returns:
+        List of non-empty sentences with their terminating punctuation
+    """
+    return [text[start:end] for start, end in sentence_spans(text)]
+
+
+def split_clauses(sentence: str) -> list[str]:
+    """Split a sentence into clauses at commas, semicolons, colons and dashes.
+
+    Args:
+        sentence: A single sentence
+
+    Returns:
+        List of non-empty clauses with their trailing punctuation
+    """
+    return [sentence[start:end] for start, end in clause_spans(sentence)]
+
+
+def chunk_spans(text: str, max_chars: int) -> list[Span]:
+    """Pack sentences into chunks of at most ``max_chars`` characters.
+
+    Sentences longer than the limit are split at clause boundaries and, as a
+    last resort, at word boundaries.
+
+    Args:
+        text: Plain text
+        max_chars: Maximum chunk length
+
+    Returns:
+        List of (start, end) offsets of the chunks in order
+    """
+    pieces = []
+    for sentence in sentence_spans(text):
+        if sentence[1] - sentence[0] <= max_chars:
+            pieces.append(sentence)
+            continue
+        for start, end in clause_spans(text, *sentence):
+            while end - start > max_chars:
+                cut = text.rfind(" ", start, start + max_chars + 1)
+                cut = cut if cut > start else start + max_chars
+                pieces.append(_strip_span(text, start, cut))
+                start = _strip_span(text, cut, end)[0]
+            if end > start:
+                pieces.append((start, end))
+
+    chunks = []
+    current: Optional[Span] = None
+    for start, end in pieces:
+        if current and end - current[0] > max_chars:
+            chunks.append(current)
+            current = (start, end)
+        else:
+            current = (current[0], end) if current else (start, end)
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def chunk_text(text: str, max_chars: int) -> list[str]:
+    """Pack sentences into chunks of at most ``max_chars`` characters.
+
+    Args:
+        text: Plain text
+        max_chars: Maximum chunk length
+
+    Returns:
+        List of chunks in order (slices of ``text``, see ``chunk_spans``)
+    """
+    return [text[start:end] for start, end in chunk_spans(text, max_chars)]
@@ -0,0 +1,210 @@
+"""Word-level timing captured from Azure AI Speech boundary events.
+
+The Speech SDK reports word, punctuation and sentence boundaries (plus
+bookmarks and visemes) while it synthesizes. ``WordTimeline`` keeps them as
+compact parallel arrays of (text offset, audio offset, duration) so captions
+and jump-to-word indexes come for free instead of from a separate alignment
+pass. Timelines of separately rendered chunks are merged with ``extend``,
+which shifts times (and text offsets) to the chunk's place in the output.
+"""
+
+import json
+from array import array
+from pathlib import Path
+from typing import Optional
+
+
+# Boundary kinds, stored as one character per entry
+WORD = "w"
+PUNCTUATION = "p"
+SENTENCE = "s"
+
+# Caption cue limits for WebVTT output
+MAX_CUE_CHARS = 84
+MAX_CUE_SECONDS = 6.0
+
+
+def timings_path(audio_path: Path, extension: str) -> Path:
+    """Get a timing sidecar path, e.g. ``clip.mp3`` -> ``clip.mp3.words.json``."""
+    return audio_path.with_name(f"{audio_path.name}.{extension}")
+
+
+def _format_timestamp(milliseconds: int) -> str:
+    """Format milliseconds as a WebVTT timestamp (HH:MM:SS.mmm)."""
+    seconds, ms = divmod(milliseconds, 1000)
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
+
+
+class WordTimeline:
+    """Boundaries of one clip: text offset, audio offset and duration per word.
+
+    Audio offsets and durations are stored in milliseconds; text offsets are
+    character positions in the synthesized text.
+    """
+
+    def __init__(self):
+        """Initialize an empty timeline."""
+        self.text_offsets = array("I")
+        self.text_lengths = array("I")
+        self.audio_offsets = array("I")
+        self.durations = array("I")
+        self.kinds: list[str] = []
+        self.words: list[str] = []
+        self.bookmarks: list[tuple[int, str]] = []
+        self.visemes: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def add_boundary(
+        self,
+        text: str,
+        text_offset: int,
+        audio_offset: float,
+        duration: float,
+        kind: str = WORD
+    ) -> None:
+        """Record a boundary event.
+
+        Args:
+            text: Word or punctuation text
+            text_offset: Character offset of the text in the input
+            audio_offset: Start of the word in the audio, in seconds
+            duration: Spoken duration in seconds
+            kind: WORD, PUNCTUATION or SENTENCE
+        """
+        self.text_offsets.append(max(text_offset, 0))
+        self.text_lengths.append(len(text))
+        self.audio_offsets.append(round(audio_offset * 1000))
+        self.durations.append(round(duration * 1000))
+        self.kinds.append(kind)
+        self.words.append(text)
+
+    def add_bookmark(self, name: str, audio_offset: float) -> None:
+        """Record a ``<bookmark mark="...">`` reached at an audio offset in seconds."""
+        self.bookmarks.append((round(audio_offset * 1000), name))
+
+    def add_viseme(self, viseme_id: int, audio_offset: float) -> None:
+        """Record a viseme starting at an audio offset in seconds."""
+        self.visemes.append((round(audio_offset * 1000), viseme_id))
+
+    def extend(self, other: "WordTimeline", time_offset: float = 0.0, text_offset: int = 0) -> None:
+        """Append the timeline of a following chunk.
+
+        Args:
+            other: Timeline of the chunk
+            time_offset: Start of the chunk in the stitched audio, in seconds
+            text_offset: Start of the chunk's text in the full input
+        """
+        shift = round(time_offset * 1000)
+        self.text_offsets.extend(offset + text_offset for offset in other.text_offsets)
+        self.text_lengths.extend(other.text_lengths)
+        self.audio_offsets.extend(offset + shift for offset in other.audio_offsets)
+        self.durations.extend(other.durations)
+        self.kinds.extend(other.kinds)
+        self.words.extend(other.words)
+        self.bookmarks.extend((offset + shift, name) for offset, name in other.bookmarks)
+        self.visemes.extend((offset + shift, viseme_id) for offset, viseme_id in other.visemes)
+
+    def to_dict(self) -> dict:
+        """Convert to a column-oriented, JSON-serializable dictionary."""
+        return {
+            "version": 1,
+            "words": {
+                "text": self.words,
+                "kind": "".join(self.kinds),
+                "text_offset": self.text_offsets.tolist(),
+                "text_length": self.text_lengths.tolist(),
+                "audio_offset_ms": self.audio_offsets.tolist(),
+                "duration_ms": self.durations.tolist(),
+            },
+            "bookmarks": [[offset, name] for offset, name in self.bookmarks],
+            "visemes": [[offset, viseme_id] for offset, viseme_id in self.visemes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WordTimeline":
+        """Rebuild a timeline from ``to_dict`` output."""
+        timeline = cls()
+        words = data.get("words", {})
+        timeline.words = list(words.get("text", []))
+        timeline.kinds = list(words.get("kind", ""))
+        timeline.text_offsets = array("I", words.get("text_offset", []))
+        timeline.text_lengths = array("I", words.get("text_length", []))
+        timeline.audio_offsets = array("I", words.get("audio_offset_ms", []))
+        timeline.durations = array("I", words.get("duration_ms", []))
+        timeline.bookmarks = [(offset, name) for offset, name in data.get("bookmarks", [])]
+        timeline.visemes = [(offset, viseme_id) for offset, viseme_id in data.get("visemes", [])]
+        return timeline
+
+    def to_webvtt(self) -> str:
+        """Render the words as WebVTT captions.
+
+        Cues end at sentence ends, or when they grow past
+        ``MAX_CUE_CHARS`` / ``MAX_CUE_SECONDS``.
+
+        Returns:
+            WebVTT document
+        """
+        cues: list[tuple[int, int, str]] = []
+        text = ""
+        start: Optional[int] = None
+        end = 0
+
+        def close_cue() -> None:
+            nonlocal text, start
+            if text.strip():
+                cues.append((start, end, text.strip()))
+            text, start = "", None
+
+        for word, kind, offset, duration in zip(self.words, self.kinds, self.audio_offsets, self.durations):
+            if kind == SENTENCE:
+                # Sentence boundaries span the whole sentence; words carry the text
+                continue
+            if kind == WORD and start is not None and (
+                len(text) + len(word) > MAX_CUE_CHARS or offset + duration - start > MAX_CUE_SECONDS * 1000
+            ):
+                close_cue()
+
+            if start is None:
+                start = offset
+            text += word if kind == PUNCTUATION or not text else f" {word}"
+            end = max(end, offset + duration)
+
+            if kind == PUNCTUATION and word.strip() in (".", "!", "?", "。", "！", "？", "…"):
+                close_cue()
+        close_cue()
+
+        lines = ["WEBVTT", ""]
+        for index, (cue_start, cue_end, cue_text) in enumerate(cues, 1):
+            lines.append(str(index))
+            lines.append(f"{_format_timestamp(cue_start)} --> {_format_timestamp(cue_end)}")
+            lines.append(cue_text)
+            lines.append("")
+        return "\n".join(lines)
+
+    def write(self, audio_path: Path) -> list[Path]:
+        """Write ``<file>.words.json`` and ``<file>.vtt`` next to an audio file.
+
+        Args:
+            audio_path: Audio file the timeline belongs to
+
+        Returns:
+            Paths of the written sidecars
+        """
+        json_path = timings_path(audio_path, "words.json")
+        json_path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+        vtt_path = timings_path(audio_path, "vtt")
+        vtt_path.write_text(self.to_webvtt(), encoding="utf-8")
+
+        return [json_path, vtt_path]
+
+    @classmethod
+    def load(cls, path: Path) -> "WordTimeline":
+        """Load a timeline from an audio file's ``.words.json`` sidecar (or the sidecar itself)."""
+        if not path.name.endswith(".words.json"):
+            path = timings_path(path, "words.json")
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
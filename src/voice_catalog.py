@@ -0,0 +1,126 @@
+"""Locally cached catalog of Azure AI Speech voice capabilities.
+
+The catalog stores what ``AzureSpeechProvider.get_voice_info`` reports for
+every voice (locale, styles, roles, secondary locales) so SSML can be checked
+against voice capabilities without a network call. Refresh it with
+``python main.py voice-catalog``.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+
+class VoiceCatalog:
+    """Voice capabilities indexed by short voice name (case-insensitive)."""
+
+    # Process-wide catalogs by path, with the file mtime they were loaded at
+    _shared: dict[Path, tuple[float, "VoiceCatalog"]] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, voices: dict[str, dict], fetched_at: Optional[str] = None):
+        """Initialize the catalog.
+
+        Args:
+            voices: Mapping of short voice name to voice info
+            fetched_at: ISO timestamp of the voice list the catalog was built from
+        """
+        self.voices = {name.lower(): info for name, info in voices.items()}
+        self.fetched_at = fetched_at
+
+    @classmethod
+    def from_voice_info(cls, voice_infos: list[dict]) -> "VoiceCatalog":
+        """Build a catalog from ``get_voice_info``-style dictionaries.
+
+        Args:
+            voice_infos: Voice info dictionaries; missing ``roles`` and
+                ``secondary_locales`` are stored as None (unknown)
+
+        Returns:
+            Catalog stamped with the current time
+        """
+        voices = {}
+        for info in voice_infos:
+            # None (not reported) is kept apart from an empty list (none supported)
+            roles = info.get("roles")
+            secondary_locales = info.get("secondary_locales")
+            voices[info["short_name"]] = {
+                "short_name": info["short_name"],
+                "locale": info["locale"],
+                "styles": [style for style in info.get("styles", []) if style and style.strip()],
+                "roles": None if roles is None else [role for role in roles if role and role.strip()],
+                "secondary_locales": None if secondary_locales is None else list(secondary_locales),
+            }
+        return cls(voices, datetime.now(timezone.utc).isoformat(timespec="seconds"))
+
+    @classmethod
+    def load(cls, path: Path) -> "VoiceCatalog":
+        """Load a cached catalog.
+
+        Args:
+            path: Path of the catalog JSON file
+
+        Returns:
+            Loaded catalog
+
+        Raises:
+            FileNotFoundError: If the cache does not exist
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(data.get("voices", {}), data.get("fetched_at"))
+
+    @classmethod
+    def shared(cls, path: Path) -> Optional["VoiceCatalog"]:
+        """Get the process-wide catalog cached at a path.
+
+        The file is parsed once and reloaded only when it changes on disk.
+
+        Args:
+            path: Path of the catalog JSON file
+
+        Returns:
+            Shared catalog, or None if no catalog has been cached yet
+        """
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        with cls._shared_lock:
+            cached = cls._shared.get(path)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, cls.load(path))
+                cls._shared[path] = cached
+            return cached[1]
+
+    def save(self, path: Path) -> None:
+        """Atomically write the catalog to disk.
+
+        Args:
+            path: Path of the catalog JSON file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"fetched_at": self.fetched_at, "voices": self.voices}
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def get(self, voice_name: str) -> Optional[dict]:
+        """Get the capabilities of a voice.
+
+        Args:
+            voice_name: Short voice name, e.g. "en-US-JennyNeural"
+
+        Returns:
+            Voice info, or None if the voice is not in the catalog
+        """
+        return self.voices.get(voice_name.lower())
+
+    def __contains__(self, voice_name: str) -> bool:
+        return voice_name.lower() in self.voices
+
+    def __len__(self) -> int:
+        return len(self.voices)
@@ -0,0 +1,110 @@
+"""Tests for packed prompt bundles."""
+
+from pathlib import Path
+from typing import Optional
+
+from src.bundle import ARCHIVE_MAGIC, BundleBuilder, PromptBundle, index_path_for, read_index, write_index
+from src.providers.base import TTSProvider
+
+
+class EchoProvider(TTSProvider):
+    """Provider whose audio is "<voice>:<text>", recording every text it renders."""
+
+    def __init__(self, rendered: list, default_voice: str):
+        super().__init__({})
+        self.rendered = rendered
+        self.default_voice = default_voice
+
+    def synthesize(self, text: str, output_path: Optional[Path] = None, voice: Optional[str] = None, **kwargs) -> Path:
+        self.rendered.append(text)
+        output_path.write_bytes(f"{voice or self.default_voice}:{text}".encode())
+        return output_path
+
+    def get_available_voices(self) -> list[str]:
+        return [self.default_voice]
+
+    @property
+    def provider_name(self) -> str:
+        return "echo"
+
+
+def prompt(text: str, voice: Optional[str] = None) -> dict:
+    return {"text": text, "provider": "echo", "deployment": None, "voice": voice, "params": {}}
+
+
+def build(bundle_path: Path, catalog: dict, rendered: list, default_voice: str = "alice", compact: bool = False) -> dict:
+    builder = BundleBuilder(
+        bundle_path, audio_format="mp3",
+        provider_factory=lambda provider, deployment: EchoProvider(rendered, default_voice)
+    )
+    return builder.build(catalog, compact=compact)
+
+
+def contents(bundle_path: Path) -> dict[str, bytes]:
+    with PromptBundle(bundle_path) as bundle:
+        return {prompt_id: bytes(bundle.get(prompt_id)) for prompt_id in bundle}
+
+
+def test_index_round_trip(tmp_path):
+    index_path = tmp_path / "prompts.bundle.idx"
+    entries = {"greeting": (8, 12, b"a" * 16), "café": (20, 3, b"b" * 16)}
+
+    write_index(index_path, "wav", entries)
+
+    assert read_index(index_path) == ("wav", entries)
+
+
+def test_build_and_read_bundle(tmp_path):
+    bundle_path = tmp_path / "prompts.bundle"
+    rendered: list[str] = []
+
+    counts = build(bundle_path, {"hello": prompt("Hello"), "bye": prompt("Goodbye", "bob")}, rendered)
+
+    assert counts == {"rendered": 2, "reused": 0, "removed": 0}
+    assert contents(bundle_path) == {"hello": b"alice:Hello", "bye": b"bob:Goodbye"}
+    assert bundle_path.read_bytes().startswith(ARCHIVE_MAGIC)
+    assert list(read_index(index_path_for(bundle_path))[1]) == ["hello", "bye"]
+
+
+def test_rebuild_reuses_unchanged_prompts_and_appends_changed_ones(tmp_path):
+    bundle_path = tmp_path / "prompts.bundle"
+    rendered: list[str] = []
+    build(bundle_path, {"a": prompt("One"), "b": prompt("Two"), "c": prompt("Three")}, rendered)
+    size = bundle_path.stat().st_size
+
+    rendered.clear()
+    counts = build(bundle_path, {"a": prompt("One"), "b": prompt("Two, again"), "d": prompt("Four")}, rendered)
+
+    assert counts == {"rendered": 2, "reused": 1, "removed": 1}
+    assert sorted(rendered) == ["Four", "Two, again"]
+    assert bundle_path.stat().st_size == size + len(b"alice:Two, again") + len(b"alice:Four")
+    assert contents(bundle_path) == {"a": b"alice:One", "b": b"alice:Two, again", "d": b"alice:Four"}
+
+
+def test_compact_drops_stale_clips(tmp_path):
+    bundle_path = tmp_path / "prompts.bundle"
+    rendered: list[str] = []
+    build(bundle_path, {"a": prompt("One"), "b": prompt("Two")}, rendered)
+    build(bundle_path, {"a": prompt("One"), "b": prompt("Two, again")}, rendered)
+
+    rendered.clear()
+    counts = build(bundle_path, {"a": prompt("One"), "b": prompt("Two, again")}, rendered, compact=True)
+
+    assert counts == {"rendered": 0, "reused": 2, "removed": 0}
+    assert rendered == []
+    assert bundle_path.read_bytes() == ARCHIVE_MAGIC + b"alice:One" + b"alice:Two, again"
+    assert contents(bundle_path) == {"a": b"alice:One", "b": b"alice:Two, again"}
+
+
+def test_default_voice_change_rerenders_prompts_without_a_voice(tmp_path):
+    bundle_path = tmp_path / "prompts.bundle"
+    rendered: list[str] = []
+    catalog = {"plain": prompt("Hello"), "fixed": prompt("Hi", "bob")}
+    build(bundle_path, catalog, rendered, default_voice="alice")
+
+    rendered.clear()
+    counts = build(bundle_path, catalog, rendered, default_voice="carol")
+
+    assert counts == {"rendered": 1, "reused": 1, "removed": 0}
+    assert rendered == ["Hello"]
+    assert contents(bundle_path) == {"plain": b"carol:Hello", "fixed": b"bob:Hi"}
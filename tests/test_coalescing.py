@@ -0,0 +1,196 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.cancellation import CancellationToken, SynthesisCancelled, SynthesisTimeout
+from src.coalescing import CoalescingProvider, SingleFlight
+from src.providers.base import TTSProvider
+from src.seek_index import sidecar_path
+
+
+class TimedProvider(TTSProvider):
+    """Provider that writes ``text`` as audio after ``delay`` seconds unless cancelled."""
+
+    def __init__(self, output_dir: Path, delay: float = 0.3):
+        super().__init__({"output_dir": str(output_dir)})
+        self.output_dir = output_dir
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = threading.Event()
+
+    def synthesize(self, text: str, output_path: Optional[Path] = None, voice: Optional[str] = None, **kwargs) -> Path:
+        self.calls += 1
+        token = CancellationToken.from_kwargs(kwargs)
+        try:
+            end = time.monotonic() + self.delay
+            while time.monotonic() < end:
+                if token.cancelled or token.expired:
+                    self.cancelled.set()
+                    token.raise_if_cancelled()
+                time.sleep(0.01)
+        finally:
+            token.release()
+
+        output_path = output_path or Path(f"leader_{self.calls}.mp3")
+        if not output_path.is_absolute():
+            output_path = self.output_dir / output_path
+        output_path.write_bytes(text.encode())
+        if kwargs.get("seek_index"):
+            sidecar_path(output_path).write_bytes(b"index")
+        return output_path
+
+    def get_available_voices(self) -> list[str]:
+        return ["default"]
+
+    @property
+    def provider_name(self) -> str:
+        return "timed"
+
+
+def test_leader_cancellation_does_not_fail_followers(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path), SingleFlight())
+    leader_token = CancellationToken()
+    follower_token = CancellationToken(timeout=5)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(provider.synthesize, "hello", Path("a.mp3"), cancel_token=leader_token)
+        time.sleep(0.05)
+        follower = executor.submit(provider.synthesize, "hello", Path("b.mp3"), cancel_token=follower_token)
+        time.sleep(0.05)
+        leader_token.cancel()
+
+        with pytest.raises(SynthesisCancelled):
+            leader.result()
+        path = follower.result()
+
+    assert path == tmp_path / "b.mp3"
+    assert path.read_bytes() == b"hello"
+    assert provider.provider.calls == 1
+    assert not provider.provider.cancelled.is_set()
+
+
+def test_short_leader_deadline_does_not_fail_followers(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path), SingleFlight())
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(provider.synthesize, "hello", Path("a.mp3"), timeout=0.1)
+        time.sleep(0.05)
+        follower = executor.submit(provider.synthesize, "hello", Path("b.mp3"), timeout=5)
+
+        with pytest.raises(SynthesisTimeout):
+            leader.result()
+        assert follower.result().read_bytes() == b"hello"
+
+
+def test_upstream_cancelled_when_every_waiter_leaves(tmp_path):
+    single_flight = SingleFlight()
+    provider = CoalescingProvider(TimedProvider(tmp_path, delay=2.0), single_flight)
+    tokens = [CancellationToken(), CancellationToken()]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(provider.synthesize, "hello", Path(f"{index}.mp3"), cancel_token=token)
+            for index, token in enumerate(tokens)
+        ]
+        time.sleep(0.05)
+        tokens[0].cancel()
+        time.sleep(0.05)
+        assert not provider.provider.cancelled.is_set()
+        tokens[1].cancel()
+
+        for future in futures:
+            with pytest.raises(SynthesisCancelled):
+                future.result()
+
+    assert provider.provider.cancelled.wait(1)
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_followers_get_their_own_file_when_leader_deletes_its_copy(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path, delay=0.1), SingleFlight())
+
+    def leader() -> Path:
+        path = provider.synthesize("hello", Path("leader.mp3"))
+        path.unlink()
+        return path
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        leading = executor.submit(leader)
+        time.sleep(0.02)
+        followers = [executor.submit(provider.synthesize, "hello") for _ in range(2)]
+        leading.result()
+        paths = [future.result() for future in followers]
+
+    assert len(set(paths)) == 2
+    assert all(path.read_bytes() == b"hello" for path in paths)
+
+
+def test_cancelled_leader_leaves_no_file(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path), SingleFlight())
+    leader_token = CancellationToken()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(provider.synthesize, "hello", Path("a.mp3"), cancel_token=leader_token)
+        time.sleep(0.05)
+        follower = executor.submit(provider.synthesize, "hello", Path("b.mp3"))
+        time.sleep(0.05)
+        leader_token.cancel()
+
+        with pytest.raises(SynthesisCancelled):
+            leader.result()
+        follower.result()
+
+    assert not (tmp_path / "a.mp3").exists()
+
+
+def test_each_waiter_gets_the_sidecar_it_asked_for(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path, delay=0.1), SingleFlight())
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        plain = executor.submit(provider.synthesize, "hello", Path("plain.mp3"))
+        time.sleep(0.02)
+        indexed = executor.submit(provider.synthesize, "hello", Path("indexed.mp3"), seek_index=True)
+        plain_path, indexed_path = plain.result(), indexed.result()
+
+    assert provider.single_flight.stats()["upstream"] == 1
+    assert not sidecar_path(plain_path).exists()
+    assert sidecar_path(indexed_path).read_bytes() == b"index"
+
+
+def test_async_waiters_do_not_hold_executor_threads(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path, delay=0.2), SingleFlight())
+
+    async def burst() -> list[Path]:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        waiters = [provider.asynthesize("hello", Path(f"{index}.mp3"), timeout=5) for index in range(20)]
+        # A different key must still get its upstream call while the burst waits
+        other = provider.asynthesize("other", Path("other.mp3"), timeout=1)
+        return await asyncio.gather(*waiters, other)
+
+    paths = asyncio.run(burst())
+
+    assert all(path.read_bytes() == b"hello" for path in paths[:-1])
+    assert paths[-1].read_bytes() == b"other"
+
+
+def test_async_waiter_times_out_alone(tmp_path):
+    provider = CoalescingProvider(TimedProvider(tmp_path, delay=0.3), SingleFlight())
+
+    async def run() -> tuple:
+        short = provider.asynthesize("hello", Path("a.mp3"), timeout=0.05)
+        patient = provider.asynthesize("hello", Path("b.mp3"), timeout=5)
+        return await asyncio.gather(short, patient, return_exceptions=True)
+
+    short, patient = asyncio.run(run())
+
+    assert isinstance(short, SynthesisTimeout)
+    assert patient.read_bytes() == b"hello"
+    assert not provider.provider.cancelled.is_set()
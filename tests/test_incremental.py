@@ -0,0 +1,149 @@
+"""Tests for incremental text input."""
+
+import asyncio
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import pytest
+
+from src.cancellation import CancellationToken, SynthesisTimeout
+from src.incremental import IncrementalSynthesizer
+from src.providers.base import TTSProvider
+
+
+class TextStreamProvider(TTSProvider):
+    """Provider that echoes streamed text, taking ``delay`` seconds per audio chunk."""
+
+    def __init__(self, delay: float = 0.0, timeout: Optional[float] = None):
+        super().__init__({})
+        self.delay = delay
+        self.timeout = timeout
+
+    def supports_text_stream(self) -> bool:
+        return True
+
+    def stream_text(self, fragments: Iterable[str], voice: Optional[str] = None, **kwargs) -> Iterator[bytes]:
+        token = CancellationToken.from_kwargs(kwargs, self.timeout)
+        chunks: queue.Queue = queue.Queue()
+        end = object()
+
+        def feed() -> None:
+            for fragment in fragments:
+                chunks.put(fragment.encode())
+            chunks.put(end)
+
+        threading.Thread(target=feed, daemon=True).start()
+        try:
+            while True:
+                token.raise_if_cancelled()
+                try:
+                    chunk = chunks.get(timeout=0.01)
+                except queue.Empty:
+                    continue
+                if chunk is end:
+                    return
+                time.sleep(self.delay)
+                yield chunk
+        finally:
+            token.release()
+
+    def synthesize(self, text: str, output_path: Optional[Path] = None, voice: Optional[str] = None, **kwargs) -> Path:
+        raise NotImplementedError
+
+    def get_available_voices(self) -> list[str]:
+        return ["default"]
+
+    @property
+    def provider_name(self) -> str:
+        return "text-stream"
+
+
+def slow_source(fragments: list[str], gap: float) -> Iterator[str]:
+    for fragment in fragments:
+        time.sleep(gap)
+        yield fragment
+
+
+FRAGMENTS = ["The first sentence is here. ", "The second sentence follows. ", "And the last one."]
+
+
+def test_text_stream_deadline_excludes_source_time():
+    synthesizer = IncrementalSynthesizer(TextStreamProvider(timeout=0.2))
+
+    audio = b"".join(synthesizer.stream(slow_source(FRAGMENTS, gap=0.15)))
+
+    assert audio == "".join(FRAGMENTS).encode()
+    assert synthesizer.stats.text_stream
+    assert synthesizer.stats.units == 3
+
+
+def test_text_stream_unit_past_its_deadline_times_out():
+    synthesizer = IncrementalSynthesizer(TextStreamProvider(delay=0.5))
+
+    with pytest.raises(SynthesisTimeout):
+        b"".join(synthesizer.stream(iter(FRAGMENTS), timeout=0.2))
+
+
+class FirstUnitOnlyProvider(TextStreamProvider):
+    """Provider that keeps sending audio for the first word until the input ends."""
+
+    def stream_text(self, fragments: Iterable[str], voice: Optional[str] = None, **kwargs) -> Iterator[bytes]:
+        token = CancellationToken.from_kwargs(kwargs, self.timeout)
+        ended = threading.Event()
+
+        def feed() -> None:
+            for _ in fragments:
+                pass
+            ended.set()
+
+        threading.Thread(target=feed, daemon=True).start()
+        kwargs["timeline"].add_boundary("The", 0, 0.0, 0.1)
+        try:
+            while not ended.is_set():
+                token.raise_if_cancelled()
+                time.sleep(0.05)
+                yield b"x"
+        finally:
+            token.release()
+
+
+def test_text_stream_audio_for_an_earlier_unit_does_not_meet_a_later_deadline():
+    def source() -> Iterator[str]:
+        yield FRAGMENTS[0]
+        yield FRAGMENTS[1]
+        time.sleep(1.0)
+        yield FRAGMENTS[2]
+
+    synthesizer = IncrementalSynthesizer(FirstUnitOnlyProvider())
+
+    started = time.monotonic()
+    with pytest.raises(SynthesisTimeout):
+        b"".join(synthesizer.stream(source(), timeout=0.3))
+    assert time.monotonic() - started < 0.9
+
+
+def test_astream_cancelled_while_a_chunk_is_pending_closes_cleanly():
+    async def source():
+        for fragment in FRAGMENTS:
+            yield fragment
+
+    async def consume(received: list) -> None:
+        async for chunk in synthesizer.astream(source()):
+            received.append(chunk)
+
+    async def main() -> list:
+        received: list = []
+        task = asyncio.ensure_future(consume(received))
+        while not received:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return received
+
+    synthesizer = IncrementalSynthesizer(TextStreamProvider(delay=0.2))
+
+    assert asyncio.run(main()) == [FRAGMENTS[0].encode()]
@@ -0,0 +1,54 @@
+"""Tests for per-sentence language detection."""
+
+from typing import Optional
+
+import pytest
+
+from src.language import LanguageRouter, detect_language
+
+
+@pytest.mark.parametrize("text, language", [
+    ("La casa de mi madre.", "es"),
+    ("Le livre de Marie.", "fr"),
+    ("Je vais à la plage avec mes amis.", "fr"),
+    ("El libro de María está en la mesa.", "es"),
+    ("Il libro di Maria è sul tavolo.", "it"),
+    ("Vado a casa di mio padre.", "it"),
+    ("O livro da Maria está na mesa.", "pt"),
+    ("Vou a casa de meu pai.", "pt"),
+    ("De kat zit op de mat.", "nl"),
+    ("Guten Tag, wie geht es Ihnen heute?", "de"),
+    ("The book of Mary is on the table.", "en"),
+])
+def test_shared_function_words_do_not_tie(text, language):
+    assert detect_language(text) == language
+
+
+def test_no_signal_returns_none():
+    assert detect_language("Maria Santos.") is None
+
+
+class _Provider:
+    """Stand-in exposing only the attributes the router reads."""
+
+    def __init__(self, language: str = "en-US", default_voice: Optional[str] = "en-US-JennyNeural"):
+        self.language = language
+        self.default_voice = default_voice
+
+
+def test_router_without_a_default_language_voice_is_rejected():
+    with pytest.raises(ValueError, match="'sv'"):
+        LanguageRouter(_Provider(language="sv-SE", default_voice=None))
+
+
+def test_voice_replaces_the_voice_of_its_own_language():
+    router = LanguageRouter(_Provider())
+    text = "The book of Mary is on the table. Le livre de Marie est sur la table."
+
+    segments = router.plan(text, "fr-FR-HenriNeural")
+
+    assert [(segment.language, segment.voice) for segment in segments] == [
+        ("en", "en-US-JennyNeural"),
+        ("fr", "fr-FR-HenriNeural"),
+    ]
+    assert router.plan(text, "en-GB-SoniaNeural")[0].voice == "en-GB-SoniaNeural"
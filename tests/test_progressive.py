@@ -0,0 +1,58 @@
+"""Tests for progressive synthesis segment planning and merged word timings."""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+from src.progressive import ProgressiveSynthesizer, plan_segment_spans
+from src.providers.base import TTSProvider
+from src.text import chunk_spans
+from src.timings import WordTimeline
+
+
+class WordProvider(TTSProvider):
+    """Provider that reports one boundary per word of the text it is given."""
+
+    def __init__(self, output_dir: Path):
+        super().__init__({"output_dir": str(output_dir)})
+        self.output_dir = output_dir
+
+    def synthesize(self, text: str, output_path: Optional[Path] = None, voice: Optional[str] = None, **kwargs) -> Path:
+        timeline = kwargs.get("timeline")
+        if timeline is not None:
+            for match in re.finditer(r"\S+", text):
+                timeline.add_boundary(match.group(), match.start(), 0.0, 0.0)
+        output_path.write_bytes(text.encode())
+        return output_path
+
+    def get_available_voices(self) -> list[str]:
+        return ["default"]
+
+    @property
+    def provider_name(self) -> str:
+        return "words"
+
+
+TEXT = "Again.\n\nAgain and again,  said the  echo.   Again.\tAgain!  " + "More words follow here. " * 6
+
+
+def test_segment_spans_are_source_slices():
+    spans = plan_segment_spans(TEXT, first_segment_chars=10, growth=2.0, max_segment_chars=60)
+
+    assert len(spans) > 2
+    assert all(TEXT[start:end] == TEXT[start:end].strip() for start, end in spans)
+    assert [start for start, _ in spans] == sorted(start for start, _ in spans)
+    assert all(end - start <= 60 for start, end in chunk_spans(TEXT, 60))
+
+
+def test_progressive_timeline_offsets_point_into_source(tmp_path):
+    synthesizer = ProgressiveSynthesizer(WordProvider(tmp_path), first_segment_chars=10, max_segment_chars=60)
+    timeline = WordTimeline()
+
+    segments = list(synthesizer.stream(TEXT, timeline=timeline))
+
+    assert len(segments) > 2
+    assert len(timeline) == len(TEXT.split())
+    for word, offset in zip(timeline.words, timeline.text_offsets):
+        assert TEXT[offset:offset + len(word)] == word
+    assert list(timeline.text_offsets) == [match.start() for match in re.finditer(r"\S+", TEXT)]
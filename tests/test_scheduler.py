@@ -0,0 +1,141 @@
+"""Tests for the priority-class scheduler."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.cancellation import CancellationToken
+from src.providers.base import TTSProvider
+from src.scheduler import SynthesisScheduler
+
+
+class RecordingProvider(TTSProvider):
+    """Provider that records the texts it starts; "block" waits for ``gate``, "fail" raises."""
+
+    def __init__(self, output_dir: Path, started: list, gate: threading.Event, cancelled: list):
+        super().__init__({"output_dir": str(output_dir)})
+        self.output_dir = output_dir
+        self.started = started
+        self.gate = gate
+        self.cancelled = cancelled
+
+    def synthesize(self, text: str, output_path: Optional[Path] = None, voice: Optional[str] = None, **kwargs) -> Path:
+        self.started.append(text)
+        token = CancellationToken.from_kwargs(kwargs)
+        try:
+            if text.startswith("block") and not token.wait_for(self.gate):
+                self.cancelled.append(text)
+                token.raise_if_cancelled()
+            if text == "fail":
+                raise RuntimeError("upstream failed")
+        finally:
+            token.release()
+
+        output_path = output_path or self.output_dir / f"{text}.mp3"
+        output_path.write_bytes(text.encode())
+        return output_path
+
+    def get_available_voices(self) -> list[str]:
+        return ["default"]
+
+    @property
+    def provider_name(self) -> str:
+        return "recording"
+
+
+@pytest.fixture
+def harness(tmp_path):
+    started: list[str] = []
+    cancelled: list[str] = []
+    gate = threading.Event()
+
+    def make(max_concurrency: int, reserved: dict) -> SynthesisScheduler:
+        return SynthesisScheduler(
+            max_concurrency, reserved,
+            lambda provider, deployment: RecordingProvider(tmp_path, started, gate, cancelled)
+        )
+
+    yield make, started, gate, cancelled
+    gate.set()
+
+
+def wait_until(predicate, timeout: float = 2.0) -> None:
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_higher_classes_run_first(harness):
+    make, started, gate, _ = harness
+    with make(1, {}) as scheduler:
+        blocker = scheduler.submit("block", priority="bulk")
+        wait_until(lambda: started == ["block"])
+        futures = [
+            scheduler.submit(text, priority=text)
+            for text in ("bulk", "standard", "interactive")
+        ]
+        gate.set()
+        for future in [blocker, *futures]:
+            future.result(timeout=2)
+
+    assert started == ["block", "interactive", "standard", "bulk"]
+
+
+def test_tenants_share_a_class_round_robin(harness):
+    make, started, gate, _ = harness
+    with make(1, {}) as scheduler:
+        blocker = scheduler.submit("block")
+        wait_until(lambda: started == ["block"])
+        futures = [scheduler.submit(f"a{index}", tenant="a") for index in range(3)]
+        futures.append(scheduler.submit("b0", tenant="b"))
+        gate.set()
+        for future in [blocker, *futures]:
+            future.result(timeout=2)
+
+    assert started == ["block", "a0", "b0", "a1", "a2"]
+
+
+def test_reserved_slot_stays_free_for_interactive(harness):
+    make, started, gate, _ = harness
+    with make(2, {"interactive": 1}) as scheduler:
+        bulk = [scheduler.submit(f"block{index}", priority="bulk") for index in range(3)]
+        wait_until(lambda: len(started) == 1)
+        time.sleep(0.05)
+        # Bulk work may only use the shared slot
+        assert started == ["block0"]
+
+        reply = scheduler.submit("hello", priority="interactive")
+        assert reply.result(timeout=1).read_bytes() == b"hello"
+        assert scheduler.metrics()["bulk"]["queue_depth"] == 2
+
+        gate.set()
+        for future in bulk:
+            future.result(timeout=2)
+
+
+def test_failed_chunk_cancels_queued_chunks(harness, tmp_path):
+    make, started, _, _ = harness
+    with make(1, {}) as scheduler:
+        job = scheduler.submit_chunked(["one", "fail", "three", "four"], tmp_path / "job.mp3")
+
+        with pytest.raises(RuntimeError, match="upstream failed"):
+            job.result(timeout=2)
+
+    assert started == ["one", "fail"]
+    assert not (tmp_path / "job.mp3").exists()
+    assert not list(tmp_path.glob("job.part*"))
+
+
+def test_failed_chunk_stops_running_siblings(harness, tmp_path):
+    make, started, _, cancelled = harness
+    with make(2, {}) as scheduler:
+        job = scheduler.submit_chunked(["block", "fail"], tmp_path / "job.mp3")
+
+        with pytest.raises(RuntimeError, match="upstream failed"):
+            job.result(timeout=2)
+
+    assert cancelled == ["block"]
@@ -0,0 +1,47 @@
+"""Tests for latency-aware Speech resource routing."""
+
+import threading
+
+from src.providers.speech_pool import SpeechResource, SpeechResourcePool
+
+
+def make_pool(count: int) -> SpeechResourcePool:
+    return SpeechResourcePool([SpeechResource(f"key{index}", f"region{index}") for index in range(count)])
+
+
+def test_cold_burst_spreads_across_resources():
+    pool = make_pool(4)
+    barrier = threading.Barrier(4)
+    acquired = []
+
+    def acquire() -> None:
+        barrier.wait()
+        acquired.append(pool.acquire())
+
+    threads = [threading.Thread(target=acquire) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(resource.name for resource in acquired) == [f"region{index}" for index in range(4)]
+
+
+def test_unmeasured_resources_are_probed_before_measured_ones():
+    pool = make_pool(2)
+    first = pool.acquire()
+    pool.release(first, first_byte_latency=0.05)
+
+    assert pool.acquire() is not first
+
+
+def test_measured_resources_rank_by_latency_and_load():
+    pool = make_pool(2)
+    fast, slow = pool.resources
+    for resource, latency in ((fast, 0.1), (slow, 0.25)):
+        pool.release(pool.acquire(exclude={r.name for r in pool.resources if r is not resource}), latency)
+
+    assert pool.acquire() is fast
+    assert pool.acquire() is fast
+    # fast: 0.1 * 3 in flight would exceed slow: 0.25 * 1
+    assert pool.acquire() is slow
@@ -0,0 +1,39 @@
+"""Tests for offline SSML validation against a voice catalog."""
+
+from pathlib import Path
+
+from src.ssml import validate_ssml
+from src.voice_catalog import VoiceCatalog
+
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "input" / "examples"
+
+
+def catalog(**fields) -> VoiceCatalog:
+    info = {"short_name": "en-US-AvaMultilingualNeural", "locale": "en-US", "styles": ["assistant", "friendly"]}
+    return VoiceCatalog.from_voice_info([{**info, **fields}])
+
+
+def test_unreported_roles_and_locales_are_not_checked():
+    ssml = (EXAMPLES / "multilingual.ssml").read_text(encoding="utf-8")
+
+    assert validate_ssml(ssml, catalog()) == []
+
+
+def test_reported_secondary_locales_are_checked():
+    ssml = (EXAMPLES / "multilingual.ssml").read_text(encoding="utf-8")
+
+    issues = validate_ssml(ssml, catalog(secondary_locales=["fr-FR", "es-ES", "de-DE"]))
+
+    assert issues == ["voice 'en-US-AvaMultilingualNeural' cannot speak locale 'it-IT'"]
+
+
+def test_unreported_roles_accept_any_role():
+    ssml = (
+        '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
+        'xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="en-US">'
+        '<voice name="en-US-AvaMultilingualNeural"><mstts:express-as role="Girl">Hi</mstts:express-as></voice></speak>'
+    )
+
+    assert validate_ssml(ssml, catalog()) == []
+    assert len(validate_ssml(ssml, catalog(roles=[]))) == 1